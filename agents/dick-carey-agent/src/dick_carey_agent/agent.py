@@ -13,6 +13,7 @@ Dick & Carey 모형의 10단계 프로세스를 LangGraph StateGraph로 구현
 """
 
 import os
+import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Any, Literal
@@ -26,18 +27,22 @@ from dick_carey_agent.state import (
     create_initial_state,
     map_to_addie_output,
 )
+from dick_carey_agent.tools import objective_assessment
 from dick_carey_agent.tools import (
     # 1-3단계
     set_instructional_goal,
     analyze_instruction,
     analyze_entry_behaviors,
     analyze_context,
+    analyze_goal_and_context_bundle,
     # 4-5단계
     write_performance_objectives,
     develop_assessment_instruments,
+    write_objectives_and_assessments,
     # 6-7단계
     develop_instructional_strategy,
     develop_instructional_materials,
+    develop_strategy_and_materials,
     # 8-10단계
     conduct_formative_evaluation,
     revise_instruction,
@@ -67,8 +72,9 @@ class DickCareyAgent:
         self.quality_threshold = quality_threshold
         self.debug = debug
 
-        # 환경 변수 설정
+        # 환경 변수 설정 (4-5단계 도구는 설정을 캐시하므로 다시 읽기)
         os.environ["DICK_CAREY_MODEL"] = model
+        objective_assessment.refresh_config()
 
         # StateGraph 빌드
         self.graph = self._build_graph()
@@ -144,6 +150,19 @@ class DickCareyAgent:
 
         return tool_call
 
+    @staticmethod
+    def _parse_class_size(raw_class_size: Any) -> int | None:
+        """class_size 파싱 (문자열인 경우 숫자 추출, 범위는 중간값)"""
+        if isinstance(raw_class_size, int):
+            return raw_class_size
+        if isinstance(raw_class_size, str):
+            numbers = re.findall(r'\d+', raw_class_size)
+            if len(numbers) >= 2:
+                return (int(numbers[0]) + int(numbers[1])) // 2
+            if numbers:
+                return int(numbers[0])
+        return None
+
     def _should_revise(self, state: DickCareyState) -> Literal["revision", "summative_evaluation"]:
         """형성평가 결과 기반 분기 결정 (최적화 #80)"""
         formative = state.get("formative_evaluation", {})
@@ -188,33 +207,64 @@ class DickCareyAgent:
 
         reasoning_steps.append("Step 1: 교수목적 설정 - 학습 종료 후 달성 목표 정의")
 
-        start_time = datetime.now()
-        try:
-            goal_result = set_instructional_goal.invoke({
+        # 1·3단계 통합 호출 (DICK_CAREY_FUSE_STEPS=1): 누락된 결과는 개별 도구로 보완
+        fused = {}
+        if os.getenv("DICK_CAREY_FUSE_STEPS", "0") == "1":
+            start_time = datetime.now()
+            fused = analyze_goal_and_context_bundle.invoke({
                 "learning_goals": scenario.get("learning_goals", []),
                 "target_audience": context.get("target_audience", "일반 학습자"),
+                "learning_environment": context.get("learning_environment", "미지정"),
+                "duration": context.get("duration", "미지정"),
                 "current_state": context.get("prior_knowledge"),
-                "desired_state": None,
+                "prior_knowledge": context.get("prior_knowledge"),
+                "performance_context": context.get("additional_context"),
+                "class_size": self._parse_class_size(context.get("class_size")),
+                "resources": scenario.get("constraints", {}).get("resources"),
             })
-            tool_calls.append(self._record_tool_call(
-                state, "set_instructional_goal",
-                {"learning_goals": scenario.get("learning_goals", [])},
-                f"교수목적 설정 완료: {goal_result.get('goal_statement', '')[:50]}...",
-                start_time,
-            ))
-        except Exception as e:
-            errors.append(f"set_instructional_goal 실패: {str(e)}")
-            goal_result = {}
+            if fused:
+                tool_calls.append(self._record_tool_call(
+                    state, "analyze_goal_and_context_bundle",
+                    {"learning_goals": scenario.get("learning_goals", [])},
+                    f"통합 분석 완료: {', '.join(fused)}",
+                    start_time,
+                ))
+
+        goal_result = fused.get("goal")
+        if goal_result is None:
+            start_time = datetime.now()
+            try:
+                goal_result = set_instructional_goal.invoke({
+                    "learning_goals": scenario.get("learning_goals", []),
+                    "target_audience": context.get("target_audience", "일반 학습자"),
+                    "current_state": context.get("prior_knowledge"),
+                    "desired_state": None,
+                })
+                tool_calls.append(self._record_tool_call(
+                    state, "set_instructional_goal",
+                    {"learning_goals": scenario.get("learning_goals", [])},
+                    f"교수목적 설정 완료: {goal_result.get('goal_statement', '')[:50]}...",
+                    start_time,
+                ))
+            except Exception as e:
+                errors.append(f"set_instructional_goal 실패: {str(e)}")
+                goal_result = {}
 
         self._log(f"1단계 완료: {goal_result.get('goal_statement', '')[:50]}...")
 
-        return {
+        result = {
             "goal": goal_result,
             "current_phase": "instructional_analysis",
             "tool_calls": tool_calls,
             "reasoning_steps": reasoning_steps,
             "errors": errors,
         }
+        if fused:
+            result["learner_context"] = {
+                "learner": fused.get("entry_behaviors", {}),
+                "context": fused.get("context", {}),
+            }
+        return result
 
     # ========== 2단계: 교수분석 ==========
     def _instructional_analysis_node(self, state: DickCareyState) -> dict:
@@ -268,20 +318,7 @@ class DickCareyAgent:
 
         reasoning_steps.append("Step 3: 학습자/환경 분석 - 출발점 행동, 환경 분석 (병렬 실행)")
 
-        # class_size 파싱 (문자열인 경우 숫자 추출)
-        import re
-        raw_class_size = context.get("class_size")
-        parsed_class_size = None
-        if raw_class_size is not None:
-            if isinstance(raw_class_size, int):
-                parsed_class_size = raw_class_size
-            elif isinstance(raw_class_size, str):
-                numbers = re.findall(r'\d+', raw_class_size)
-                if numbers:
-                    if len(numbers) >= 2:
-                        parsed_class_size = (int(numbers[0]) + int(numbers[1])) // 2
-                    else:
-                        parsed_class_size = int(numbers[0])
+        parsed_class_size = self._parse_class_size(context.get("class_size"))
 
         # 병렬 실행을 위한 함수 정의
         def run_learner_analysis():
@@ -304,15 +341,19 @@ class DickCareyAgent:
             })
             return ("context", result, start)
 
-        learner_result = {}
-        context_result = {}
+        # 1단계 통합 호출에서 이미 받은 결과는 재사용
+        prefetched = state.get("learner_context", {})
+        learner_result = prefetched.get("learner", {})
+        context_result = prefetched.get("context", {})
+        tasks = []
+        if not learner_result:
+            tasks.append(run_learner_analysis)
+        if not context_result:
+            tasks.append(run_context_analysis)
 
         # ThreadPoolExecutor로 병렬 실행
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            futures = [
-                executor.submit(run_learner_analysis),
-                executor.submit(run_context_analysis),
-            ]
+        with ThreadPoolExecutor(max_workers=max(len(tasks), 1)) as executor:
+            futures = [executor.submit(task) for task in tasks]
 
             for future in as_completed(futures):
                 try:
@@ -376,33 +417,58 @@ class DickCareyAgent:
 
         reasoning_steps.append("Step 4: 수행목표 진술 - ABCD 형식 목표 작성")
 
-        start_time = datetime.now()
-        try:
-            objectives_result = write_performance_objectives.invoke({
+        # 4·5단계 통합 호출 (DICK_CAREY_FUSE_STEPS=1): 누락된 결과는 개별 도구로 보완
+        fused = {}
+        if os.getenv("DICK_CAREY_FUSE_STEPS", "0") == "1":
+            start_time = datetime.now()
+            fused = write_objectives_and_assessments.invoke({
                 "instructional_goal": goal.get("goal_statement", ""),
                 "sub_skills": analysis.get("sub_skills", []),
                 "target_audience": context.get("target_audience", "일반 학습자"),
+                "learning_environment": context.get("learning_environment", "미지정"),
+                "duration": context.get("duration", "미지정"),
             })
-            enabling_count = len(objectives_result.get("enabling_objectives", []))
-            tool_calls.append(self._record_tool_call(
-                state, "write_performance_objectives",
-                {"instructional_goal": goal.get("goal_statement", "")[:50]},
-                f"수행목표 진술 완료: 1개 최종 + {enabling_count}개 가능 목표",
-                start_time,
-            ))
-        except Exception as e:
-            errors.append(f"write_performance_objectives 실패: {str(e)}")
-            objectives_result = {}
+            if fused:
+                tool_calls.append(self._record_tool_call(
+                    state, "write_objectives_and_assessments",
+                    {"instructional_goal": goal.get("goal_statement", "")[:50]},
+                    f"통합 분석 완료: {', '.join(fused)}",
+                    start_time,
+                ))
+
+        objectives_result = fused.get("performance_objectives")
+        if objectives_result is None:
+            start_time = datetime.now()
+            try:
+                objectives_result = write_performance_objectives.invoke({
+                    "instructional_goal": goal.get("goal_statement", ""),
+                    "sub_skills": analysis.get("sub_skills", []),
+                    "target_audience": context.get("target_audience", "일반 학습자"),
+                })
+                enabling_count = len(objectives_result.get("enabling_objectives", []))
+                tool_calls.append(self._record_tool_call(
+                    state, "write_performance_objectives",
+                    {"instructional_goal": goal.get("goal_statement", "")[:50]},
+                    f"수행목표 진술 완료: 1개 최종 + {enabling_count}개 가능 목표",
+                    start_time,
+                ))
+            except Exception as e:
+                errors.append(f"write_performance_objectives 실패: {str(e)}")
+                objectives_result = {}
 
         self._log(f"4단계 완료: {len(objectives_result.get('enabling_objectives', []))}개 목표")
 
-        return {
+        result = {
             "performance_objectives": objectives_result,
             "current_phase": "assessment_and_strategy",
             "tool_calls": tool_calls,
             "reasoning_steps": reasoning_steps,
             "errors": errors,
         }
+        # 평가도구는 통합 응답에서 수행목표와 함께 받은 경우에만 재사용
+        if "performance_objectives" in fused and "assessment_instruments" in fused:
+            result["assessment_instruments"] = fused["assessment_instruments"]
+        return result
 
     # ========== 5-6단계: 평가도구 + 교수전략 개발 (병렬화 #80) ==========
     def _assessment_and_strategy_node(self, state: DickCareyState) -> dict:
@@ -428,8 +494,22 @@ class DickCareyAgent:
             })
             return ("assessment", result, start)
 
+        fused = {}
+
         def run_strategy():
             start = datetime.now()
+            # 6·7단계 통합 호출 (DICK_CAREY_FUSE_STEPS=1): 교수전략이 누락되면 개별 도구로 보완
+            if os.getenv("DICK_CAREY_FUSE_STEPS", "0") == "1":
+                fused.update(develop_strategy_and_materials.invoke({
+                    "performance_objectives": objectives,
+                    "learner_analysis": learner_context.get("learner", {}),
+                    "learning_environment": context.get("learning_environment", "미지정"),
+                    "duration": context.get("duration", "미지정"),
+                    "topic_title": scenario.get("title", "교육 프로그램"),
+                }))
+                if "instructional_strategy" in fused:
+                    return ("strategy", fused["instructional_strategy"], start)
+                fused.clear()
             result = develop_instructional_strategy.invoke({
                 "performance_objectives": objectives,
                 "learner_analysis": learner_context.get("learner", {}),
@@ -438,15 +518,14 @@ class DickCareyAgent:
             })
             return ("strategy", result, start)
 
-        assessment_result = {}
+        # 4단계 통합 호출에서 이미 받은 평가도구는 재사용
+        assessment_result = state.get("assessment_instruments", {})
         strategy_result = {}
+        tasks = [run_strategy] if assessment_result else [run_assessment, run_strategy]
 
         # ThreadPoolExecutor로 병렬 실행
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            futures = [
-                executor.submit(run_assessment),
-                executor.submit(run_strategy),
-            ]
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(task) for task in tasks]
 
             for future in as_completed(futures):
                 try:
@@ -463,7 +542,7 @@ class DickCareyAgent:
                     else:  # strategy
                         strategy_result = result
                         tool_calls.append(self._record_tool_call(
-                            state, "develop_instructional_strategy",
+                            state, "develop_strategy_and_materials" if fused else "develop_instructional_strategy",
                             {"learning_environment": context.get("learning_environment", "")},
                             f"교수전략 개발 완료: {result.get('delivery_method', '')}",
                             start_time,
@@ -477,7 +556,7 @@ class DickCareyAgent:
 
         self._log(f"5-6단계 완료 (병렬): assessment={len(assessment_result.get('post_test', []))}, strategy={strategy_result.get('delivery_method', '')}")
 
-        return {
+        result = {
             "assessment_instruments": assessment_result,
             "instructional_strategy": strategy_result,
             "current_phase": "instructional_materials",
@@ -485,6 +564,10 @@ class DickCareyAgent:
             "reasoning_steps": reasoning_steps,
             "errors": errors,
         }
+        # 교수자료는 통합 응답에서 교수전략과 함께 받은 경우에만 재사용
+        if "instructional_materials" in fused:
+            result["instructional_materials"] = fused["instructional_materials"]
+        return result
 
     # ========== 7단계: 교수자료 개발 ==========
     def _instructional_materials_node(self, state: DickCareyState) -> dict:
@@ -500,26 +583,29 @@ class DickCareyAgent:
 
         reasoning_steps.append("Step 7: 교수자료 개발 - 교수자 가이드, 학습자 자료, 미디어")
 
-        start_time = datetime.now()
-        try:
-            materials_result = develop_instructional_materials.invoke({
-                "instructional_strategy": strategy,
-                "performance_objectives": objectives,
-                "learning_environment": context.get("learning_environment", "미지정"),
-                "duration": context.get("duration", "미지정"),
-                "topic_title": scenario.get("title", "교육 프로그램"),
-            })
-            learner_count = len(materials_result.get("learner_materials", []))
-            slide_count = len(materials_result.get("slide_contents", []))
-            tool_calls.append(self._record_tool_call(
-                state, "develop_instructional_materials",
-                {"topic_title": scenario.get("title", "")},
-                f"교수자료 개발 완료: {learner_count}종 자료, {slide_count}개 슬라이드",
-                start_time,
-            ))
-        except Exception as e:
-            errors.append(f"develop_instructional_materials 실패: {str(e)}")
-            materials_result = {}
+        # 6·7단계 통합 호출에서 이미 받은 교수자료는 재사용
+        materials_result = state.get("instructional_materials", {})
+        if not materials_result:
+            start_time = datetime.now()
+            try:
+                materials_result = develop_instructional_materials.invoke({
+                    "instructional_strategy": strategy,
+                    "performance_objectives": objectives,
+                    "learning_environment": context.get("learning_environment", "미지정"),
+                    "duration": context.get("duration", "미지정"),
+                    "topic_title": scenario.get("title", "교육 프로그램"),
+                })
+                learner_count = len(materials_result.get("learner_materials", []))
+                slide_count = len(materials_result.get("slide_contents", []))
+                tool_calls.append(self._record_tool_call(
+                    state, "develop_instructional_materials",
+                    {"topic_title": scenario.get("title", "")},
+                    f"교수자료 개발 완료: {learner_count}종 자료, {slide_count}개 슬라이드",
+                    start_time,
+                ))
+            except Exception as e:
+                errors.append(f"develop_instructional_materials 실패: {str(e)}")
+                materials_result = {}
 
         self._log(f"7단계 완료: {len(materials_result.get('learner_materials', []))}종 자료")
 
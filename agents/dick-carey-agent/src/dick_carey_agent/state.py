@@ -471,9 +471,23 @@ class DickCareyState(TypedDict, total=False):
     metadata: Metadata
 
 
+# 초기 상태의 불변 필드 (모듈 로드 시 1회 생성, 호출마다 dict.copy()로 복제)
+_INITIAL_STATE_TEMPLATE = {
+    # 순환 제어
+    "iteration_count": 0,
+    "max_iterations": 3,
+    "quality_threshold": 7.0,
+    "revision_triggered": False,
+    # 상태 관리
+    "current_phase": "goal",
+}
+
+
 def create_initial_state(scenario: ScenarioInput) -> DickCareyState:
     """초기 상태 생성"""
-    return DickCareyState(
+    state = _INITIAL_STATE_TEMPLATE.copy()
+    # 가변 필드는 상태 간 공유되지 않도록 호출마다 새로 생성
+    state.update(
         scenario=scenario,
         goal={},
         instructional_analysis={},
@@ -483,16 +497,9 @@ def create_initial_state(scenario: ScenarioInput) -> DickCareyState:
         instructional_strategy={},
         instructional_materials={},
         formative_evaluation={},
-        revision_log=[],
         summative_evaluation={},
-        # 순환 제어
-        iteration_count=0,
-        max_iterations=3,
-        quality_threshold=7.0,
-        revision_triggered=False,
+        revision_log=[],
         quality_score_history=[],
-        # 상태 관리
-        current_phase="goal",
         errors=[],
         # 궤적
         tool_calls=[],
@@ -503,6 +510,28 @@ def create_initial_state(scenario: ScenarioInput) -> DickCareyState:
             "iteration_count": 0,
         },
     )
+    return state
+
+
+# ADDIE 학습자·환경 분석 필드 매핑: (ADDIE 키, Dick & Carey 키, 기본값 생성자)
+_LEARNER_ANALYSIS_FIELDS = (
+    ("target_audience", "target_audience", str),
+    ("characteristics", "characteristics", list),
+    ("prior_knowledge", "prior_knowledge", str),
+    ("learning_preferences", "learning_preferences", list),
+    ("motivation", "motivation", str),
+)
+_CONTEXT_ANALYSIS_FIELDS = (
+    ("environment", "learning_context", str),
+    ("constraints", "constraints", list),
+    ("resources", "resources", list),
+    ("technical_requirements", "technical_requirements", list),
+)
+
+
+def _map_fields(source: dict, fields: tuple) -> dict:
+    """매핑 표에 따라 하위 필드 복사 (누락 필드는 기본값 생성)"""
+    return {key: source.get(src_key, default()) for key, src_key, default in fields}
 
 
 def map_to_addie_output(state: DickCareyState) -> dict:
@@ -528,9 +557,31 @@ def map_to_addie_output(state: DickCareyState) -> dict:
     assessment_instruments = state.get("assessment_instruments", {})
     performance_objectives = state.get("performance_objectives", {})
 
+    # 반복 조회되는 하위 딕셔너리는 한 번만 꺼내 둔다
+    learner = learner_context.get("learner", {})
+    context = learner_context.get("context", {})
+    needs = goal.get("needs_analysis", {})
+    sub_skills = instructional_analysis.get("sub_skills", [])
+    terminal_obj = performance_objectives.get("terminal_objective", {})
+    enabling_objectives = performance_objectives.get("enabling_objectives", [])
+    post_test = assessment_instruments.get("post_test", [])
+    pre_inst = instructional_strategy.get("pre_instructional", {})
+    content_pres = instructional_strategy.get("content_presentation", {})
+    learner_part = instructional_strategy.get("learner_participation", {})
+    content_selection = instructional_strategy.get("content_selection", {})
+    non_instructional = instructional_strategy.get("non_instructional_strategy", {})
+    media_selection = instructional_strategy.get("media_selection", {})
+    instructor_guide = instructional_materials.get("instructor_guide", {})
+    expert_review = instructional_materials.get("expert_review", {})
+    orientation_plan = formative_evaluation.get("orientation_plan", {})
+    system_check = formative_evaluation.get("system_check", {})
+    pilot_plan = formative_evaluation.get("pilot_plan", {})
+    operation_monitoring = formative_evaluation.get("operation_monitoring", {})
+    adoption_decision = summative_evaluation.get("adoption_decision", {})
+    program_improvement = summative_evaluation.get("program_improvement", {})
+
     # 학습 목표를 표준 형식으로 변환
     learning_objectives = []
-    terminal_obj = performance_objectives.get("terminal_objective", {})
     if terminal_obj:
         learning_objectives.append({
             "id": terminal_obj.get("id", "TO-001"),
@@ -539,7 +590,7 @@ def map_to_addie_output(state: DickCareyState) -> dict:
             "bloom_verb": terminal_obj.get("bloom_level", ""),
             "measurable": True,
         })
-    for idx, obj in enumerate(performance_objectives.get("enabling_objectives", [])):
+    for idx, obj in enumerate(enabling_objectives):
         learning_objectives.append({
             "id": obj.get("id", f"EO-{idx+1:03d}"),
             "level": "enabling",
@@ -550,7 +601,6 @@ def map_to_addie_output(state: DickCareyState) -> dict:
 
     # 학습 활동 생성 (교수 전략에서 추출)
     learning_activities = []
-    pre_inst = instructional_strategy.get("pre_instructional", {})
     if pre_inst:
         learning_activities.append({
             "activity_name": "교수 전 활동",
@@ -558,7 +608,6 @@ def map_to_addie_output(state: DickCareyState) -> dict:
             "description": f"동기 유발: {pre_inst.get('motivation', '')}, 목표 제시: {pre_inst.get('objectives_info', '')}",
             "materials": ["동기유발 자료"],
         })
-    content_pres = instructional_strategy.get("content_presentation", {})
     if content_pres:
         learning_activities.append({
             "activity_name": "내용 제시",
@@ -566,7 +615,6 @@ def map_to_addie_output(state: DickCareyState) -> dict:
             "description": f"예시: {', '.join(content_pres.get('examples', [])[:3])}",
             "materials": content_pres.get("sequence", [])[:3],
         })
-    learner_part = instructional_strategy.get("learner_participation", {})
     if learner_part:
         learning_activities.append({
             "activity_name": "학습자 참여 활동",
@@ -582,42 +630,31 @@ def map_to_addie_output(state: DickCareyState) -> dict:
                 # [1] 문제 확인 및 정의
                 "problem_definition": goal.get("performance_gap", "") or f"현재 상태: {goal.get('current_state', '')}, 목표 상태: {goal.get('desired_state', '')}",
                 # [2] 차이분석
-                "gap_analysis": goal.get("needs_analysis", {}).get("gap_analysis", []) or [
+                "gap_analysis": needs.get("gap_analysis", []) or [
                     {"current": goal.get("current_state", ""), "target": goal.get("desired_state", ""), "gap": goal.get("performance_gap", "")}
                 ],
                 # [3] 수행분석
-                "performance_analysis": f"근본 원인: {', '.join(goal.get('needs_analysis', {}).get('root_causes', []))}. 교육 필요: {', '.join(goal.get('needs_analysis', {}).get('training_needs', []))}",
+                "performance_analysis": f"근본 원인: {', '.join(needs.get('root_causes', []))}. 교육 필요: {', '.join(needs.get('training_needs', []))}",
                 # [4] 요구 우선순위 결정
-                "priority_matrix": goal.get("needs_analysis", {}).get("priority_matrix", {
-                    "high_priority": goal.get("needs_analysis", {}).get("training_needs", [])[:2],
+                "priority_matrix": needs.get("priority_matrix", {
+                    "high_priority": needs.get("training_needs", [])[:2],
                     "medium_priority": [],
-                    "low_priority": goal.get("needs_analysis", {}).get("non_training_solutions", []),
+                    "low_priority": needs.get("non_training_solutions", []),
                 }),
             },
             # A2: 학습자 및 환경분석 (소항목 5-6)
-            "learner_analysis": {
-                "target_audience": learner_context.get("learner", {}).get("target_audience", ""),
-                "characteristics": learner_context.get("learner", {}).get("characteristics", []),
-                "prior_knowledge": learner_context.get("learner", {}).get("prior_knowledge", ""),
-                "learning_preferences": learner_context.get("learner", {}).get("learning_preferences", []),
-                "motivation": learner_context.get("learner", {}).get("motivation", ""),
-            },
-            "context_analysis": {
-                "environment": learner_context.get("context", {}).get("learning_context", ""),
-                "constraints": learner_context.get("context", {}).get("constraints", []),
-                "resources": learner_context.get("context", {}).get("resources", []),
-                "technical_requirements": learner_context.get("context", {}).get("technical_requirements", []),
-            },
+            "learner_analysis": _map_fields(learner, _LEARNER_ANALYSIS_FIELDS),
+            "context_analysis": _map_fields(context, _CONTEXT_ANALYSIS_FIELDS),
             # A3: 과제 및 목표분석 (소항목 7-10)
             "task_analysis": {
                 # [7] 초기 학습목표 분석
-                "initial_objectives": [obj.get("statement", "") for obj in performance_objectives.get("enabling_objectives", [])[:5]] or [goal.get("goal_statement", "")],
+                "initial_objectives": [obj.get("statement", "") for obj in enabling_objectives[:5]] or [goal.get("goal_statement", "")],
                 # [8] 하위 기능 분석
-                "subtopics": [skill.get("description", "") for skill in instructional_analysis.get("sub_skills", [])],
+                "subtopics": [skill.get("description", "") for skill in sub_skills],
                 # [9] 출발점 행동 분석
-                "prerequisites": instructional_analysis.get("entry_skills", []) or learner_context.get("learner", {}).get("entry_behaviors", []),
+                "prerequisites": instructional_analysis.get("entry_skills", []) or learner.get("entry_behaviors", []),
                 # [10] 과제분석 결과 검토·정리
-                "review_summary": instructional_analysis.get("review_summary", "") or f"과제 유형: {instructional_analysis.get('task_type', '')}. 하위 기능 {len(instructional_analysis.get('sub_skills', []))}개 분석 완료.",
+                "review_summary": instructional_analysis.get("review_summary", "") or f"과제 유형: {instructional_analysis.get('task_type', '')}. 하위 기능 {len(sub_skills)}개 분석 완료.",
             },
         },
         "design": {
@@ -626,32 +663,32 @@ def map_to_addie_output(state: DickCareyState) -> dict:
             # [12] 평가 계획 수립
             "assessment_plan": {
                 "formative": [{"type": item.get("type", ""), "description": item.get("question", "")} for item in assessment_instruments.get("practice_tests", [])[:3]],
-                "summative": [{"type": item.get("type", ""), "description": item.get("question", "")} for item in assessment_instruments.get("post_test", [])[:3]],
-                "assessment_criteria": [item.get("rubric", "") for item in assessment_instruments.get("post_test", [])[:5]],
+                "summative": [{"type": item.get("type", ""), "description": item.get("question", "")} for item in post_test[:3]],
+                "assessment_criteria": [item.get("rubric", "") for item in post_test[:5]],
             },
             # [13] 교수 내용 선정
             "content_structure": {
-                "modules": instructional_strategy.get("content_selection", {}).get("core_content", []),
-                "topics": instructional_strategy.get("content_selection", {}).get("supplementary_content", []),
-                "sequencing": instructional_strategy.get("content_selection", {}).get("selection_rationale", "") or ", ".join(instructional_strategy.get("content_presentation", {}).get("sequence", [])),
+                "modules": content_selection.get("core_content", []),
+                "topics": content_selection.get("supplementary_content", []),
+                "sequencing": content_selection.get("selection_rationale", "") or ", ".join(content_pres.get("sequence", [])),
             },
             # [14] 교수적 전략 수립
             "instructional_strategies": {
                 "methods": [instructional_strategy.get("delivery_method", ""), instructional_strategy.get("grouping_strategy", "")],
-                "activities": instructional_strategy.get("learner_participation", {}).get("practice_activities", []),
-                "rationale": f"전달 방법: {instructional_strategy.get('delivery_method', '')}. {instructional_strategy.get('learner_participation', {}).get('feedback_strategy', '')}",
+                "activities": learner_part.get("practice_activities", []),
+                "rationale": f"전달 방법: {instructional_strategy.get('delivery_method', '')}. {learner_part.get('feedback_strategy', '')}",
             },
             # [15] 비교수적 전략 수립
             "non_instructional_strategies": {
-                "motivation_strategies": [instructional_strategy.get("pre_instructional", {}).get("motivation", "")],
-                "self_directed_learning": instructional_strategy.get("non_instructional_strategy", {}).get("strategies", []),
-                "support_strategies": [instructional_strategy.get("non_instructional_strategy", {}).get("implementation", "")],
+                "motivation_strategies": [pre_inst.get("motivation", "")],
+                "self_directed_learning": non_instructional.get("strategies", []),
+                "support_strategies": [non_instructional.get("implementation", "")],
             },
             # [16] 매체 선정과 활용 계획
             "media_selection": {
-                "media_types": instructional_strategy.get("media_selection", {}).get("selected_media", []),
+                "media_types": media_selection.get("selected_media", []),
                 "tools": [],
-                "utilization_plan": instructional_strategy.get("media_selection", {}).get("utilization_plan", ""),
+                "utilization_plan": media_selection.get("utilization_plan", ""),
             },
             # [17] 학습활동 및 시간 구조화
             "learning_activities": learning_activities,
@@ -675,8 +712,8 @@ def map_to_addie_output(state: DickCareyState) -> dict:
             ],
             # [20] 교수자용 매뉴얼 개발
             "instructor_guide": {
-                "overview": instructional_materials.get("instructor_guide", {}).get("description", "") or instructional_materials.get("instructor_manual", ""),
-                "session_guides": instructional_materials.get("instructor_guide", {}).get("content_outline", []),
+                "overview": instructor_guide.get("description", "") or instructional_materials.get("instructor_manual", ""),
+                "session_guides": instructor_guide.get("content_outline", []),
                 "facilitation_tips": ["학습자 참여 유도", "질문 활용", "피드백 제공"],
                 "troubleshooting": ["기술적 문제 대응", "학습 진도 조정"],
             },
@@ -696,41 +733,41 @@ def map_to_addie_output(state: DickCareyState) -> dict:
                     "aligned_objective": item.get("objective_id", ""),
                     "scoring_criteria": item.get("rubric", ""),
                 }
-                for idx, item in enumerate(assessment_instruments.get("post_test", []))
+                for idx, item in enumerate(post_test)
             ],
             # [23] 전문가 검토
             "expert_review": {
-                "reviewers": [instructional_materials.get("expert_review", {}).get("reviewer", "내용 전문가")],
-                "review_criteria": instructional_materials.get("expert_review", {}).get("review_areas", ["내용 정확성", "교수 설계 적절성"]),
-                "feedback_summary": "; ".join(instructional_materials.get("expert_review", {}).get("findings", [])),
-                "revisions_made": instructional_materials.get("expert_review", {}).get("recommendations", []),
+                "reviewers": [expert_review.get("reviewer", "내용 전문가")],
+                "review_criteria": expert_review.get("review_areas", ["내용 정확성", "교수 설계 적절성"]),
+                "feedback_summary": "; ".join(expert_review.get("findings", [])),
+                "revisions_made": expert_review.get("recommendations", []),
             },
         },
         "implementation": {
             # [24] 교수자·운영자 오리엔테이션
             "instructor_orientation": {
-                "orientation_objectives": formative_evaluation.get("orientation_plan", {}).get("schedule", []) or ["프로그램 이해", "운영 절차 숙지"],
-                "schedule": formative_evaluation.get("orientation_plan", {}).get("facilitator_orientation", "") or "사전 1주일 전",
+                "orientation_objectives": orientation_plan.get("schedule", []) or ["프로그램 이해", "운영 절차 숙지"],
+                "schedule": orientation_plan.get("facilitator_orientation", "") or "사전 1주일 전",
                 "materials": ["교수자 가이드", "운영 매뉴얼"],
                 "competency_checklist": ["내용 이해도", "진행 능력", "기술 활용 능력"],
             },
             # [25] 시스템/환경 점검
             "system_check": {
-                "checklist": formative_evaluation.get("system_check", {}).get("checklist", ["네트워크 연결", "장비 점검", "자료 준비"]),
-                "technical_validation": "; ".join(formative_evaluation.get("system_check", {}).get("technical_tests", [])) or "시스템 테스트 완료",
-                "contingency_plans": [formative_evaluation.get("system_check", {}).get("contingency_plan", "비상 대응 계획 수립")],
+                "checklist": system_check.get("checklist", ["네트워크 연결", "장비 점검", "자료 준비"]),
+                "technical_validation": "; ".join(system_check.get("technical_tests", [])) or "시스템 테스트 완료",
+                "contingency_plans": [system_check.get("contingency_plan", "비상 대응 계획 수립")],
             },
             # [26] 프로토타입 실행
             "prototype_execution": {
-                "pilot_scope": formative_evaluation.get("pilot_plan", {}).get("pilot_scope", "소규모 파일럿 테스트"),
-                "participants": formative_evaluation.get("pilot_plan", {}).get("participants", "10명 내외"),
-                "execution_log": formative_evaluation.get("pilot_plan", {}).get("data_collection", []),
+                "pilot_scope": pilot_plan.get("pilot_scope", "소규모 파일럿 테스트"),
+                "participants": pilot_plan.get("participants", "10명 내외"),
+                "execution_log": pilot_plan.get("data_collection", []),
                 "issues_encountered": formative_evaluation.get("weaknesses", []),
             },
             # [27] 운영 모니터링 및 지원
             "monitoring": {
-                "monitoring_criteria": formative_evaluation.get("operation_monitoring", {}).get("monitoring_metrics", ["학습 진도", "참여율", "만족도"]),
-                "support_channels": formative_evaluation.get("operation_monitoring", {}).get("support_channels", ["이메일", "전화", "온라인 게시판"]),
+                "monitoring_criteria": operation_monitoring.get("monitoring_metrics", ["학습 진도", "참여율", "만족도"]),
+                "support_channels": operation_monitoring.get("support_channels", ["이메일", "전화", "온라인 게시판"]),
                 "issue_resolution_log": [],
                 "real_time_adjustments": formative_evaluation.get("revision_recommendations", []),
             },
@@ -769,7 +806,7 @@ def map_to_addie_output(state: DickCareyState) -> dict:
                         "question": item.get("question", ""),
                         "scoring_rubric": item.get("rubric", ""),
                     }
-                    for idx, item in enumerate(assessment_instruments.get("post_test", []))
+                    for idx, item in enumerate(post_test)
                 ],
                 # [31] 총괄평가 시행 및 프로그램 효과 분석
                 "effectiveness_analysis": {
@@ -780,19 +817,19 @@ def map_to_addie_output(state: DickCareyState) -> dict:
                 },
                 # [32] 프로그램 채택 여부 결정
                 "adoption_decision": {
-                    "decision": summative_evaluation.get("adoption_decision", {}).get("recommendation", "") or summative_evaluation.get("decision", ""),
-                    "rationale": summative_evaluation.get("adoption_decision", {}).get("rationale", ""),
-                    "conditions": summative_evaluation.get("adoption_decision", {}).get("conditions", []),
+                    "decision": adoption_decision.get("recommendation", "") or summative_evaluation.get("decision", ""),
+                    "rationale": adoption_decision.get("rationale", ""),
+                    "conditions": adoption_decision.get("conditions", []),
                     "stakeholder_approval": "승인 대기",
                 },
             },
             # [33] E3: 프로그램 개선 및 환류
             "improvement_plan": {
                 "feedback_summary": summative_evaluation.get("learner_satisfaction", ""),
-                "improvement_areas": summative_evaluation.get("program_improvement", {}).get("improvement_areas", []),
-                "action_items": summative_evaluation.get("program_improvement", {}).get("improvement_actions", []),
+                "improvement_areas": program_improvement.get("improvement_areas", []),
+                "action_items": program_improvement.get("improvement_actions", []),
                 "feedback_loop": "평가 결과를 바탕으로 다음 교육 과정에 반영",
-                "next_iteration_goals": summative_evaluation.get("adoption_decision", {}).get("next_steps", []),
+                "next_iteration_goals": adoption_decision.get("next_steps", []),
             },
         },
     }
@@ -7,10 +7,14 @@ Dick & Carey 모형의 10단계에 대응하는 11개 도구입니다.
 - 1단계: set_instructional_goal
 - 2단계: analyze_instruction
 - 3단계: analyze_entry_behaviors, analyze_context
+- 1·3단계 통합: analyze_goal_and_context_bundle (DICK_CAREY_FUSE_STEPS=1)
+- 1-3단계 배치 실행: *_batch (여러 입력 동시 처리, async)
 - 4단계: write_performance_objectives
 - 5단계: develop_assessment_instruments
+- 4·5단계 통합: write_objectives_and_assessments (DICK_CAREY_FUSE_STEPS=1)
 - 6단계: develop_instructional_strategy
 - 7단계: develop_instructional_materials
+- 6·7단계 통합: develop_strategy_and_materials (DICK_CAREY_FUSE_STEPS=1)
 - 8단계: conduct_formative_evaluation
 - 9단계: revise_instruction
 - 10단계: conduct_summative_evaluation
@@ -21,16 +25,24 @@ from dick_carey_agent.tools.goal_analysis import (
     analyze_instruction,
     analyze_entry_behaviors,
     analyze_context,
+    analyze_goal_and_context_bundle,
+    # 배치 실행 헬퍼 (async)
+    set_instructional_goal_batch,
+    analyze_instruction_batch,
+    analyze_entry_behaviors_batch,
+    analyze_context_batch,
 )
 
 from dick_carey_agent.tools.objective_assessment import (
     write_performance_objectives,
     develop_assessment_instruments,
+    write_objectives_and_assessments,
 )
 
 from dick_carey_agent.tools.strategy_materials import (
     develop_instructional_strategy,
     develop_instructional_materials,
+    develop_strategy_and_materials,
 )
 
 from dick_carey_agent.tools.evaluation import (
@@ -45,12 +57,19 @@ __all__ = [
     "analyze_instruction",
     "analyze_entry_behaviors",
     "analyze_context",
+    "analyze_goal_and_context_bundle",
+    "set_instructional_goal_batch",
+    "analyze_instruction_batch",
+    "analyze_entry_behaviors_batch",
+    "analyze_context_batch",
     # 4-5단계
     "write_performance_objectives",
     "develop_assessment_instruments",
+    "write_objectives_and_assessments",
     # 6-7단계
     "develop_instructional_strategy",
     "develop_instructional_materials",
+    "develop_strategy_and_materials",
     # 8-10단계
     "conduct_formative_evaluation",
     "revise_instruction",
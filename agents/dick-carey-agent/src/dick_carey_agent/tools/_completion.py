@@ -0,0 +1,58 @@
+"""
+Completion Helpers
+
+Shared by the Dick & Carey tool modules: reading a chat model's reply as text, optionally
+streaming it and stopping once the JSON object closes (DICK_CAREY_STREAM=1), and the
+provider JSON mode switch (DICK_CAREY_JSON_MODE=1).
+"""
+
+import os
+
+from ._json import _JsonEndScanner
+from ._llm_cache import CachedLLM
+
+
+def _json_mode_enabled() -> bool:
+    return os.getenv("DICK_CAREY_JSON_MODE", "0") == "1"
+
+
+def _stream_enabled() -> bool:
+    return os.getenv("DICK_CAREY_STREAM", "0") == "1"
+
+
+def _remember_complete(llm, prompt, text: str) -> str:
+    """Cache a stream cut off at the end of a complete JSON object (CachedLLM only stores full streams)"""
+    if isinstance(llm, CachedLLM):
+        llm.remember(prompt, text)
+    return text
+
+
+def _complete(llm, prompt) -> str:
+    """Return the response text, streaming and stopping at the end of the JSON object if enabled"""
+    if not _stream_enabled():
+        return llm.invoke(prompt).content
+    scanner = _JsonEndScanner()
+    parts = []
+    for chunk in llm.stream(prompt):
+        parts.append(chunk.content)
+        if scanner.feed(chunk.content):
+            return _remember_complete(llm, prompt, "".join(parts))
+    return "".join(parts)
+
+
+async def _acomplete(llm, prompt) -> str:
+    """Async variant of _complete"""
+    if not _stream_enabled():
+        return (await llm.ainvoke(prompt)).content
+    scanner = _JsonEndScanner()
+    parts = []
+    stream = llm.astream(prompt)
+    try:
+        async for chunk in stream:
+            parts.append(chunk.content)
+            if scanner.feed(chunk.content):
+                return _remember_complete(llm, prompt, "".join(parts))
+    finally:
+        # Close now rather than at garbage collection so the HTTP stream is released promptly
+        await stream.aclose()
+    return "".join(parts)
@@ -0,0 +1,119 @@
+"""
+JSON Helpers
+
+Shared by the Dick & Carey tool modules: parsing LLM replies, spotting the end of a streamed
+JSON object, serializing tool inputs for prompts, and rendering prompt examples.
+"""
+
+import json
+import re
+import threading
+from collections import OrderedDict
+
+import orjson
+
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.S)
+_JSON_DECODER = json.JSONDecoder()
+
+
+def parse_json_response(content: str) -> dict:
+    """Parse JSON from LLM response (first fenced block if any, decoded from its first '{')"""
+    stripped = content.strip()
+    if stripped[:1] in ("{", "["):
+        # Bare JSON (JSON mode or a well-behaved reply): skip the fence scan
+        try:
+            return orjson.loads(stripped)
+        except orjson.JSONDecodeError:
+            pass
+    m = _FENCE_RE.search(content)
+    payload = m.group(1) if m else content
+    try:
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        pass
+    # Prose around the object: decode from the first '{' and ignore the rest
+    idx = payload.find("{")
+    obj, _ = _JSON_DECODER.raw_decode(payload, max(idx, 0))
+    return obj
+
+
+class _JsonEndScanner:
+    """Tracks brace depth over streamed text to spot where the first top-level JSON object closes"""
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escape = False
+
+    def feed(self, text: str) -> bool:
+        """Consume a chunk; return True once the first top-level object is complete"""
+        for ch in text:
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = self.started
+            elif ch == "{":
+                self.depth += 1
+                self.started = True
+            elif ch == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
+
+
+def _dumps(value) -> str:
+    """Serialize to JSON text (orjson keeps non-ASCII characters as-is)"""
+    return orjson.dumps(value).decode()
+
+
+# Serialized flat input lists/dicts (scalar entries only), keyed by object identity (LRU).
+# The snapshot of the entries guards against the same object being mutated between calls;
+# holding the object keeps its id unique. Nested values are never cached, since an in-place
+# change below the top level would not show in the snapshot.
+_DUMPS_CACHE_MAX_ENTRIES = 64
+_dumps_cache: OrderedDict[int, tuple] = OrderedDict()
+_dumps_cache_lock = threading.Lock()
+
+
+def _dumps_cached(value) -> str:
+    """Serialize a flat list or dict input, reusing the text when the same object recurs"""
+    if not isinstance(value, (list, dict)):
+        return _dumps(value)
+    snapshot = tuple(value.items()) if isinstance(value, dict) else tuple(value)
+    if any(isinstance(v, (list, dict)) for v in (value.values() if isinstance(value, dict) else value)):
+        return _dumps(value)
+    with _dumps_cache_lock:
+        entry = _dumps_cache.get(id(value))
+        if entry is not None and entry[0] is value and entry[1] == snapshot:
+            _dumps_cache.move_to_end(id(value))
+            return entry[2]
+    text = _dumps(value)
+    with _dumps_cache_lock:
+        _dumps_cache[id(value)] = (value, snapshot, text)
+        _dumps_cache.move_to_end(id(value))
+        if len(_dumps_cache) > _DUMPS_CACHE_MAX_ENTRIES:
+            _dumps_cache.popitem(last=False)
+    return text
+
+
+def _render_example(value, indent: int = 0) -> str:
+    """Render a prompt example as indented JSON, keeping short scalar lists on one line"""
+    pad = "  " * (indent + 1)
+    if isinstance(value, dict):
+        items = [f"{pad}{json.dumps(k)}: {_render_example(v, indent + 1)}" for k, v in value.items()]
+        return "{\n" + ",\n".join(items) + "\n" + "  " * indent + "}"
+    if isinstance(value, list):
+        inline = json.dumps(value, ensure_ascii=False)
+        if all(not isinstance(v, (dict, list)) for v in value) and len(inline) <= 80:
+            return inline
+        items = [pad + _render_example(v, indent + 1) for v in value]
+        return "[\n" + ",\n".join(items) + "\n" + "  " * indent + "]"
+    return json.dumps(value, ensure_ascii=False)
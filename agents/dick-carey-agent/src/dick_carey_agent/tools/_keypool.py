@@ -0,0 +1,94 @@
+"""
+Upstage API Key Pool
+
+One pool of Upstage keys (UPSTAGE_API_KEY, UPSTAGE_API_KEY2, UPSTAGE_API_KEY3) shared by the
+Dick & Carey tool modules, so every step sees the same in-flight counts and 429 cooldowns.
+"""
+
+import contextlib
+import os
+import threading
+import time
+from typing import List, Optional
+
+import openai
+
+
+KEY_COOLDOWN_SECONDS = 60.0
+_UPSTAGE_KEY_ENVS = ("UPSTAGE_API_KEY", "UPSTAGE_API_KEY2", "UPSTAGE_API_KEY3")
+
+
+class KeyPool:
+    """API key pool that hands out the key with the fewest in-flight requests
+
+    Ties go round-robin so keys still rotate under light load; a key that hit a rate limit
+    is skipped until its cooldown expires (the soonest available is used if all are cooling down).
+    """
+
+    def __init__(self, keys: List[Optional[str]]):
+        self._keys = keys
+        self._inflight = [0] * len(keys)
+        self._cooldown_until = [0.0] * len(keys)
+        self._idx = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _pick(self) -> int:
+        now = time.monotonic()
+        order = [(self._idx + j) % len(self._keys) for j in range(len(self._keys))]
+        ready = [i for i in order if self._cooldown_until[i] <= now]
+        if ready:
+            i = min(ready, key=self._inflight.__getitem__)
+        else:
+            i = min(order, key=self._cooldown_until.__getitem__)
+        self._idx = i + 1
+        return i
+
+    def acquire(self) -> Optional[str]:
+        """Return the next key without holding a lease"""
+        with self._lock:
+            return self._keys[self._pick()]
+
+    @contextlib.contextmanager
+    def lease(self):
+        """Hold a key for one request; a rate-limit error puts the key on cooldown"""
+        with self._lock:
+            i = self._pick()
+            self._inflight[i] += 1
+        try:
+            yield self._keys[i]
+        except openai.RateLimitError:
+            self.mark_rate_limited(self._keys[i])
+            raise
+        finally:
+            with self._lock:
+                self._inflight[i] -= 1
+
+    def mark_rate_limited(self, key: Optional[str], seconds: float = KEY_COOLDOWN_SECONDS) -> None:
+        """Put a key on cooldown after a quota or rate-limit error"""
+        with self._lock:
+            for i, k in enumerate(self._keys):
+                if k == key:
+                    self._cooldown_until[i] = time.monotonic() + seconds
+
+
+_upstage_pool: Optional[KeyPool] = None
+_upstage_pool_lock = threading.Lock()
+
+
+def get_upstage_pool() -> KeyPool:
+    """Build the Upstage key pool on first use (.env may load after import)"""
+    global _upstage_pool
+    if _upstage_pool is None:
+        with _upstage_pool_lock:
+            if _upstage_pool is None:
+                keys = [os.getenv(env) for env in _UPSTAGE_KEY_ENVS]
+                _upstage_pool = KeyPool([k for k in keys if k] or [None])
+    return _upstage_pool
+
+
+def get_upstage_key() -> Optional[str]:
+    """Get an Upstage API key from the pool (no lease; use get_upstage_pool().lease() to track load)"""
+    return get_upstage_pool().acquire()
@@ -0,0 +1,184 @@
+"""
+LLM Response Cache
+
+Shared response cache for the Dick & Carey tool modules.
+Enabled with DICK_CAREY_LLM_CACHE=1; entries expire after DICK_CAREY_LLM_CACHE_TTL seconds.
+Entries live in process memory unless DICK_CAREY_LLM_CACHE_REDIS_URL points at a Redis server
+(requires the optional redis package).
+"""
+
+import functools
+import hashlib
+import json
+import os
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from typing import Optional, Protocol
+
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+
+
+DEFAULT_TTL_SECONDS = 86400
+_MEMORY_MAX_ENTRIES = 1024
+
+
+class LLMCache(Protocol):
+    """Cache backend storing response text by key"""
+
+    def get(self, key: str) -> Optional[str]: ...
+
+    def set(self, key: str, value: str, ttl: float) -> None: ...
+
+
+class MemoryCache:
+    """In-process LRU cache with per-entry expiry"""
+
+    def __init__(self, max_entries: int = _MEMORY_MAX_ENTRIES):
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+class RedisCache:
+    """Redis-backed cache, shared across processes and benchmark runs"""
+
+    def __init__(self, url: str):
+        import redis
+
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        self._client.set(key, value, ex=max(int(ttl), 1))
+
+
+def cache_enabled() -> bool:
+    return os.getenv("DICK_CAREY_LLM_CACHE", "0") == "1"
+
+
+def cache_ttl() -> float:
+    return float(os.getenv("DICK_CAREY_LLM_CACHE_TTL", str(DEFAULT_TTL_SECONDS)))
+
+
+def llm_temperature(default: float = 0.7) -> float:
+    """Sampling temperature: 0 while caching so cached and fresh answers agree"""
+    return 0.0 if cache_enabled() else default
+
+
+@functools.cache
+def get_cache() -> LLMCache:
+    """Return the process-wide cache backend"""
+    url = os.getenv("DICK_CAREY_LLM_CACHE_REDIS_URL")
+    if url:
+        try:
+            return RedisCache(url)
+        except ImportError:
+            warnings.warn("redis package not installed; using in-memory LLM cache", stacklevel=2)
+    return MemoryCache()
+
+
+def _prompt_payload(prompt) -> object:
+    """JSON-serializable form of a prompt string or message list"""
+    if isinstance(prompt, str):
+        return prompt
+    return [[m.type, m.content] if isinstance(m, BaseMessage) else m for m in prompt]
+
+
+def make_key(namespace: str, model: str, prompt) -> str:
+    """Cache key for a prompt; temperature is pinned to 0 so keys do not depend on sampling"""
+    payload = json.dumps(
+        {"model": model, "prompt": _prompt_payload(prompt), "temp": 0},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return f"dick_carey:{namespace}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+
+class CachedLLM:
+    """Chat model wrapper whose invoke/stream calls (sync and async) serve repeated prompts from the cache"""
+
+    def __init__(self, llm, model: str, namespace: str = "llm"):
+        self._llm = llm
+        self._model = model
+        self._namespace = namespace
+
+    def invoke(self, prompt, *args, **kwargs):
+        key = make_key(self._namespace, self._model, prompt)
+        cache = get_cache()
+        cached = cache.get(key)
+        if cached is not None:
+            return AIMessage(content=cached)
+        response = self._llm.invoke(prompt, *args, **kwargs)
+        cache.set(key, response.content, cache_ttl())
+        return response
+
+    async def ainvoke(self, prompt, *args, **kwargs):
+        key = make_key(self._namespace, self._model, prompt)
+        cache = get_cache()
+        cached = cache.get(key)
+        if cached is not None:
+            return AIMessage(content=cached)
+        response = await self._llm.ainvoke(prompt, *args, **kwargs)
+        cache.set(key, response.content, cache_ttl())
+        return response
+
+    def stream(self, prompt, *args, **kwargs):
+        """Stream the response; a hit is replayed as one chunk, a miss is stored only if the stream runs to the end
+
+        A caller that stops early (cancellation, timeout, or having seen all it needs) stores nothing here;
+        callers that stop at a known-complete answer pass it to remember() instead.
+        """
+        key = make_key(self._namespace, self._model, prompt)
+        cache = get_cache()
+        cached = cache.get(key)
+        if cached is not None:
+            yield AIMessageChunk(content=cached)
+            return
+        parts = []
+        for chunk in self._llm.stream(prompt, *args, **kwargs):
+            parts.append(chunk.content)
+            yield chunk
+        cache.set(key, "".join(parts), cache_ttl())
+
+    async def astream(self, prompt, *args, **kwargs):
+        """Async variant of stream"""
+        key = make_key(self._namespace, self._model, prompt)
+        cache = get_cache()
+        cached = cache.get(key)
+        if cached is not None:
+            yield AIMessageChunk(content=cached)
+            return
+        parts = []
+        async for chunk in self._llm.astream(prompt, *args, **kwargs):
+            parts.append(chunk.content)
+            yield chunk
+        cache.set(key, "".join(parts), cache_ttl())
+
+    def remember(self, prompt, text: str) -> None:
+        """Store a response the caller read only part of the stream for but knows to be complete"""
+        get_cache().set(make_key(self._namespace, self._model, prompt), text, cache_ttl())
+
+    def __getattr__(self, name):
+        return getattr(self._llm, name)
@@ -0,0 +1,121 @@
+"""
+Client-side Rate Limiting
+
+Token buckets that pace LLM requests per API key before the provider starts returning 429s.
+Limits come from <PROVIDER>_RPM (requests per minute) and <PROVIDER>_TPM (tokens per minute),
+e.g. UPSTAGE_RPM=100 or OPENROUTER_TPM=200000; an unset variable means no limit.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+import time
+from typing import Optional
+
+from langchain_core.messages import BaseMessage
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second, holding at most `burst` tokens
+
+    Callers reserve tokens up front (the balance may go negative) and then sleep outside
+    the lock, so one bucket can pace worker threads and asyncio tasks alike.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, amount: float) -> float:
+        """Take `amount` tokens and return how long to wait until they are covered"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, amount: float = 1.0) -> None:
+        wait = self._reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, amount: float = 1.0) -> None:
+        wait = self._reserve(amount)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class RateLimiter:
+    """Request and token budgets for one API key"""
+
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        self._requests = TokenBucket(rpm / 60, rpm) if rpm else None
+        self._tokens = TokenBucket(tpm / 60, tpm) if tpm else None
+
+    @property
+    def enabled(self) -> bool:
+        return self._requests is not None or self._tokens is not None
+
+    def acquire(self, tokens: int = 0) -> None:
+        if self._requests is not None:
+            self._requests.acquire()
+        if self._tokens is not None and tokens:
+            self._tokens.acquire(tokens)
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        if self._requests is not None:
+            await self._requests.aacquire()
+        if self._tokens is not None and tokens:
+            await self._tokens.aacquire(tokens)
+
+
+def _env_limit(name: str) -> Optional[float]:
+    value = os.getenv(name)
+    return float(value) if value else None
+
+
+@functools.cache
+def limiter_for(provider: str, api_key: Optional[str]) -> RateLimiter:
+    """Return the shared limiter for a provider/API key pair"""
+    prefix = provider.upper()
+    return RateLimiter(rpm=_env_limit(f"{prefix}_RPM"), tpm=_env_limit(f"{prefix}_TPM"))
+
+
+def estimate_tokens(prompt) -> int:
+    """Rough prompt size in tokens (about 4 characters per token)"""
+    if isinstance(prompt, str):
+        return len(prompt) // 4
+    return sum(len(m.content) if isinstance(m, BaseMessage) else len(str(m)) for m in prompt) // 4
+
+
+class RateLimitedLLM:
+    """Chat model wrapper that waits for the key's rate budget before each call"""
+
+    def __init__(self, llm, limiter: RateLimiter):
+        self._llm = llm
+        self._limiter = limiter
+
+    def invoke(self, prompt, *args, **kwargs):
+        self._limiter.acquire(estimate_tokens(prompt))
+        return self._llm.invoke(prompt, *args, **kwargs)
+
+    async def ainvoke(self, prompt, *args, **kwargs):
+        await self._limiter.aacquire(estimate_tokens(prompt))
+        return await self._llm.ainvoke(prompt, *args, **kwargs)
+
+    def stream(self, prompt, *args, **kwargs):
+        self._limiter.acquire(estimate_tokens(prompt))
+        yield from self._llm.stream(prompt, *args, **kwargs)
+
+    async def astream(self, prompt, *args, **kwargs):
+        await self._limiter.aacquire(estimate_tokens(prompt))
+        async for chunk in self._llm.astream(prompt, *args, **kwargs):
+            yield chunk
+
+    def __getattr__(self, name):
+        return getattr(self._llm, name)
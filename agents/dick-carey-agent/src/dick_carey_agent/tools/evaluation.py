@@ -11,38 +11,20 @@ Supports iterative improvement through formative evaluation-revision feedback lo
 
 import json
 import os
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 from langchain_core.tools import tool
 from langchain_openai import ChatOpenAI
 
+from ._keypool import get_upstage_key
+
+if TYPE_CHECKING:
+    from ..state import FormativeEvaluationResult
+
 
 # API URLs
 UPSTAGE_BASE_URL = "https://api.upstage.ai/v1/solar"
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
-# Round-robin for Upstage API keys
-_upstage_keys = None
-_upstage_idx = 0
-_upstage_lock = None
-
-def _get_upstage_key():
-    """Get Upstage API key with round-robin"""
-    global _upstage_keys, _upstage_idx, _upstage_lock
-    import threading
-    if _upstage_lock is None:
-        _upstage_lock = threading.Lock()
-    if _upstage_keys is None:
-        keys = []
-        for env in ["UPSTAGE_API_KEY", "UPSTAGE_API_KEY2", "UPSTAGE_API_KEY3"]:
-            k = os.getenv(env)
-            if k:
-                keys.append(k)
-        _upstage_keys = keys if keys else [None]
-    with _upstage_lock:
-        key = _upstage_keys[_upstage_idx % len(_upstage_keys)]
-        _upstage_idx += 1
-        return key
-
 # LLM client (singleton for OpenRouter, round-robin for Upstage)
 _llm_openrouter = None
 
@@ -64,7 +46,7 @@ def get_llm():
         return ChatOpenAI(
             model=os.getenv("DICK_CAREY_MODEL", "solar-mini"),
             temperature=0.7,
-            api_key=_get_upstage_key(),
+            api_key=get_upstage_key(),
             base_url=UPSTAGE_BASE_URL,
         )
 
@@ -218,7 +200,7 @@ def _fallback_conduct_formative_evaluation(
     performance_objectives: dict,
     assessment_instruments: dict,
     iteration: int = 1,
-) -> dict:
+) -> "FormativeEvaluationResult":
     """Fallback function when LLM fails"""
     # Adjust quality score based on iteration (reflecting improvement)
     base_score = 6.5
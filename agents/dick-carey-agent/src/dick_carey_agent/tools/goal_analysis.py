@@ -7,110 +7,240 @@ Dick & Carey Model's first three steps:
 3. Entry Behaviors & Context Analysis
 """
 
-import json
+import asyncio
+import copy
+import functools
+import hashlib
 import os
+import threading
+from concurrent.futures import Future
 from typing import Optional, List
+
+import httpx
+import openai
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.tools import tool
 from langchain_openai import ChatOpenAI
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from ._completion import _complete, _json_mode_enabled
+from ._json import _dumps_cached, _render_example, parse_json_response
+from ._keypool import get_upstage_key, get_upstage_pool
+from ._llm_cache import CachedLLM, cache_enabled, llm_temperature
+from ._ratelimit import estimate_tokens, limiter_for
 
 
 # API URLs
 UPSTAGE_BASE_URL = "https://api.upstage.ai/v1/solar"
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
-# Round-robin for Upstage API keys
-_upstage_keys = None
-_upstage_idx = 0
-_upstage_lock = None
-
-def _get_upstage_key():
-    """Get Upstage API key with round-robin"""
-    global _upstage_keys, _upstage_idx, _upstage_lock
-    import threading
-    if _upstage_lock is None:
-        _upstage_lock = threading.Lock()
-    if _upstage_keys is None:
-        keys = []
-        for env in ["UPSTAGE_API_KEY", "UPSTAGE_API_KEY2", "UPSTAGE_API_KEY3"]:
-            k = os.getenv(env)
-            if k:
-                keys.append(k)
-        _upstage_keys = keys if keys else [None]
-    with _upstage_lock:
-        key = _upstage_keys[_upstage_idx % len(_upstage_keys)]
-        _upstage_idx += 1
-        return key
-
-# LLM client (singleton for OpenRouter, round-robin for Upstage)
-_llm_openrouter = None
-
-def get_llm():
-    global _llm_openrouter
+@functools.cache
+def _get_http_client() -> httpx.Client:
+    """Shared keep-alive connection pool for every ChatOpenAI client in this module"""
+    try:
+        import h2  # noqa: F401  (HTTP/2 needs the optional h2 package)
+        http2 = True
+    except ImportError:
+        http2 = False
+    return httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        timeout=60,
+    )
+
+
+# LLM clients (one per settings for OpenRouter, one per key for Upstage)
+# DICK_CAREY_JSON_MODE=1 requests provider JSON mode (response_format json_object)
+_llm_openrouter: dict[tuple, ChatOpenAI] = {}
+_JSON_MODE_KWARGS = {"response_format": {"type": "json_object"}}
+
+
+def get_llm(api_key: Optional[str] = None, json_mode: bool = False):
+    """Return the chat model, cached when DICK_CAREY_LLM_CACHE=1"""
     provider = os.getenv("MODEL_PROVIDER", "upstage")
-    model = os.getenv("MODEL_NAME") or os.getenv("DICK_CAREY_MODEL", "solar-mini")
+    temperature = llm_temperature()
 
     if provider == "openrouter":
-        if _llm_openrouter is None:
-            _llm_openrouter = ChatOpenAI(
+        model = os.getenv("MODEL_NAME") or os.getenv("DICK_CAREY_MODEL", "solar-mini")
+        client_key = (model, temperature, json_mode)
+        if client_key not in _llm_openrouter:
+            _llm_openrouter[client_key] = ChatOpenAI(
                 model=model,
-                temperature=0.7,
+                temperature=temperature,
                 api_key=os.getenv("OPENROUTER_API_KEY"),
                 base_url=OPENROUTER_BASE_URL,
+                model_kwargs=dict(_JSON_MODE_KWARGS) if json_mode else {},
+                http_client=_get_http_client(),
             )
-        return _llm_openrouter
-    else:  # upstage - create new client each time for round-robin
-        return ChatOpenAI(
-            model=os.getenv("DICK_CAREY_MODEL", "solar-mini"),
-            temperature=0.7,
-            api_key=_get_upstage_key(),
-            base_url=UPSTAGE_BASE_URL,
-        )
+        llm = _llm_openrouter[client_key]
+    else:  # upstage - one cached client per key, keys handed out round-robin
+        model = os.getenv("DICK_CAREY_MODEL", "solar-mini")
+        llm = _get_upstage_llm(api_key or get_upstage_key(), model, temperature, json_mode)
+    if cache_enabled():
+        return CachedLLM(llm, model, namespace=f"goal_analysis:{provider}")
+    return llm
+
+
+@functools.lru_cache(maxsize=16)
+def _get_upstage_llm(api_key: Optional[str], model: str, temperature: float, json_mode: bool) -> ChatOpenAI:
+    """Build the Upstage client for a key once instead of on every tool call"""
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        api_key=api_key,
+        base_url=UPSTAGE_BASE_URL,
+        model_kwargs=dict(_JSON_MODE_KWARGS) if json_mode else {},
+        http_client=_get_http_client(),
+    )
+
+
+def _invoke_with_key_rotation(messages: list, json_mode: bool) -> str:
+    """Invoke the LLM, moving on to the next Upstage key when one is rate limited"""
+    tokens = estimate_tokens(messages)
+    if os.getenv("MODEL_PROVIDER", "upstage") == "openrouter":
+        limiter_for("openrouter", os.getenv("OPENROUTER_API_KEY")).acquire(tokens)
+        return _complete(get_llm(json_mode=json_mode), messages)
+
+    pool = get_upstage_pool()
+    for attempt in range(len(pool)):
+        try:
+            with pool.lease() as key:
+                limiter_for("upstage", key).acquire(tokens)
+                return _complete(get_llm(api_key=key, json_mode=json_mode), messages)
+        except openai.RateLimitError:
+            if attempt == len(pool) - 1:
+                raise
+
+
+@functools.cache
+def _llm_semaphore() -> threading.BoundedSemaphore:
+    """Process-wide cap on in-flight LLM calls (LLM_MAX_CONCURRENCY, default 8)"""
+    return threading.BoundedSemaphore(int(os.getenv("LLM_MAX_CONCURRENCY", "8")))
+
+
+@retry(
+    wait=wait_exponential_jitter(initial=1, max=10),
+    stop=stop_after_attempt(3),
+    retry=retry_if_exception_type((openai.RateLimitError, openai.APITimeoutError)),
+    reraise=True,
+)
+def _call_llm(messages: list, json_mode: bool) -> str:
+    """Invoke the LLM under the concurrency cap, retrying transient failures with jittered backoff"""
+    with _llm_semaphore():
+        return _invoke_with_key_rotation(messages, json_mode)
+
+
+def _invoke_llm(system_prompt: str, prompt: str) -> str:
+    """Invoke the LLM with the system/user prompt pair and return the response text"""
+    # Static instructions go in the system message so providers can reuse the prompt prefix
+    messages = [SystemMessage(content=system_prompt), HumanMessage(content=prompt)]
+    if not _json_mode_enabled():
+        return _call_llm(messages, json_mode=False)
+    try:
+        return _call_llm(messages, json_mode=True)
+    except openai.BadRequestError:
+        # Model without JSON mode support: fall back to the fenced-JSON prompt path
+        return _call_llm(messages, json_mode=False)
 
 
-def parse_json_response(content: str) -> dict:
-    """Parse JSON from LLM response"""
-    json_match = content
-    if "```json" in content:
-        json_match = content.split("```json")[1].split("```")[0]
-    elif "```" in content:
-        json_match = content.split("```")[1].split("```")[0]
-    return json.loads(json_match.strip())
+# One repair round-trip for replies that are almost JSON, instead of the canned fallback
+_REPAIR_SYSTEM_PROMPT = """The following text was meant to be a single JSON object but is not valid JSON.
+Fix it so it is valid JSON with the same content. Return valid JSON only, no prose."""
+_REPAIR_MAX_CHARS = 8000
 
 
-# ========== Step 1: Instructional Goal Setting ==========
-@tool
-def set_instructional_goal(
-    learning_goals: List[str],
-    target_audience: str,
-    current_state: Optional[str] = None,
-    desired_state: Optional[str] = None,
-) -> dict:
-    """
-    Set instructional goals. (Dick & Carey Step 1)
+def _complete_json(system_prompt: str, prompt: str) -> dict:
+    """Invoke the LLM and parse its JSON, asking once for a repair if the reply does not parse"""
+    content = _invoke_llm(system_prompt, prompt)
+    try:
+        return parse_json_response(content)
+    except ValueError:
+        return parse_json_response(_invoke_llm(_REPAIR_SYSTEM_PROMPT, content[:_REPAIR_MAX_CHARS]))
 
-    Instructional goals state what learners should be able to perform after instruction.
-    Analyzes the gap between current state and desired state based on needs analysis results.
-    Includes sub-items A-1 through A-4.
 
-    Args:
-        learning_goals: List of learning goals
-        target_audience: Target learners
-        current_state: Current state description (optional)
-        desired_state: Desired state description (optional)
+# In-flight requests: concurrent calls with the same key wait for the first one's result
+_inflight: dict[str, list] = {}
+_inflight_lock = threading.Lock()
+
+
+def _complete_json_coalesced(key: str, system_prompt: str, prompt: str) -> dict:
+    """Run _complete_json once per key at a time; concurrent duplicates share the result"""
+    with _inflight_lock:
+        entry = _inflight.get(key)
+        if entry is None:
+            future: Future = Future()
+            _inflight[key] = [future, 0]
+        else:
+            entry[1] += 1
+    if entry is not None:
+        return copy.deepcopy(entry[0].result())
 
-    Returns:
-        Instructional goal setting results (goal_statement, target_domain, performance_gap, needs_analysis)
-    """
     try:
-        llm = get_llm()
+        result = _complete_json(system_prompt, prompt)
+    except BaseException as e:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        future.set_exception(e)
+        raise
+    with _inflight_lock:
+        _, waiters = _inflight.pop(key)
+    # Waiters copy from a snapshot so the caller can mutate its own result freely
+    future.set_result(copy.deepcopy(result) if waiters else result)
+    return result
 
-        prompt = f"""You are an expert in the Dick & Carey model. Set the Instructional Goal based on the following information.
 
-## Input Information
-- Learning Goals: {json.dumps(learning_goals, ensure_ascii=False)}
-- Target Audience: {target_audience}
-- Current State: {current_state or "Not specified"}
-- Desired State: {desired_state or "Not specified"}
+def _invoke_llm_json(tool_name: str, system_prompt: str, prompt: str) -> dict:
+    """Invoke the LLM and parse its JSON output; repeated prompts are served by the shared response cache"""
+    digest = hashlib.sha256(f"{system_prompt}\n{prompt}".encode()).hexdigest()
+    return _complete_json_coalesced(f"{tool_name}:{digest}", system_prompt, prompt)
+
+
+# ========== Step 1: Instructional Goal Setting ==========
+# Needs analysis shown in the prompt example
+_NEEDS_ANALYSIS_EXAMPLE = {
+    "gap_analysis": [
+        "Knowledge gap between current and target levels",
+        "Performance gap due to lack of practical application experience",
+    ],
+    "root_causes": [
+        "Lack of systematic training opportunities",
+        "Insufficient practical exercise environment",
+        "Absence of feedback and coaching",
+    ],
+    "training_needs": [
+        "Core concepts and principles learning",
+        "Practical application exercises",
+        "Problem-solving skill development",
+    ],
+    "non_training_solutions": [
+        "Provide work manuals and guides",
+        "Establish mentoring system",
+        "Improve performance management system",
+    ],
+    "priority_matrix": {
+        "high_impact_high_urgency": ["Core concept learning", "Practical application exercises"],
+        "high_impact_low_urgency": ["Advanced learning", "Advanced skill acquisition"],
+        "low_impact_high_urgency": ["Basic review"],
+        "low_impact_low_urgency": ["Reference material provision"],
+    },
+    "recommendation": "Educational solutions are most effective, combined with non-instructional support (manuals, mentoring) for sustained performance improvement",
+}
+
+_GOAL_EXAMPLE = {
+    "goal_statement": "After instruction, learners will be able to [specific performance].",
+    "target_domain": "cognitive",
+    "current_state": "Currently learners only understand basic concepts",
+    "desired_state": "Learners can independently apply knowledge in practice",
+    "performance_gap": "A gap exists between theoretical knowledge and practical application ability. Particularly lacking in problem-solving skills in real situations.",
+    "needs_analysis": _NEEDS_ANALYSIS_EXAMPLE,
+}
+
+_GOAL_SYSTEM_PROMPT = """You are an expert in the Dick & Carey model. Set the Instructional Goal based on the following information.
 
 ## Dick & Carey's Instructional Goal Setting Principles
 1. Clearly state what learners should be able to perform after instruction
@@ -128,47 +258,50 @@ def set_instructional_goal(
 
 ## Output Format (JSON)
 ```json
-{{
-  "goal_statement": "After instruction, learners will be able to [specific performance].",
-  "target_domain": "cognitive",
-  "current_state": "Currently learners only understand basic concepts",
-  "desired_state": "Learners can independently apply knowledge in practice",
-  "performance_gap": "A gap exists between theoretical knowledge and practical application ability. Particularly lacking in problem-solving skills in real situations.",
-  "needs_analysis": {{
-    "gap_analysis": [
-      "Knowledge gap between current and target levels",
-      "Performance gap due to lack of practical application experience"
-    ],
-    "root_causes": [
-      "Lack of systematic training opportunities",
-      "Insufficient practical exercise environment",
-      "Absence of feedback and coaching"
-    ],
-    "training_needs": [
-      "Core concepts and principles learning",
-      "Practical application exercises",
-      "Problem-solving skill development"
-    ],
-    "non_training_solutions": [
-      "Provide work manuals and guides",
-      "Establish mentoring system",
-      "Improve performance management system"
-    ],
-    "priority_matrix": {{
-      "high_impact_high_urgency": ["Core concept learning", "Practical application exercises"],
-      "high_impact_low_urgency": ["Advanced learning", "Advanced skill acquisition"],
-      "low_impact_high_urgency": ["Basic review"],
-      "low_impact_low_urgency": ["Reference material provision"]
-    }},
-    "recommendation": "Educational solutions are most effective, combined with non-instructional support (manuals, mentoring) for sustained performance improvement"
-  }}
-}}
+""" + _render_example(_GOAL_EXAMPLE) + """
 ```
 
 Output JSON only."""
 
-        response = llm.invoke(prompt)
-        return parse_json_response(response.content)
+_GOAL_USER_TEMPLATE = """## Input Information
+- Learning Goals: {learning_goals_json}
+- Target Audience: {target_audience}
+- Current State: {current_state}
+- Desired State: {desired_state}"""
+
+
+@tool
+def set_instructional_goal(
+    learning_goals: List[str],
+    target_audience: str,
+    current_state: Optional[str] = None,
+    desired_state: Optional[str] = None,
+) -> dict:
+    """
+    Set instructional goals. (Dick & Carey Step 1)
+
+    Instructional goals state what learners should be able to perform after instruction.
+    Analyzes the gap between current state and desired state based on needs analysis results.
+    Includes sub-items A-1 through A-4.
+
+    Args:
+        learning_goals: List of learning goals
+        target_audience: Target learners
+        current_state: Current state description (optional)
+        desired_state: Desired state description (optional)
+
+    Returns:
+        Instructional goal setting results (goal_statement, target_domain, performance_gap, needs_analysis)
+    """
+    try:
+        prompt = _GOAL_USER_TEMPLATE.format_map({
+            "learning_goals_json": _dumps_cached(learning_goals),
+            "target_audience": target_audience,
+            "current_state": current_state or "Not specified",
+            "desired_state": desired_state or "Not specified",
+        })
+
+        return _invoke_llm_json("set_instructional_goal", _GOAL_SYSTEM_PROMPT, prompt)
     except Exception:
         return _fallback_set_instructional_goal(learning_goals, target_audience, current_state, desired_state)
 
@@ -220,35 +353,54 @@ def _fallback_set_instructional_goal(
 
 
 # ========== Step 2: Instructional Analysis ==========
-@tool
-def analyze_instruction(
-    instructional_goal: str,
-    domain: Optional[str] = None,
-    learning_goals: Optional[List[str]] = None,
-) -> dict:
-    """
-    Conduct instructional analysis. (Dick & Carey Step 2)
-
-    Analyzes sub-skills and procedures needed to achieve instructional goal.
-    Identifies task type (procedural, hierarchical, combination, cluster) and constructs skill hierarchy.
-
-    Args:
-        instructional_goal: Instructional goal statement
-        domain: Educational domain (optional)
-        learning_goals: Detailed learning goals list (optional)
+# Sub-skill names, types and prerequisite positions shared by the prompt example and the fallback
+_SUB_SKILL_SPECS = (
+    ("Core concept understanding", "intellectual skill", ()),
+    ("Case analysis", "intellectual skill", (0,)),
+    ("Problem diagnosis", "cognitive strategy", (0, 1)),
+    ("Solution design", "intellectual skill", (2,)),
+    ("Result evaluation", "cognitive strategy", (3,)),
+)
+
+
+def _build_sub_skill(index: int, descriptions: tuple) -> dict:
+    """Build one sub_skills entry from its spec and the sub-skill descriptions"""
+    name, skill_type, prerequisites = _SUB_SKILL_SPECS[index]
+    return {
+        "skill_name": name,
+        "description": descriptions[index],
+        "type": skill_type,
+        "prerequisites": [descriptions[i] for i in prerequisites],
+    }
 
-    Returns:
-        Instructional analysis results (task_type, sub_skills, skill_hierarchy, entry_skills)
-    """
-    try:
-        llm = get_llm()
 
-        prompt = f"""You are an expert in the Dick & Carey model. Conduct an Instructional Analysis for the following instructional goal.
+def _build_skill_structure(descriptions: tuple) -> tuple[list, dict]:
+    """Build sub_skills and skill_hierarchy from the five sub-skill descriptions"""
+    sub_skills = [_build_sub_skill(index, descriptions) for index in range(len(_SUB_SKILL_SPECS))]
+    skill_hierarchy = {f"level_{level}": [description] for level, description in enumerate(descriptions, 1)}
+    return sub_skills, skill_hierarchy
+
+
+_EXAMPLE_SUB_SKILLS, _EXAMPLE_SKILL_HIERARCHY = _build_skill_structure((
+    "Can explain core concepts",
+    "Can analyze related cases",
+    "Can diagnose problem situations",
+    "Can design solutions",
+    "Can evaluate results and make improvements",
+))
+
+_ANALYSIS_EXAMPLE = {
+    "task_type": "combination",
+    "sub_skills": _EXAMPLE_SUB_SKILLS,
+    "skill_hierarchy": _EXAMPLE_SKILL_HIERARCHY,
+    "entry_skills": [
+        "Basic terminology understanding",
+        "Basic computer literacy",
+    ],
+    "review_summary": "Task analysis resulted in 5 sub-skills with a combination (procedural + hierarchical) structure. Achieving the instructional goal requires step-by-step learning from basic concept understanding to result evaluation. Entry skills require basic terminology understanding and computer literacy, enabling systematic instructional design.",
+}
 
-## Input Information
-- Instructional Goal: {instructional_goal}
-- Domain: {domain or "General"}
-- Detailed Goals: {json.dumps(learning_goals, ensure_ascii=False) if learning_goals else "Not specified"}
+_ANALYSIS_SYSTEM_PROMPT = """You are an expert in the Dick & Carey model. Conduct an Instructional Analysis for the following instructional goal.
 
 ## Dick & Carey's Instructional Analysis Principles
 1. Task Type Classification:
@@ -275,59 +427,45 @@ def analyze_instruction(
 - Must include review_summary field with task analysis review.
 
 ```json
-{{
-  "task_type": "combination",
-  "sub_skills": [
-    {{
-      "skill_name": "Core concept understanding",
-      "description": "Can explain core concepts",
-      "type": "intellectual skill",
-      "prerequisites": []
-    }},
-    {{
-      "skill_name": "Case analysis",
-      "description": "Can analyze related cases",
-      "type": "intellectual skill",
-      "prerequisites": ["Can explain core concepts"]
-    }},
-    {{
-      "skill_name": "Problem diagnosis",
-      "description": "Can diagnose problem situations",
-      "type": "cognitive strategy",
-      "prerequisites": ["Can explain core concepts", "Can analyze related cases"]
-    }},
-    {{
-      "skill_name": "Solution design",
-      "description": "Can design solutions",
-      "type": "intellectual skill",
-      "prerequisites": ["Can diagnose problem situations"]
-    }},
-    {{
-      "skill_name": "Result evaluation",
-      "description": "Can evaluate results and make improvements",
-      "type": "cognitive strategy",
-      "prerequisites": ["Can design solutions"]
-    }}
-  ],
-  "skill_hierarchy": {{
-    "level_1": ["Can explain core concepts"],
-    "level_2": ["Can analyze related cases"],
-    "level_3": ["Can diagnose problem situations"],
-    "level_4": ["Can design solutions"],
-    "level_5": ["Can evaluate results and make improvements"]
-  }},
-  "entry_skills": [
-    "Basic terminology understanding",
-    "Basic computer literacy"
-  ],
-  "review_summary": "Task analysis resulted in 5 sub-skills with a combination (procedural + hierarchical) structure. Achieving the instructional goal requires step-by-step learning from basic concept understanding to result evaluation. Entry skills require basic terminology understanding and computer literacy, enabling systematic instructional design."
-}}
+""" + _render_example(_ANALYSIS_EXAMPLE) + """
 ```
 
 Output JSON only."""
 
-        response = llm.invoke(prompt)
-        return parse_json_response(response.content)
+_ANALYSIS_USER_TEMPLATE = """## Input Information
+- Instructional Goal: {instructional_goal}
+- Domain: {domain}
+- Detailed Goals: {learning_goals_json}"""
+
+
+@tool
+def analyze_instruction(
+    instructional_goal: str,
+    domain: Optional[str] = None,
+    learning_goals: Optional[List[str]] = None,
+) -> dict:
+    """
+    Conduct instructional analysis. (Dick & Carey Step 2)
+
+    Analyzes sub-skills and procedures needed to achieve instructional goal.
+    Identifies task type (procedural, hierarchical, combination, cluster) and constructs skill hierarchy.
+
+    Args:
+        instructional_goal: Instructional goal statement
+        domain: Educational domain (optional)
+        learning_goals: Detailed learning goals list (optional)
+
+    Returns:
+        Instructional analysis results (task_type, sub_skills, skill_hierarchy, entry_skills)
+    """
+    try:
+        prompt = _ANALYSIS_USER_TEMPLATE.format_map({
+            "instructional_goal": instructional_goal,
+            "domain": domain or "General",
+            "learning_goals_json": _dumps_cached(learning_goals) if learning_goals else "Not specified",
+        })
+
+        return _invoke_llm_json("analyze_instruction", _ANALYSIS_SYSTEM_PROMPT, prompt)
     except Exception:
         return _fallback_analyze_instruction(instructional_goal, domain, learning_goals)
 
@@ -371,34 +509,7 @@ def _fallback_analyze_instruction(
 
 
 # ========== Step 3: Entry Behaviors & Context Analysis ==========
-@tool
-def analyze_entry_behaviors(
-    target_audience: str,
-    prior_knowledge: Optional[str] = None,
-    entry_skills: Optional[List[str]] = None,
-) -> dict:
-    """
-    Analyze learner entry behaviors. (Dick & Carey Step 3 - Learner Analysis)
-
-    Analyzes knowledge, skills, and attitudes learners should possess before instruction begins.
-
-    Args:
-        target_audience: Target learners
-        prior_knowledge: Prior knowledge level (optional)
-        entry_skills: Entry skills list (optional)
-
-    Returns:
-        Learner analysis results (entry_behaviors, characteristics, learning_preferences, motivation)
-    """
-    try:
-        llm = get_llm()
-
-        prompt = f"""You are an expert in the Dick & Carey model. Analyze the learner's Entry Behaviors.
-
-## Input Information
-- Target Audience: {target_audience}
-- Prior Knowledge: {prior_knowledge or "Not specified"}
-- Entry Skills: {json.dumps(entry_skills, ensure_ascii=False) if entry_skills else "Not specified"}
+_ENTRY_BEHAVIORS_SYSTEM_PROMPT = """You are an expert in the Dick & Carey model. Analyze the learner's Entry Behaviors.
 
 ## Dick & Carey's Learner Analysis Principles
 1. Entry Behaviors: Skills learners should possess before instruction begins
@@ -416,8 +527,8 @@ def analyze_entry_behaviors(
 
 ## Output Format (JSON)
 ```json
-{{
-  "target_audience": "{target_audience}",
+{
+  "target_audience": "[Target Audience from the input]",
   "entry_behaviors": [
     "Understands basic terminology",
     "Has foundational knowledge in related field",
@@ -438,13 +549,44 @@ def analyze_entry_behaviors(
     "Collaborative learning activities"
   ],
   "motivation": "Strong intrinsic motivation for competency improvement. Clear purpose to acquire knowledge applicable to actual work."
-}}
+}
 ```
 
 Output JSON only."""
 
-        response = llm.invoke(prompt)
-        return parse_json_response(response.content)
+_ENTRY_BEHAVIORS_USER_TEMPLATE = """## Input Information
+- Target Audience: {target_audience}
+- Prior Knowledge: {prior_knowledge}
+- Entry Skills: {entry_skills_json}"""
+
+
+@tool
+def analyze_entry_behaviors(
+    target_audience: str,
+    prior_knowledge: Optional[str] = None,
+    entry_skills: Optional[List[str]] = None,
+) -> dict:
+    """
+    Analyze learner entry behaviors. (Dick & Carey Step 3 - Learner Analysis)
+
+    Analyzes knowledge, skills, and attitudes learners should possess before instruction begins.
+
+    Args:
+        target_audience: Target learners
+        prior_knowledge: Prior knowledge level (optional)
+        entry_skills: Entry skills list (optional)
+
+    Returns:
+        Learner analysis results (entry_behaviors, characteristics, learning_preferences, motivation)
+    """
+    try:
+        prompt = _ENTRY_BEHAVIORS_USER_TEMPLATE.format_map({
+            "target_audience": target_audience,
+            "prior_knowledge": prior_knowledge or "Not specified",
+            "entry_skills_json": _dumps_cached(entry_skills) if entry_skills else "Not specified",
+        })
+
+        return _invoke_llm_json("analyze_entry_behaviors", _ENTRY_BEHAVIORS_SYSTEM_PROMPT, prompt)
     except Exception:
         return _fallback_analyze_entry_behaviors(target_audience, prior_knowledge, entry_skills)
 
@@ -475,40 +617,7 @@ def _fallback_analyze_entry_behaviors(
     }
 
 
-@tool
-def analyze_context(
-    learning_environment: str,
-    duration: str,
-    performance_context: Optional[str] = None,
-    class_size: Optional[int] = None,
-    resources: Optional[List[str]] = None,
-) -> dict:
-    """
-    Analyze learning and performance context. (Dick & Carey Step 3 - Context Analysis)
-
-    Analyzes the environment where learning takes place and the performance environment where learning outcomes are applied.
-
-    Args:
-        learning_environment: Learning environment (e.g., "online", "in-person", "blended")
-        duration: Learning duration
-        performance_context: Performance environment - where learning outcomes are applied (optional)
-        class_size: Number of learners (optional)
-        resources: Available resources list (optional)
-
-    Returns:
-        Context analysis results (performance_context, learning_context, constraints, resources, technical_requirements)
-    """
-    try:
-        llm = get_llm()
-
-        prompt = f"""You are an expert in the Dick & Carey model. Analyze the learning and performance context.
-
-## Input Information
-- Learning Environment: {learning_environment}
-- Duration: {duration}
-- Performance Context: {performance_context or "Not specified"}
-- Number of Learners: {class_size or "Not specified"}
-- Available Resources: {json.dumps(resources, ensure_ascii=False) if resources else "Not specified"}
+_CONTEXT_SYSTEM_PROMPT = """You are an expert in the Dick & Carey model. Analyze the learning and performance context.
 
 ## Dick & Carey's Context Analysis Principles
 1. Performance Context: Environment where learning outcomes are actually applied
@@ -524,9 +633,9 @@ def analyze_context(
 
 ## Output Format (JSON)
 ```json
-{{
+{
   "performance_context": "Learners will apply acquired skills in actual work settings. Problem-solving in various situations is required.",
-  "learning_context": "Learning will be conducted in {learning_environment} environment for {duration}. Individual and group activities will be combined.",
+  "learning_context": "Learning will be conducted in [learning environment] environment for [duration]. Individual and group activities will be combined.",
   "constraints": [
     "Limited learning time",
     "Varying skill levels among learners",
@@ -542,17 +651,79 @@ def analyze_context(
     "Stable internet connection",
     "Device with access to learning platform"
   ]
-}}
+}
 ```
 
 Output JSON only."""
 
-        response = llm.invoke(prompt)
-        return parse_json_response(response.content)
+_CONTEXT_USER_TEMPLATE = """## Input Information
+- Learning Environment: {learning_environment}
+- Duration: {duration}
+- Performance Context: {performance_context}
+- Number of Learners: {class_size}
+- Available Resources: {resources_json}"""
+
+
+@tool
+def analyze_context(
+    learning_environment: str,
+    duration: str,
+    performance_context: Optional[str] = None,
+    class_size: Optional[int] = None,
+    resources: Optional[List[str]] = None,
+) -> dict:
+    """
+    Analyze learning and performance context. (Dick & Carey Step 3 - Context Analysis)
+
+    Analyzes the environment where learning takes place and the performance environment where learning outcomes are applied.
+
+    Args:
+        learning_environment: Learning environment (e.g., "online", "in-person", "blended")
+        duration: Learning duration
+        performance_context: Performance environment - where learning outcomes are applied (optional)
+        class_size: Number of learners (optional)
+        resources: Available resources list (optional)
+
+    Returns:
+        Context analysis results (performance_context, learning_context, constraints, resources, technical_requirements)
+    """
+    try:
+        prompt = _CONTEXT_USER_TEMPLATE.format_map({
+            "learning_environment": learning_environment,
+            "duration": duration,
+            "performance_context": performance_context or "Not specified",
+            "class_size": class_size or "Not specified",
+            "resources_json": _dumps_cached(resources) if resources else "Not specified",
+        })
+
+        return _invoke_llm_json("analyze_context", _CONTEXT_SYSTEM_PROMPT, prompt)
     except Exception:
         return _fallback_analyze_context(learning_environment, duration, performance_context, class_size, resources)
 
 
+# Learning environment keyword -> (extra constraints, technical requirements, default resources)
+# Checked in order; "online" wins for environments that mention several keywords
+_IN_PERSON_PROFILE = (
+    ("Physical space constraints",),
+    ("Projector/screen", "Classroom reservation"),
+    ("Textbooks", "Presentations", "Practice materials", "Whiteboard"),
+)
+_ENV_PROFILES = {
+    "online": (
+        ("Dependency on technical environment",),
+        ("Stable internet connection", "Video conferencing tools"),
+        ("LMS", "Video conferencing", "Recorded materials", "Online practice environment"),
+    ),
+    "in-person": _IN_PERSON_PROFILE,
+    "face-to-face": _IN_PERSON_PROFILE,
+}
+_DEFAULT_ENV_PROFILE = (
+    (),
+    ("Learning platform access",),
+    ("Learning materials", "Practice environment", "Feedback system"),
+)
+
+
 def _fallback_analyze_context(
     learning_environment: str,
     duration: str,
@@ -563,24 +734,12 @@ def _fallback_analyze_context(
     """Fallback function when LLM fails"""
     env_lower = learning_environment.lower()
 
-    constraints = ["Limited learning time", "Varying skill levels among learners"]
-    technical_requirements = ["Learning platform access"]
-    available_resources = resources or []
-
-    if "online" in env_lower:
-        constraints.append("Dependency on technical environment")
-        technical_requirements = ["Stable internet connection", "Video conferencing tools"]
-        if not available_resources:
-            available_resources = ["LMS", "Video conferencing", "Recorded materials", "Online practice environment"]
-    elif "in-person" in env_lower or "face-to-face" in env_lower:
-        constraints.append("Physical space constraints")
-        technical_requirements = ["Projector/screen", "Classroom reservation"]
-        if not available_resources:
-            available_resources = ["Textbooks", "Presentations", "Practice materials", "Whiteboard"]
-    else:
-        if not available_resources:
-            available_resources = ["Learning materials", "Practice environment", "Feedback system"]
+    extra_constraints, technical_requirements, default_resources = next(
+        (profile for keyword, profile in _ENV_PROFILES.items() if keyword in env_lower),
+        _DEFAULT_ENV_PROFILE,
+    )
 
+    constraints = ["Limited learning time", "Varying skill levels among learners", *extra_constraints]
     if class_size and class_size > 30:
         constraints.append("Large group management needed")
 
@@ -588,6 +747,134 @@ def _fallback_analyze_context(
         "performance_context": performance_context or "Learning content will be applied in actual work settings",
         "learning_context": f"Learning will be conducted in {learning_environment} environment for {duration}",
         "constraints": constraints,
-        "resources": available_resources,
-        "technical_requirements": technical_requirements,
+        "resources": resources or list(default_resources),
+        "technical_requirements": list(technical_requirements),
     }
+
+
+# ========== Steps 1 & 3: Fused Goal / Learner / Context Analysis ==========
+_BUNDLE_SYSTEM_PROMPT = f"""You are an expert in the Dick & Carey model. Complete the three analyses below in a single response.
+
+# Part 1: goal
+{_GOAL_SYSTEM_PROMPT}
+
+# Part 2: entry_behaviors
+{_ENTRY_BEHAVIORS_SYSTEM_PROMPT}
+
+# Part 3: context
+{_CONTEXT_SYSTEM_PROMPT}
+
+## Combined Output Format (JSON)
+Return ONE JSON object with exactly three keys, each holding the JSON described in its part:
+```json
+{{"goal": {{...}}, "entry_behaviors": {{...}}, "context": {{...}}}}
+```
+
+Output JSON only."""
+
+_BUNDLE_USER_TEMPLATE = """# Part 1: goal
+{goal_prompt}
+
+# Part 2: entry_behaviors
+{entry_behaviors_prompt}
+
+# Part 3: context
+{context_prompt}"""
+
+_BUNDLE_KEYS = ("goal", "entry_behaviors", "context")
+
+
+@tool
+def analyze_goal_and_context_bundle(
+    learning_goals: List[str],
+    target_audience: str,
+    learning_environment: str,
+    duration: str,
+    current_state: Optional[str] = None,
+    prior_knowledge: Optional[str] = None,
+    performance_context: Optional[str] = None,
+    class_size: Optional[int] = None,
+    resources: Optional[List[str]] = None,
+) -> dict:
+    """
+    Set the instructional goal and analyze learners and context in one LLM call. (Dick & Carey Steps 1 & 3)
+
+    Entry behaviors are analyzed without the entry skills from Step 2, which is not yet available.
+
+    Args:
+        learning_goals: List of learning goals
+        target_audience: Target learners
+        learning_environment: Learning environment (e.g., "online", "in-person", "blended")
+        duration: Learning duration
+        current_state: Current state description (optional)
+        prior_knowledge: Prior knowledge level (optional)
+        performance_context: Performance environment (optional)
+        class_size: Number of learners (optional)
+        resources: Available resources list (optional)
+
+    Returns:
+        Dict with "goal", "entry_behaviors" and "context" results; parts the model did not
+        return are omitted so callers can fall back to the individual tools
+    """
+    try:
+        goal_prompt = _GOAL_USER_TEMPLATE.format_map({
+            "learning_goals_json": _dumps_cached(learning_goals),
+            "target_audience": target_audience,
+            "current_state": current_state or "Not specified",
+            "desired_state": "Not specified",
+        })
+        entry_behaviors_prompt = _ENTRY_BEHAVIORS_USER_TEMPLATE.format_map({
+            "target_audience": target_audience,
+            "prior_knowledge": prior_knowledge or "Not specified",
+            "entry_skills_json": "Not specified",
+        })
+        context_prompt = _CONTEXT_USER_TEMPLATE.format_map({
+            "learning_environment": learning_environment,
+            "duration": duration,
+            "performance_context": performance_context or "Not specified",
+            "class_size": class_size or "Not specified",
+            "resources_json": _dumps_cached(resources) if resources else "Not specified",
+        })
+        prompt = _BUNDLE_USER_TEMPLATE.format(
+            goal_prompt=goal_prompt,
+            entry_behaviors_prompt=entry_behaviors_prompt,
+            context_prompt=context_prompt,
+        )
+
+        result = _invoke_llm_json("analyze_goal_and_context_bundle", _BUNDLE_SYSTEM_PROMPT, prompt)
+    except Exception:
+        return {}
+
+    return {k: result[k] for k in _BUNDLE_KEYS if isinstance(result.get(k), dict) and result[k]}
+
+
+# ========== Batch Helpers ==========
+async def _run_batch(tool_fn, items: List[dict]) -> List[dict]:
+    """Run a tool over many inputs concurrently, at most LLM_MAX_CONCURRENCY at a time"""
+    semaphore = asyncio.Semaphore(int(os.getenv("LLM_MAX_CONCURRENCY", "8")))
+
+    async def run_one(item: dict) -> dict:
+        async with semaphore:
+            return await tool_fn.ainvoke(item)
+
+    return await asyncio.gather(*(run_one(item) for item in items))
+
+
+async def set_instructional_goal_batch(items: List[dict]) -> List[dict]:
+    """Run set_instructional_goal for each input dict; results keep the input order"""
+    return await _run_batch(set_instructional_goal, items)
+
+
+async def analyze_instruction_batch(items: List[dict]) -> List[dict]:
+    """Run analyze_instruction for each input dict; results keep the input order"""
+    return await _run_batch(analyze_instruction, items)
+
+
+async def analyze_entry_behaviors_batch(items: List[dict]) -> List[dict]:
+    """Run analyze_entry_behaviors for each input dict; results keep the input order"""
+    return await _run_batch(analyze_entry_behaviors, items)
+
+
+async def analyze_context_batch(items: List[dict]) -> List[dict]:
+    """Run analyze_context for each input dict; results keep the input order"""
+    return await _run_batch(analyze_context, items)
@@ -6,109 +6,109 @@ Dick & Carey Model's Steps 4-5:
 5. Assessment Instruments
 """
 
-import json
+import asyncio
+import copy
+import itertools
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
+
+import openai
+import orjson
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.tools import tool
 from langchain_openai import ChatOpenAI
 
+from ._completion import _acomplete, _complete, _json_mode_enabled
+from ._json import _dumps, _render_example, parse_json_response
+from ._keypool import get_upstage_key
+from ._llm_cache import CachedLLM, cache_enabled, llm_temperature
+from ._ratelimit import RateLimitedLLM, limiter_for
+
 
 # API URLs
 UPSTAGE_BASE_URL = "https://api.upstage.ai/v1/solar"
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
-# Round-robin for Upstage API keys
-_upstage_keys = None
-_upstage_idx = 0
-_upstage_lock = None
-
-def _get_upstage_key():
-    """Get Upstage API key with round-robin"""
-    global _upstage_keys, _upstage_idx, _upstage_lock
-    import threading
-    if _upstage_lock is None:
-        _upstage_lock = threading.Lock()
-    if _upstage_keys is None:
-        keys = []
-        for env in ["UPSTAGE_API_KEY", "UPSTAGE_API_KEY2", "UPSTAGE_API_KEY3"]:
-            k = os.getenv(env)
-            if k:
-                keys.append(k)
-        _upstage_keys = keys if keys else [None]
-    with _upstage_lock:
-        key = _upstage_keys[_upstage_idx % len(_upstage_keys)]
-        _upstage_idx += 1
-        return key
-
-# LLM client (singleton for OpenRouter, round-robin for Upstage)
-_llm_openrouter = None
-
-def get_llm():
-    global _llm_openrouter
-    provider = os.getenv("MODEL_PROVIDER", "upstage")
-    model = os.getenv("MODEL_NAME") or os.getenv("DICK_CAREY_MODEL", "solar-mini")
+# LLM clients (one per settings for OpenRouter, one warm client per key for Upstage)
+_llm_openrouter: dict[tuple, ChatOpenAI] = {}
+_upstage_clients: dict[tuple, ChatOpenAI] = {}
+_JSON_MODE_KWARGS = {"response_format": {"type": "json_object"}}
 
-    if provider == "openrouter":
-        if _llm_openrouter is None:
-            _llm_openrouter = ChatOpenAI(
-                model=model,
-                temperature=0.7,
-                api_key=os.getenv("OPENROUTER_API_KEY"),
-                base_url=OPENROUTER_BASE_URL,
-            )
-        return _llm_openrouter
-    else:  # upstage - create new client each time for round-robin
-        return ChatOpenAI(
-            model=os.getenv("DICK_CAREY_MODEL", "solar-mini"),
-            temperature=0.7,
-            api_key=_get_upstage_key(),
-            base_url=UPSTAGE_BASE_URL,
-        )
 
+# Provider/model settings, read once instead of on every call; refresh_config() re-reads them
+_provider = "upstage"
+_openrouter_model = "solar-mini"
+_upstage_model = "solar-mini"
+_openrouter_api_key = None
 
-def parse_json_response(content: str) -> dict:
-    """Parse JSON from LLM response"""
-    json_match = content
-    if "```json" in content:
-        json_match = content.split("```json")[1].split("```")[0]
-    elif "```" in content:
-        json_match = content.split("```")[1].split("```")[0]
-    return json.loads(json_match.strip())
 
+def refresh_config() -> None:
+    """Re-read MODEL_PROVIDER / MODEL_NAME / DICK_CAREY_MODEL / OPENROUTER_API_KEY from the environment"""
+    global _provider, _openrouter_model, _upstage_model, _openrouter_api_key
+    _provider = os.getenv("MODEL_PROVIDER", "upstage")
+    _openrouter_model = os.getenv("MODEL_NAME") or os.getenv("DICK_CAREY_MODEL", "solar-mini")
+    _upstage_model = os.getenv("DICK_CAREY_MODEL", "solar-mini")
+    _openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
 
-# ========== Step 4: Performance Objectives ==========
-@tool
-def write_performance_objectives(
-    instructional_goal: str,
-    sub_skills: List[dict],
-    target_audience: str,
-) -> dict:
-    """
-    Write performance objectives. (Dick & Carey Step 4)
 
-    Write specific and measurable performance objectives in ABCD format.
-    - A (Audience): Target learners
-    - B (Behavior): Observable behavior
-    - C (Condition): Performance conditions
-    - D (Degree): Achievement criteria
+refresh_config()
 
-    Args:
-        instructional_goal: Instructional goal
-        sub_skills: Sub-skills list
-        target_audience: Target learners
 
-    Returns:
-        Performance objectives result (terminal_objective, enabling_objectives)
-    """
-    try:
-        llm = get_llm()
+def get_llm(json_mode: bool = False):
+    """Return the chat model, paced by the key's rate limiter and cached when DICK_CAREY_LLM_CACHE=1"""
+    provider = _provider
+    if provider == "openrouter":
+        model, api_key = _openrouter_model, _openrouter_api_key
+        clients, base_url = _llm_openrouter, OPENROUTER_BASE_URL
+    else:  # upstage - round-robin over keys, reusing each key's client and connection pool
+        model, api_key = _upstage_model, get_upstage_key()
+        clients, base_url = _upstage_clients, UPSTAGE_BASE_URL
+    client_key = (api_key, model, llm_temperature(), json_mode)
+    llm = clients.get(client_key)
+    if llm is None:
+        llm = clients.setdefault(client_key, ChatOpenAI(
+            model=model,
+            temperature=llm_temperature(),
+            api_key=api_key,
+            base_url=base_url,
+            model_kwargs=dict(_JSON_MODE_KWARGS) if json_mode else {},
+        ))
+    limiter = limiter_for(provider, api_key)
+    if limiter.enabled:
+        llm = RateLimitedLLM(llm, limiter)
+    if cache_enabled():
+        return CachedLLM(llm, model, namespace="objective_assessment")
+    return llm
+
+
+def _generate(prompt) -> str:
+    """Run a prompt (string or message list), asking for provider JSON mode first when DICK_CAREY_JSON_MODE=1"""
+    if _json_mode_enabled():
+        try:
+            return _complete(get_llm(json_mode=True), prompt)
+        except openai.BadRequestError:
+            # Model without JSON mode support: fall back to the fenced-JSON prompt path
+            pass
+    return _complete(get_llm(), prompt)
+
+
+async def _agenerate(prompt) -> str:
+    """Async variant of _generate"""
+    if _json_mode_enabled():
+        try:
+            return await _acomplete(get_llm(json_mode=True), prompt)
+        except openai.BadRequestError:
+            pass
+    return await _acomplete(get_llm(), prompt)
 
-        prompt = f"""You are an expert in the Dick & Carey model. Write Performance Objectives based on the following information.
 
-## Input Information
-- Instructional Goal: {instructional_goal}
-- Sub-skills: {json.dumps(sub_skills, ensure_ascii=False)}
-- Target Audience: {target_audience}
+# ========== Step 4: Performance Objectives ==========
+# Static instructions and example go in the system message, which is byte-identical across calls
+# so providers with prompt-prefix caching can reuse it; only the inputs vary in the user message
+_PERFORMANCE_OBJECTIVES_SYSTEM_PROMPT = """You are an expert in the Dick & Carey model. Write Performance Objectives based on the information provided by the user.
 
 ## Dick & Carey's Performance Objective Principles (ABCD)
 - A (Audience): Specify target learners
@@ -127,168 +127,378 @@ def write_performance_objectives(
 **Important**:
 - Use objective_name field instead of id field.
 - Use actual sub-skill description text in sub_skill_id.
+- Use the given Target Audience in audience and statement.
 
 ```json
-{{
-  "terminal_objective": {{
+{
+  "terminal_objective": {
     "objective_name": "Comprehensive performance objective",
-    "audience": "{target_audience}",
+    "audience": "[Target Audience]",
     "behavior": "Can independently perform given tasks",
     "condition": "When provided with relevant materials and tools",
     "degree": "90% or higher accuracy, within time limit",
-    "statement": "{target_audience} can independently perform given tasks when provided with relevant materials and tools. (90% or higher accuracy, within time limit)",
+    "statement": "[Target Audience] can independently perform given tasks when provided with relevant materials and tools. (90% or higher accuracy, within time limit)",
     "sub_skill_id": "Comprehensive task performance",
     "bloom_level": "Apply"
-  }},
+  },
   "enabling_objectives": [
-    {{
+    {
       "objective_name": "Core concept understanding objective",
-      "audience": "{target_audience}",
+      "audience": "[Target Audience]",
       "behavior": "Can define and explain core concepts",
       "condition": "Without textbooks or reference materials",
       "degree": "At least 5 key concepts accurately",
-      "statement": "{target_audience} can accurately define and explain at least 5 core concepts without textbooks or reference materials.",
+      "statement": "[Target Audience] can accurately define and explain at least 5 core concepts without textbooks or reference materials.",
       "sub_skill_id": "Can explain core concepts",
       "bloom_level": "Understand"
-    }},
-    {{
+    },
+    {
       "objective_name": "Case analysis objective",
-      "audience": "{target_audience}",
+      "audience": "[Target Audience]",
       "behavior": "Can analyze given cases",
       "condition": "When provided with an analysis framework",
       "degree": "Identify at least 3 key elements",
-      "statement": "{target_audience} can identify at least 3 key elements from given cases when provided with an analysis framework.",
+      "statement": "[Target Audience] can identify at least 3 key elements from given cases when provided with an analysis framework.",
       "sub_skill_id": "Can analyze related cases",
       "bloom_level": "Analyze"
-    }},
-    {{
+    },
+    {
       "objective_name": "Problem diagnosis objective",
-      "audience": "{target_audience}",
+      "audience": "[Target Audience]",
       "behavior": "Can diagnose problem situations",
       "condition": "In real or simulated situations",
       "degree": "Accurately identify at least 2 problems",
-      "statement": "{target_audience} can accurately diagnose at least 2 problems in real or simulated situations.",
+      "statement": "[Target Audience] can accurately diagnose at least 2 problems in real or simulated situations.",
       "sub_skill_id": "Can diagnose problem situations",
       "bloom_level": "Analyze"
-    }},
-    {{
+    },
+    {
       "objective_name": "Solution design objective",
-      "audience": "{target_audience}",
+      "audience": "[Target Audience]",
       "behavior": "Can design and apply solutions",
       "condition": "Under limited resource conditions",
       "degree": "At least 1 feasible solution",
-      "statement": "{target_audience} can design and apply at least one feasible solution under limited resource conditions.",
+      "statement": "[Target Audience] can design and apply at least one feasible solution under limited resource conditions.",
       "sub_skill_id": "Can design solutions",
       "bloom_level": "Apply"
-    }},
-    {{
+    },
+    {
       "objective_name": "Result evaluation objective",
-      "audience": "{target_audience}",
+      "audience": "[Target Audience]",
       "behavior": "Can evaluate results and suggest improvements",
       "condition": "When provided with evaluation criteria",
       "degree": "Identify at least 2 improvements",
-      "statement": "{target_audience} can evaluate results and suggest at least 2 improvements when provided with evaluation criteria.",
+      "statement": "[Target Audience] can evaluate results and suggest at least 2 improvements when provided with evaluation criteria.",
       "sub_skill_id": "Can evaluate results and make improvements",
       "bloom_level": "Evaluate"
-    }}
+    }
   ]
-}}
+}
 ```
 
 Output JSON only."""
 
-        response = llm.invoke(prompt)
-        return parse_json_response(response.content)
+_PERFORMANCE_OBJECTIVES_USER_TEMPLATE = """## Input Information
+- Instructional Goal: {instructional_goal}
+- Sub-skills: {sub_skills_json}
+- Target Audience: {target_audience}"""
+
+
+def _performance_objectives_messages(
+    instructional_goal: str,
+    sub_skills: List[dict],
+    target_audience: str,
+) -> list:
+    """Build the performance objectives messages (shared by the sync and async tool paths)"""
+    return [
+        SystemMessage(content=_PERFORMANCE_OBJECTIVES_SYSTEM_PROMPT),
+        HumanMessage(content=_PERFORMANCE_OBJECTIVES_USER_TEMPLATE.format_map({
+            "instructional_goal": instructional_goal,
+            "sub_skills_json": _dumps(sub_skills),
+            "target_audience": target_audience,
+        })),
+    ]
+
+
+# Parsed Step 4 results by canonical input, so repeated calls in a run (e.g. re-planning)
+# skip prompt rendering and parsing as well as the LLM call; active with DICK_CAREY_LLM_CACHE=1
+_OBJECTIVES_MEMO_MAX_ENTRIES = 128
+_objectives_memo: OrderedDict[bytes, dict] = OrderedDict()
+_objectives_memo_lock = threading.Lock()
+
+
+def _objectives_memo_key(instructional_goal: str, sub_skills: List[dict], target_audience: str) -> Optional[bytes]:
+    if not cache_enabled():
+        return None
+    model = _openrouter_model if _provider == "openrouter" else _upstage_model
+    return orjson.dumps(
+        {"p": _provider, "m": model, "t": llm_temperature(), "g": instructional_goal, "s": sub_skills, "a": target_audience},
+        option=orjson.OPT_SORT_KEYS,
+    )
+
+
+def _objectives_memo_get(key: Optional[bytes]) -> Optional[dict]:
+    if key is None:
+        return None
+    with _objectives_memo_lock:
+        value = _objectives_memo.get(key)
+        if value is None:
+            return None
+        _objectives_memo.move_to_end(key)
+    return copy.deepcopy(value)
+
+
+def _objectives_memo_put(key: Optional[bytes], value: dict) -> dict:
+    if key is not None:
+        with _objectives_memo_lock:
+            _objectives_memo[key] = copy.deepcopy(value)
+            _objectives_memo.move_to_end(key)
+            if len(_objectives_memo) > _OBJECTIVES_MEMO_MAX_ENTRIES:
+                _objectives_memo.popitem(last=False)
+    return value
+
+
+@tool
+def write_performance_objectives(
+    instructional_goal: str,
+    sub_skills: List[dict],
+    target_audience: str,
+) -> dict:
+    """
+    Write performance objectives. (Dick & Carey Step 4)
+
+    Write specific and measurable performance objectives in ABCD format.
+    - A (Audience): Target learners
+    - B (Behavior): Observable behavior
+    - C (Condition): Performance conditions
+    - D (Degree): Achievement criteria
+
+    Args:
+        instructional_goal: Instructional goal
+        sub_skills: Sub-skills list
+        target_audience: Target learners
+
+    Returns:
+        Performance objectives result (terminal_objective, enabling_objectives)
+    """
+    try:
+        # Inside the try: orjson rejects non-str dict keys, which should fall back like any other failure
+        memo_key = _objectives_memo_key(instructional_goal, sub_skills, target_audience)
+        cached = _objectives_memo_get(memo_key)
+        if cached is not None:
+            return cached
+        content = _generate(_performance_objectives_messages(instructional_goal, sub_skills, target_audience))
+        return _objectives_memo_put(memo_key, parse_json_response(content))
     except Exception:
         return _fallback_write_performance_objectives(instructional_goal, sub_skills, target_audience)
 
 
+_BLOOM_LEVELS = ("Understand", "Analyze", "Analyze", "Apply", "Evaluate")
+_OBJECTIVE_NAMES = (
+    "Core concept understanding objective",
+    "Case analysis objective",
+    "Problem diagnosis objective",
+    "Solution design objective",
+    "Result evaluation objective",
+)
+_OBJECTIVE_TEMPLATE = {
+    "objective_name": "",
+    "audience": "",
+    "behavior": "",
+    "condition": "Under appropriate conditions",
+    "degree": "80% or higher accuracy",
+    "statement": "",
+    "sub_skill_id": "",
+    "bloom_level": "Apply",
+}
+_OBJECTIVE_STATEMENT = "{audience} can {behavior} under appropriate conditions. (80% or higher accuracy)"
+_TERMINAL_OBJECTIVE_TEMPLATE = {
+    "objective_name": "Comprehensive performance objective",
+    "audience": "",
+    "behavior": "Can comprehensively perform learning content",
+    "condition": "When provided with necessary resources",
+    "degree": "90% or higher accuracy",
+    "statement": "",
+    "sub_skill_id": "Comprehensive task performance",
+    "bloom_level": "Apply",
+}
+_TERMINAL_OBJECTIVE_STATEMENT = "{audience} can comprehensively perform learning content when provided with necessary resources. (90% or higher accuracy)"
+
+
 def _fallback_write_performance_objectives(
     instructional_goal: str,
     sub_skills: List[dict],
     target_audience: str,
 ) -> dict:
     """Fallback function when LLM fails"""
-    enabling = []
-    bloom_levels = ["Understand", "Analyze", "Analyze", "Apply", "Evaluate"]
-    objective_names = ["Core concept understanding objective", "Case analysis objective", "Problem diagnosis objective", "Solution design objective", "Result evaluation objective"]
-
-    for i, skill in enumerate(sub_skills[:5]):
-        description = skill.get("description", f"Sub-skill {i+1}")
-        bloom = bloom_levels[i] if i < len(bloom_levels) else "Apply"
-        obj_name = objective_names[i] if i < len(objective_names) else f"{description} objective"
-
-        enabling.append({
-            "objective_name": obj_name,
-            "audience": target_audience,
-            "behavior": description,
-            "condition": "Under appropriate conditions",
-            "degree": "80% or higher accuracy",
-            "statement": f"{target_audience} can {description} under appropriate conditions. (80% or higher accuracy)",
-            "sub_skill_id": description,
-            "bloom_level": bloom,
-        })
-
+    descriptions = [skill.get("description", f"Sub-skill {i+1}") for i, skill in enumerate(sub_skills[:5])]
+    enabling = [
+        dict(
+            _OBJECTIVE_TEMPLATE,
+            objective_name=obj_name,
+            audience=target_audience,
+            behavior=description,
+            statement=_OBJECTIVE_STATEMENT.format(audience=target_audience, behavior=description),
+            sub_skill_id=description,
+            bloom_level=bloom,
+        )
+        for obj_name, bloom, description in zip(_OBJECTIVE_NAMES, _BLOOM_LEVELS, descriptions)
+    ]
     # Ensure minimum 5
-    while len(enabling) < 5:
-        i = len(enabling)
-        additional_behavior = f"Can apply learning content ({i+1})"
-        enabling.append({
-            "objective_name": f"Learning application objective {i+1}",
-            "audience": target_audience,
-            "behavior": additional_behavior,
-            "condition": "Under appropriate conditions",
-            "degree": "80% or higher accuracy",
-            "statement": f"{target_audience} can apply learning content under appropriate conditions. (80% or higher accuracy)",
-            "sub_skill_id": additional_behavior,
-            "bloom_level": "Apply",
-        })
+    padding_statement = _OBJECTIVE_STATEMENT.format(audience=target_audience, behavior="apply learning content")
+    enabling += [
+        dict(
+            _OBJECTIVE_TEMPLATE,
+            objective_name=f"Learning application objective {i+1}",
+            audience=target_audience,
+            behavior=f"Can apply learning content ({i+1})",
+            statement=padding_statement,
+            sub_skill_id=f"Can apply learning content ({i+1})",
+        )
+        for i in range(len(enabling), 5)
+    ]
 
     return {
-        "terminal_objective": {
-            "objective_name": "Comprehensive performance objective",
-            "audience": target_audience,
-            "behavior": "Can comprehensively perform learning content",
-            "condition": "When provided with necessary resources",
-            "degree": "90% or higher accuracy",
-            "statement": f"{target_audience} can comprehensively perform learning content when provided with necessary resources. (90% or higher accuracy)",
-            "sub_skill_id": "Comprehensive task performance",
-            "bloom_level": "Apply",
-        },
+        "terminal_objective": dict(
+            _TERMINAL_OBJECTIVE_TEMPLATE,
+            audience=target_audience,
+            statement=_TERMINAL_OBJECTIVE_STATEMENT.format(audience=target_audience),
+        ),
         "enabling_objectives": enabling,
     }
 
 
-# ========== Step 5: Assessment Instruments ==========
-@tool
-def develop_assessment_instruments(
-    performance_objectives: dict,
-    learning_environment: str,
-    duration: str,
+async def _awrite_performance_objectives(
+    instructional_goal: str,
+    sub_skills: List[dict],
+    target_audience: str,
 ) -> dict:
-    """
-    Develop assessment instruments. (Dick & Carey Step 5)
+    """Async variant of write_performance_objectives (awaits the LLM instead of blocking a thread)"""
+    try:
+        memo_key = _objectives_memo_key(instructional_goal, sub_skills, target_audience)
+        cached = _objectives_memo_get(memo_key)
+        if cached is not None:
+            return cached
+        content = await _agenerate(_performance_objectives_messages(instructional_goal, sub_skills, target_audience))
+        return _objectives_memo_put(memo_key, parse_json_response(content))
+    except Exception:
+        return _fallback_write_performance_objectives(instructional_goal, sub_skills, target_audience)
 
-    Develop entry test, practice tests, and post-test aligned with performance objectives.
-    Ensures objective-assessment alignment.
 
-    Args:
-        performance_objectives: Performance objectives (terminal_objective, enabling_objectives)
-        learning_environment: Learning environment
-        duration: Learning duration
+write_performance_objectives.coroutine = _awrite_performance_objectives
 
-    Returns:
-        Assessment instruments result (entry_test, practice_tests, post_test, alignment_matrix)
-    """
-    try:
-        llm = get_llm()
 
-        prompt = f"""You are an expert in the Dick & Carey model. Develop Assessment Instruments aligned with performance objectives.
+# ========== Step 5: Assessment Instruments ==========
+_ASSESSMENT_EXAMPLE = {
+    "entry_test": [
+        {
+            "assessment_name": "Basic concept multiple choice assessment",
+            "objective_id": "Basic knowledge verification",
+            "type": "multiple_choice",
+            "question": "Which of the following corresponds to [basic concept]?",
+            "options": ["Option 1", "Option 2", "Option 3", "Option 4"],
+            "answer": "Option 1",
+            "rubric": "1 point for correct answer",
+        },
+        {
+            "assessment_name": "Basic terminology short answer assessment",
+            "objective_id": "Basic knowledge verification",
+            "type": "short_answer",
+            "question": "Briefly explain the meaning of [basic terminology].",
+            "options": [],
+            "answer": "Scored based on inclusion of key keywords",
+            "rubric": "Full marks for including 2 or more key keywords",
+        },
+        {
+            "assessment_name": "Basic concept true/false assessment",
+            "objective_id": "Basic knowledge verification",
+            "type": "true_false",
+            "question": "[Basic concept statement] is a correct explanation.",
+            "options": ["True", "False"],
+            "answer": "True",
+            "rubric": "1 point for correct answer",
+        },
+    ],
+    "practice_tests": [
+        {
+            "assessment_name": "Core concept essay practice",
+            "objective_id": "Can explain core concepts",
+            "type": "essay",
+            "question": "Explain the learned concept in your own words.",
+            "options": [],
+            "answer": "Inclusion of key concepts",
+            "rubric": "Full marks for accurately describing 3 or more core concepts",
+        },
+        {
+            "assessment_name": "Case analysis practice",
+            "objective_id": "Can analyze related cases",
+            "type": "case_analysis",
+            "question": "Analyze the key elements in the presented case.",
+            "options": [],
+            "answer": "Key element identification",
+            "rubric": "Full marks for accurately identifying 2 or more key elements",
+        },
+        {
+            "assessment_name": "Problem diagnosis practice",
+            "objective_id": "Can diagnose problem situations",
+            "type": "problem_solving",
+            "question": "Identify problems in the given situation.",
+            "options": [],
+            "answer": "Problem identification",
+            "rubric": "Full marks for accurately identifying 2 or more problems",
+        },
+    ],
+    "post_test": [
+        {
+            "assessment_name": "Core concept multiple choice assessment",
+            "objective_id": "Can explain core concepts",
+            "type": "multiple_choice",
+            "question": "Which of the following best explains [core concept]?",
+            "options": ["Option 1", "Option 2", "Option 3", "Option 4"],
+            "answer": "Option 2",
+            "rubric": "2 points for correct answer",
+        },
+        {
+            "assessment_name": "Case analysis essay assessment",
+            "objective_id": "Can analyze related cases",
+            "type": "essay",
+            "question": "Analyze the presented case and identify key elements.",
+            "options": [],
+            "answer": "Analysis results",
+            "rubric": "Full marks for 3 or more key elements with logical explanation",
+        },
+        {
+            "assessment_name": "Problem diagnosis assessment",
+            "objective_id": "Can diagnose problem situations",
+            "type": "problem_solving",
+            "question": "Diagnose the given problem situation and analyze causes.",
+            "options": [],
+            "answer": "Diagnosis results",
+            "rubric": "Full marks for accurately analyzing 2 or more problem causes",
+        },
+        {
+            "assessment_name": "Solution design performance assessment",
+            "objective_id": "Can design and apply solutions",
+            "type": "performance_assessment",
+            "question": "Perform the actual task and submit results.",
+            "options": [],
+            "answer": "Task results",
+            "rubric": "Evaluation by completeness, accuracy, and applicability",
+        },
+        {
+            "assessment_name": "Comprehensive application assessment",
+            "objective_id": "Can comprehensively perform learning content",
+            "type": "comprehensive_assessment",
+            "question": "Apply learning content comprehensively to a real situation.",
+            "options": [],
+            "answer": "Comprehensive application",
+            "rubric": "Rubric evaluation based on goal achievement criteria",
+        },
+    ],
+}
+_ASSESSMENT_EXAMPLE_JSON = _render_example(_ASSESSMENT_EXAMPLE)
 
-## Input Information
-- Performance Objectives: {json.dumps(performance_objectives, ensure_ascii=False)}
-- Learning Environment: {learning_environment}
-- Duration: {duration}
+_ASSESSMENT_INSTRUMENTS_SYSTEM_PROMPT = """You are an expert in the Dick & Carey model. Develop Assessment Instruments aligned with the performance objectives provided by the user.
 
 ## Dick & Carey's Assessment Instrument Development Principles
 1. Objective-Assessment Alignment: Each assessment item measures specific performance objective
@@ -302,139 +512,230 @@ def develop_assessment_instruments(
 1. entry_test: Entry test items **minimum 3**
 2. practice_tests: Practice test items **minimum 3**
 3. post_test: Post-test items **minimum 5**
-4. alignment_matrix: Objective-assessment alignment matrix
 
 ## Output Format (JSON)
 **Important**:
 - Use actual performance objective text (behavior) in objective_id.
-- Use text instead of IDs for both keys and values in alignment_matrix.
 - Use assessment_name field instead of id field for each assessment item.
 
 ```json
-{{
-  "entry_test": [
-    {{
-      "assessment_name": "Basic concept multiple choice assessment",
-      "objective_id": "Basic knowledge verification",
-      "type": "multiple_choice",
-      "question": "Which of the following corresponds to [basic concept]?",
-      "options": ["Option 1", "Option 2", "Option 3", "Option 4"],
-      "answer": "Option 1",
-      "rubric": "1 point for correct answer"
-    }},
-    {{
-      "assessment_name": "Basic terminology short answer assessment",
-      "objective_id": "Basic knowledge verification",
-      "type": "short_answer",
-      "question": "Briefly explain the meaning of [basic terminology].",
-      "options": [],
-      "answer": "Scored based on inclusion of key keywords",
-      "rubric": "Full marks for including 2 or more key keywords"
-    }},
-    {{
-      "assessment_name": "Basic concept true/false assessment",
-      "objective_id": "Basic knowledge verification",
-      "type": "true_false",
-      "question": "[Basic concept statement] is a correct explanation.",
-      "options": ["True", "False"],
-      "answer": "True",
-      "rubric": "1 point for correct answer"
-    }}
-  ],
-  "practice_tests": [
-    {{
-      "assessment_name": "Core concept essay practice",
-      "objective_id": "Can explain core concepts",
-      "type": "essay",
-      "question": "Explain the learned concept in your own words.",
-      "options": [],
-      "answer": "Inclusion of key concepts",
-      "rubric": "Full marks for accurately describing 3 or more core concepts"
-    }},
-    {{
-      "assessment_name": "Case analysis practice",
-      "objective_id": "Can analyze related cases",
-      "type": "case_analysis",
-      "question": "Analyze the key elements in the presented case.",
-      "options": [],
-      "answer": "Key element identification",
-      "rubric": "Full marks for accurately identifying 2 or more key elements"
-    }},
-    {{
-      "assessment_name": "Problem diagnosis practice",
-      "objective_id": "Can diagnose problem situations",
-      "type": "problem_solving",
-      "question": "Identify problems in the given situation.",
-      "options": [],
-      "answer": "Problem identification",
-      "rubric": "Full marks for accurately identifying 2 or more problems"
-    }}
-  ],
-  "post_test": [
-    {{
-      "assessment_name": "Core concept multiple choice assessment",
-      "objective_id": "Can explain core concepts",
-      "type": "multiple_choice",
-      "question": "Which of the following best explains [core concept]?",
-      "options": ["Option 1", "Option 2", "Option 3", "Option 4"],
-      "answer": "Option 2",
-      "rubric": "2 points for correct answer"
-    }},
-    {{
-      "assessment_name": "Case analysis essay assessment",
-      "objective_id": "Can analyze related cases",
-      "type": "essay",
-      "question": "Analyze the presented case and identify key elements.",
-      "options": [],
-      "answer": "Analysis results",
-      "rubric": "Full marks for 3 or more key elements with logical explanation"
-    }},
-    {{
-      "assessment_name": "Problem diagnosis assessment",
-      "objective_id": "Can diagnose problem situations",
-      "type": "problem_solving",
-      "question": "Diagnose the given problem situation and analyze causes.",
-      "options": [],
-      "answer": "Diagnosis results",
-      "rubric": "Full marks for accurately analyzing 2 or more problem causes"
-    }},
-    {{
-      "assessment_name": "Solution design performance assessment",
-      "objective_id": "Can design and apply solutions",
-      "type": "performance_assessment",
-      "question": "Perform the actual task and submit results.",
-      "options": [],
-      "answer": "Task results",
-      "rubric": "Evaluation by completeness, accuracy, and applicability"
-    }},
-    {{
-      "assessment_name": "Comprehensive application assessment",
-      "objective_id": "Can comprehensively perform learning content",
-      "type": "comprehensive_assessment",
-      "question": "Apply learning content comprehensively to a real situation.",
-      "options": [],
-      "answer": "Comprehensive application",
-      "rubric": "Rubric evaluation based on goal achievement criteria"
-    }}
-  ],
-  "alignment_matrix": {{
-    "Can explain core concepts": ["Basic concept multiple choice assessment", "Core concept essay practice", "Core concept multiple choice assessment"],
-    "Can analyze related cases": ["Case analysis practice", "Case analysis essay assessment"],
-    "Can diagnose problem situations": ["Problem diagnosis practice", "Problem diagnosis assessment"],
-    "Can design and apply solutions": ["Solution design performance assessment"],
-    "Can comprehensively perform learning content": ["Comprehensive application assessment"]
-  }}
-}}
+""" + _ASSESSMENT_EXAMPLE_JSON + """
 ```
 
 Output JSON only."""
 
-        response = llm.invoke(prompt)
-        return parse_json_response(response.content)
+_ASSESSMENT_INSTRUMENTS_USER_TEMPLATE = """## Input Information
+- Performance Objectives: {performance_objectives_json}
+- Learning Environment: {learning_environment}
+- Duration: {duration}"""
+
+
+def _assessment_instruments_user_message(
+    performance_objectives: dict,
+    learning_environment: str,
+    duration: str,
+) -> str:
+    return _ASSESSMENT_INSTRUMENTS_USER_TEMPLATE.format_map({
+        "performance_objectives_json": _dumps(performance_objectives),
+        "learning_environment": learning_environment,
+        "duration": duration,
+    })
+
+
+def _assessment_instruments_messages(
+    performance_objectives: dict,
+    learning_environment: str,
+    duration: str,
+) -> list:
+    """Build the assessment instruments messages (shared by the sync and async tool paths)"""
+    return [
+        SystemMessage(content=_ASSESSMENT_INSTRUMENTS_SYSTEM_PROMPT),
+        HumanMessage(content=_assessment_instruments_user_message(performance_objectives, learning_environment, duration)),
+    ]
+
+
+# Split generation: entry/practice/post tests as three concurrent LLM calls (DICK_CAREY_SPLIT_ASSESSMENT=1)
+_ASSESSMENT_SECTION_SYSTEM_TEMPLATE = """You are an expert in the Dick & Carey model. Develop one part of the Assessment Instruments aligned with the performance objectives provided by the user.
+
+## Dick & Carey's Assessment Instrument Development Principles
+1. Objective-Assessment Alignment: Each assessment item measures specific performance objective
+2. Criterion-Referenced Assessment: Judge whether learner performance meets objective criteria
+
+## Required Elements
+{section}: {section_description} **minimum {minimum}**
+
+## Output Format (JSON)
+**Important**:
+- Use actual performance objective text (behavior) in objective_id.
+- Use assessment_name field instead of id field for each assessment item.
+
+```json
+{section_example}
+```
+
+Output JSON only."""
+
+_ASSESSMENT_SECTIONS = (
+    ("entry_test", "Entry test items that confirm entry behaviors", 3),
+    ("practice_tests", "Practice test items for practice and feedback during learning", 3),
+    ("post_test", "Post-test items that confirm objective achievement", 5),
+)
+_ASSESSMENT_SECTION_SYSTEM_PROMPTS = {
+    section: _ASSESSMENT_SECTION_SYSTEM_TEMPLATE.format_map({
+        "section": section,
+        "section_description": description,
+        "minimum": minimum,
+        "section_example": _render_example({section: _ASSESSMENT_EXAMPLE[section]}),
+    })
+    for section, description, minimum in _ASSESSMENT_SECTIONS
+}
+
+
+def _split_assessment_enabled() -> bool:
+    return os.getenv("DICK_CAREY_SPLIT_ASSESSMENT", "0") == "1"
+
+
+def _assessment_section_messages(
+    performance_objectives: dict,
+    learning_environment: str,
+    duration: str,
+) -> List[list]:
+    """Build one message list per assessment section, in _ASSESSMENT_SECTIONS order"""
+    user = HumanMessage(content=_assessment_instruments_user_message(performance_objectives, learning_environment, duration))
+    return [
+        [SystemMessage(content=_ASSESSMENT_SECTION_SYSTEM_PROMPTS[section]), user]
+        for section, _, _ in _ASSESSMENT_SECTIONS
+    ]
+
+
+def _build_alignment_matrix(result: dict) -> dict:
+    """Map each objective to the assessment items that measure it"""
+    matrix = {}
+    for section, _, _ in _ASSESSMENT_SECTIONS:
+        for item in result.get(section, []):
+            if isinstance(item, dict) and item.get("objective_id") and item.get("assessment_name"):
+                matrix.setdefault(item["objective_id"], []).append(item["assessment_name"])
+    return matrix
+
+
+def _with_alignment_matrix(result: dict) -> dict:
+    """Attach the alignment matrix computed from the test items (the LLM is not asked for it)"""
+    if isinstance(result, dict):
+        result["alignment_matrix"] = _build_alignment_matrix(result)
+    return result
+
+
+def _merge_assessment_sections(
+    outcomes: list,
+    performance_objectives: dict,
+    learning_environment: str,
+    duration: str,
+) -> dict:
+    """Combine per-section replies (or exceptions); sections that failed come from the fallback"""
+    result = {}
+    fallback = None
+    for (section, _, _), outcome in zip(_ASSESSMENT_SECTIONS, outcomes):
+        items = None
+        if not isinstance(outcome, BaseException):
+            try:
+                parsed = parse_json_response(outcome)
+                items = parsed.get(section) if isinstance(parsed, dict) else parsed
+            except ValueError:
+                pass
+        if not isinstance(items, list) or not items:
+            if fallback is None:
+                fallback = _fallback_develop_assessment_instruments(performance_objectives, learning_environment, duration)
+            items = fallback[section]
+        result[section] = items
+    return _with_alignment_matrix(result)
+
+
+def _develop_assessment_sections(
+    performance_objectives: dict,
+    learning_environment: str,
+    duration: str,
+) -> dict:
+    """Generate the three sections concurrently on worker threads (each call takes the next key)"""
+    prompts = _assessment_section_messages(performance_objectives, learning_environment, duration)
+    with ThreadPoolExecutor(max_workers=len(prompts)) as pool:
+        futures = [pool.submit(_generate, prompt) for prompt in prompts]
+    outcomes = [f.exception() or f.result() for f in futures]
+    return _merge_assessment_sections(outcomes, performance_objectives, learning_environment, duration)
+
+
+async def _adevelop_assessment_sections(
+    performance_objectives: dict,
+    learning_environment: str,
+    duration: str,
+) -> dict:
+    """Async variant of _develop_assessment_sections"""
+    prompts = _assessment_section_messages(performance_objectives, learning_environment, duration)
+    outcomes = await asyncio.gather(
+        *(_agenerate(prompt) for prompt in prompts),
+        return_exceptions=True,
+    )
+    return _merge_assessment_sections(outcomes, performance_objectives, learning_environment, duration)
+
+@tool
+def develop_assessment_instruments(
+    performance_objectives: dict,
+    learning_environment: str,
+    duration: str,
+) -> dict:
+    """
+    Develop assessment instruments. (Dick & Carey Step 5)
+
+    Develop entry test, practice tests, and post-test aligned with performance objectives.
+    Ensures objective-assessment alignment.
+
+    Args:
+        performance_objectives: Performance objectives (terminal_objective, enabling_objectives)
+        learning_environment: Learning environment
+        duration: Learning duration
+
+    Returns:
+        Assessment instruments result (entry_test, practice_tests, post_test, alignment_matrix)
+    """
+    try:
+        if _split_assessment_enabled():
+            return _develop_assessment_sections(performance_objectives, learning_environment, duration)
+        content = _generate(_assessment_instruments_messages(performance_objectives, learning_environment, duration))
+        return _with_alignment_matrix(parse_json_response(content))
     except Exception:
         return _fallback_develop_assessment_instruments(performance_objectives, learning_environment, duration)
 
 
+_CHOICE_OPTIONS = ("A", "B", "C", "D")
+_ENTRY_TEST_TEMPLATE = (
+    {"assessment_name": "Basic concept multiple choice assessment", "objective_id": "Basic knowledge verification", "type": "multiple_choice", "question": "Basic concept verification item", "options": _CHOICE_OPTIONS, "answer": "A", "rubric": "1 point for correct"},
+    {"assessment_name": "Basic terminology short answer assessment", "objective_id": "Basic knowledge verification", "type": "short_answer", "question": "Basic terminology explanation", "options": (), "answer": "Include key keywords", "rubric": "Full marks for 2 or more keywords"},
+    {"assessment_name": "Basic concept true/false assessment", "objective_id": "Basic knowledge verification", "type": "true_false", "question": "Basic concept true/false item", "options": ("True", "False"), "answer": "True", "rubric": "1 point for correct"},
+)
+_PRACTICE_ITEM_TEMPLATE = {
+    "assessment_name": "",
+    "objective_id": "",
+    "type": "essay",
+    "question": "",
+    "options": (),
+    "answer": "Model answer",
+    "rubric": "Full marks for including key content",
+}
+# Post-test items alternate essay / multiple choice: type -> (options, answer)
+_POST_ITEM_VARIANTS = {
+    "essay": ((), "Model answer"),
+    "multiple_choice": (_CHOICE_OPTIONS, "A"),
+}
+_POST_ITEM_TEMPLATE = {
+    "assessment_name": "",
+    "objective_id": "",
+    "type": "",
+    "question": "",
+    "options": (),
+    "answer": "",
+    "rubric": "Full marks for accurate performance",
+}
+
+
 def _fallback_develop_assessment_instruments(
     performance_objectives: dict,
     learning_environment: str,
@@ -443,84 +744,50 @@ def _fallback_develop_assessment_instruments(
     """Fallback function when LLM fails"""
     enabling = performance_objectives.get("enabling_objectives", [])
 
-    # entry_test: Use assessment_name instead of ID
-    entry_test = [
-        {"assessment_name": "Basic concept multiple choice assessment", "objective_id": "Basic knowledge verification", "type": "multiple_choice", "question": "Basic concept verification item", "options": ["A", "B", "C", "D"], "answer": "A", "rubric": "1 point for correct"},
-        {"assessment_name": "Basic terminology short answer assessment", "objective_id": "Basic knowledge verification", "type": "short_answer", "question": "Basic terminology explanation", "options": [], "answer": "Include key keywords", "rubric": "Full marks for 2 or more keywords"},
-        {"assessment_name": "Basic concept true/false assessment", "objective_id": "Basic knowledge verification", "type": "true_false", "question": "Basic concept true/false item", "options": ["True", "False"], "answer": "True", "rubric": "1 point for correct"},
-    ]
+    # entry_test: Use assessment_name instead of ID (options copied so callers get their own lists)
+    entry_test = [dict(t, options=list(t["options"])) for t in _ENTRY_TEST_TEMPLATE]
 
-    practice_tests = []
-    practice_names = []  # For alignment_matrix values
-    for i, obj in enumerate(enabling[:3]):
-        behavior = obj.get("behavior", f"Learning content {i+1}")
-        assessment_name = f"{behavior} essay practice"
-        practice_names.append((behavior, assessment_name))
-        practice_tests.append({
-            "assessment_name": assessment_name,
-            "objective_id": behavior,
-            "type": "essay",
-            "question": f"Practice item related to {behavior}",
-            "options": [],
-            "answer": "Model answer",
-            "rubric": "Full marks for including key content",
-        })
-
-    while len(practice_tests) < 3:
-        i = len(practice_tests)
-        default_behavior = f"Can apply learning content ({i+1})"
-        assessment_name = f"{default_behavior} practice"
-        practice_names.append((default_behavior, assessment_name))
-        practice_tests.append({
-            "assessment_name": assessment_name,
-            "objective_id": default_behavior,
-            "type": "essay",
-            "question": f"Practice item {i+1}",
-            "options": [],
-            "answer": "Model answer",
-            "rubric": "Full marks for including key content",
-        })
-
-    post_test = []
-    post_names = []  # For alignment_matrix values
-    for i, obj in enumerate(enabling[:4]):
-        behavior = obj.get("behavior", f"Learning content {i+1}")
-        test_type = "essay" if i % 2 == 0 else "multiple_choice"
-        assessment_name = f"{behavior} {test_type} assessment"
-        post_names.append((behavior, assessment_name))
-        post_test.append({
-            "assessment_name": assessment_name,
-            "objective_id": behavior,
-            "type": test_type,
-            "question": f"{behavior} assessment item",
-            "options": ["A", "B", "C", "D"] if i % 2 == 1 else [],
-            "answer": "A" if i % 2 == 1 else "Model answer",
-            "rubric": "Full marks for accurate performance",
-        })
+    # (behavior, question) per item; objectives first, then defaults up to the minimum count
+    practice_seeds = [
+        (behavior, f"{behavior} essay practice", f"Practice item related to {behavior}")
+        for behavior in (obj.get("behavior", f"Learning content {i+1}") for i, obj in enumerate(enabling[:3]))
+    ]
+    practice_seeds += [
+        (f"Can apply learning content ({i+1})", f"Can apply learning content ({i+1}) practice", f"Practice item {i+1}")
+        for i in range(len(practice_seeds), 3)
+    ]
+    practice_tests = [
+        dict(_PRACTICE_ITEM_TEMPLATE, assessment_name=name, objective_id=behavior, question=question, options=[])
+        for behavior, name, question in practice_seeds
+    ]
 
+    post_seeds = [
+        (behavior, f"{behavior} assessment item")
+        for behavior in (obj.get("behavior", f"Learning content {i+1}") for i, obj in enumerate(enabling[:4]))
+    ]
     # Ensure minimum 4 (before adding comprehensive item)
-    while len(post_test) < 4:
-        i = len(post_test)
-        default_behavior = f"Can apply learning content ({i+1})"
-        test_type = "essay" if i % 2 == 0 else "multiple_choice"
-        assessment_name = f"{default_behavior} {test_type} assessment"
-        post_names.append((default_behavior, assessment_name))
-        post_test.append({
-            "assessment_name": assessment_name,
-            "objective_id": default_behavior,
-            "type": test_type,
-            "question": f"Learning content assessment item {i+1}",
-            "options": ["A", "B", "C", "D"] if i % 2 == 1 else [],
-            "answer": "A" if i % 2 == 1 else "Model answer",
-            "rubric": "Full marks for accurate performance",
-        })
+    post_seeds += [
+        (f"Can apply learning content ({i+1})", f"Learning content assessment item {i+1}")
+        for i in range(len(post_seeds), 4)
+    ]
+    post_test = [
+        dict(
+            _POST_ITEM_TEMPLATE,
+            assessment_name=f"{behavior} {test_type} assessment",
+            objective_id=behavior,
+            type=test_type,
+            question=question,
+            options=list(_POST_ITEM_VARIANTS[test_type][0]),
+            answer=_POST_ITEM_VARIANTS[test_type][1],
+        )
+        for (behavior, question), test_type in zip(post_seeds, itertools.cycle(_POST_ITEM_VARIANTS))
+    ]
 
     # Add final comprehensive item
     terminal = performance_objectives.get("terminal_objective", {})
     terminal_behavior = terminal.get("behavior", "Can comprehensively perform learning content")
-    terminal_assessment_name = "Comprehensive application assessment"
     post_test.append({
-        "assessment_name": terminal_assessment_name,
+        "assessment_name": "Comprehensive application assessment",
         "objective_id": terminal_behavior,
         "type": "comprehensive_assessment",
         "question": f"{terminal_behavior} comprehensive assessment",
@@ -529,25 +796,127 @@ def _fallback_develop_assessment_instruments(
         "rubric": "Rubric evaluation based on goal achievement criteria",
     })
 
-    # alignment_matrix: Use text for both keys and values
-    alignment = {}
-    # Match practice_names and post_names by behavior
-    behavior_to_assessments = {}
-    for behavior, name in practice_names:
-        if behavior not in behavior_to_assessments:
-            behavior_to_assessments[behavior] = []
-        behavior_to_assessments[behavior].append(name)
-    for behavior, name in post_names:
-        if behavior not in behavior_to_assessments:
-            behavior_to_assessments[behavior] = []
-        behavior_to_assessments[behavior].append(name)
-
-    alignment = behavior_to_assessments
-    alignment[terminal_behavior] = [terminal_assessment_name]
-
-    return {
+    return _with_alignment_matrix({
         "entry_test": entry_test,
         "practice_tests": practice_tests,
         "post_test": post_test,
-        "alignment_matrix": alignment,
-    }
+    })
+
+
+async def _adevelop_assessment_instruments(
+    performance_objectives: dict,
+    learning_environment: str,
+    duration: str,
+) -> dict:
+    """Async variant of develop_assessment_instruments (awaits the LLM instead of blocking a thread)"""
+    try:
+        if _split_assessment_enabled():
+            return await _adevelop_assessment_sections(performance_objectives, learning_environment, duration)
+        content = await _agenerate(_assessment_instruments_messages(performance_objectives, learning_environment, duration))
+        return _with_alignment_matrix(parse_json_response(content))
+    except Exception:
+        return _fallback_develop_assessment_instruments(performance_objectives, learning_environment, duration)
+
+
+develop_assessment_instruments.coroutine = _adevelop_assessment_instruments
+
+
+# ========== Steps 4 & 5: Fused Objectives / Assessment ==========
+_FUSED_SYSTEM_PROMPT = """You are an expert in the Dick & Carey model. Complete the two steps below in a single response. The assessment instruments in Part 2 must assess the performance objectives you write in Part 1.
+
+# Part 1: performance_objectives
+""" + _PERFORMANCE_OBJECTIVES_SYSTEM_PROMPT + """
+
+# Part 2: assessment_instruments
+""" + _ASSESSMENT_INSTRUMENTS_SYSTEM_PROMPT + """
+
+## Combined Output Format (JSON)
+Return ONE JSON object with exactly two keys, each holding the JSON described in its part:
+```json
+{"performance_objectives": {...}, "assessment_instruments": {...}}
+```
+
+Output JSON only."""
+
+_FUSED_KEYS = ("performance_objectives", "assessment_instruments")
+
+
+def _objectives_and_assessments_messages(
+    instructional_goal: str,
+    sub_skills: List[dict],
+    target_audience: str,
+    learning_environment: str,
+    duration: str,
+) -> list:
+    """Build the fused Step 4-5 messages from the two single-step parts"""
+    objectives_input = _PERFORMANCE_OBJECTIVES_USER_TEMPLATE.format_map({
+        "instructional_goal": instructional_goal,
+        "sub_skills_json": _dumps(sub_skills),
+        "target_audience": target_audience,
+    })
+    assessment_input = _assessment_instruments_user_message(
+        "The performance objectives you write in Part 1", learning_environment, duration
+    )
+    return [
+        SystemMessage(content=_FUSED_SYSTEM_PROMPT),
+        HumanMessage(content=f"# Part 1\n{objectives_input}\n\n# Part 2\n{assessment_input}"),
+    ]
+
+
+def _split_fused_result(result: dict) -> dict:
+    """Keep only the parts of a fused response that are non-empty objects"""
+    parts = {k: result[k] for k in _FUSED_KEYS if isinstance(result.get(k), dict) and result[k]}
+    if "assessment_instruments" in parts:
+        _with_alignment_matrix(parts["assessment_instruments"])
+    return parts
+
+
+@tool
+def write_objectives_and_assessments(
+    instructional_goal: str,
+    sub_skills: List[dict],
+    target_audience: str,
+    learning_environment: str,
+    duration: str,
+) -> dict:
+    """
+    Write performance objectives and develop assessment instruments in one LLM call. (Dick & Carey Steps 4 & 5)
+
+    Args:
+        instructional_goal: Instructional goal
+        sub_skills: Sub-skills list
+        target_audience: Target learners
+        learning_environment: Learning environment
+        duration: Learning duration
+
+    Returns:
+        Dict with "performance_objectives" and "assessment_instruments" results; parts the model
+        did not return are omitted so callers can fall back to the individual tools
+    """
+    try:
+        content = _generate(_objectives_and_assessments_messages(
+            instructional_goal, sub_skills, target_audience, learning_environment, duration
+        ))
+        return _split_fused_result(parse_json_response(content))
+    except Exception:
+        return {}
+
+
+async def _awrite_objectives_and_assessments(
+    instructional_goal: str,
+    sub_skills: List[dict],
+    target_audience: str,
+    learning_environment: str,
+    duration: str,
+) -> dict:
+    """Async variant of write_objectives_and_assessments"""
+    try:
+        content = await _agenerate(_objectives_and_assessments_messages(
+            instructional_goal, sub_skills, target_audience, learning_environment, duration
+        ))
+        return _split_fused_result(parse_json_response(content))
+    except Exception:
+        return {}
+
+
+write_objectives_and_assessments.coroutine = _awrite_objectives_and_assessments
@@ -6,109 +6,336 @@ Dick & Carey Model's Steps 6-7:
 7. Instructional Materials Development
 """
 
-import json
+import asyncio
+import contextlib
+import functools
+import hashlib
 import os
-from typing import Optional, List
+import tempfile
+import threading
+import weakref
+from concurrent.futures import Future
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, List
+
+import httpx
+import openai
+import orjson
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.tools import tool
-from langchain_openai import ChatOpenAI
+
+from ._completion import _acomplete, _complete, _json_mode_enabled
+from ._json import _dumps, parse_json_response
+from ._keypool import get_upstage_key, get_upstage_pool
+from ._llm_cache import CachedLLM, cache_enabled, llm_temperature
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
 
 
 # API URLs
 UPSTAGE_BASE_URL = "https://api.upstage.ai/v1/solar"
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
-# Round-robin for Upstage API keys
-_upstage_keys = None
-_upstage_idx = 0
-_upstage_lock = None
-
-def _get_upstage_key():
-    """Get Upstage API key with round-robin"""
-    global _upstage_keys, _upstage_idx, _upstage_lock
-    import threading
-    if _upstage_lock is None:
-        _upstage_lock = threading.Lock()
-    if _upstage_keys is None:
-        keys = []
-        for env in ["UPSTAGE_API_KEY", "UPSTAGE_API_KEY2", "UPSTAGE_API_KEY3"]:
-            k = os.getenv(env)
-            if k:
-                keys.append(k)
-        _upstage_keys = keys if keys else [None]
-    with _upstage_lock:
-        key = _upstage_keys[_upstage_idx % len(_upstage_keys)]
-        _upstage_idx += 1
-        return key
-
-# LLM client (singleton for OpenRouter, round-robin for Upstage)
-_llm_openrouter = None
-
-def get_llm():
-    global _llm_openrouter
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401  (HTTP/2 needs the optional h2 package)
+        return True
+    except ImportError:
+        return False
+
+
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+
+
+@functools.cache
+def _get_http_client() -> httpx.Client:
+    """Shared keep-alive connection pool for every ChatOpenAI client in this module"""
+    return httpx.Client(http2=_http2_available(), limits=_HTTP_LIMITS, timeout=60)
+
+
+# LLM clients (one per settings for OpenRouter, one warm client per key for Upstage)
+_llm_openrouter: dict[tuple, "ChatOpenAI"] = {}
+_upstage_clients: dict[tuple, "ChatOpenAI"] = {}
+_JSON_MODE_KWARGS = {"response_format": {"type": "json_object"}}
+
+
+def _default_model(provider: str) -> str:
+    """Model used when no routed model is given (only the OpenRouter path honours MODEL_NAME)"""
+    if provider == "openrouter" and os.getenv("MODEL_NAME"):
+        return os.environ["MODEL_NAME"]
+    return os.getenv("DICK_CAREY_MODEL", "solar-mini")
+
+
+def get_llm(api_key: Optional[str] = None, model: Optional[str] = None, json_mode: bool = False):
     provider = os.getenv("MODEL_PROVIDER", "upstage")
-    model = os.getenv("MODEL_NAME") or os.getenv("DICK_CAREY_MODEL", "solar-mini")
+    temperature = llm_temperature()
+    model = model or _default_model(provider)
 
     if provider == "openrouter":
-        if _llm_openrouter is None:
-            _llm_openrouter = ChatOpenAI(
-                model=model,
-                temperature=0.7,
-                api_key=os.getenv("OPENROUTER_API_KEY"),
-                base_url=OPENROUTER_BASE_URL,
-            )
-        return _llm_openrouter
-    else:  # upstage - create new client each time for round-robin
-        return ChatOpenAI(
-            model=os.getenv("DICK_CAREY_MODEL", "solar-mini"),
-            temperature=0.7,
-            api_key=_get_upstage_key(),
-            base_url=UPSTAGE_BASE_URL,
-        )
+        api_key = os.getenv("OPENROUTER_API_KEY")
+        clients, base_url = _llm_openrouter, OPENROUTER_BASE_URL
+    else:  # upstage - round-robin over keys, reusing each key's client and connection pool
+        api_key = api_key or get_upstage_key()
+        clients, base_url = _upstage_clients, UPSTAGE_BASE_URL
+    client_key = (api_key, model, temperature, json_mode)
+    llm = clients.get(client_key)
+    if llm is None:
+        # Imported on first use: langchain_openai takes ~0.5s to load and fallback-only runs never need it
+        from langchain_openai import ChatOpenAI
 
+        llm = clients.setdefault(client_key, ChatOpenAI(
+            model=model,
+            temperature=temperature,
+            api_key=api_key,
+            base_url=base_url,
+            http_client=_get_http_client(),
+            # No shared http_async_client: its connections are bound to the event loop that opened them,
+            # while these ChatOpenAI objects outlive any one asyncio.run()
+            model_kwargs=dict(_JSON_MODE_KWARGS) if json_mode else {},
+        ))
+    if cache_enabled():
+        return CachedLLM(llm, model, namespace="strategy_materials")
+    return llm
 
-def parse_json_response(content: str) -> dict:
-    """Parse JSON from LLM response"""
-    json_match = content
-    if "```json" in content:
-        json_match = content.split("```json")[1].split("```")[0]
-    elif "```" in content:
-        json_match = content.split("```")[1].split("```")[0]
-    return json.loads(json_match.strip())
 
+def _lease_key():
+    """Lease an Upstage key for one request (OpenRouter uses a single key)"""
+    if os.getenv("MODEL_PROVIDER", "upstage") == "openrouter":
+        return contextlib.nullcontext(None)
+    return get_upstage_pool().lease()
 
-# ========== Step 6: Instructional Strategy Development ==========
-@tool
-def develop_instructional_strategy(
-    performance_objectives: dict,
-    learner_analysis: dict,
-    learning_environment: str,
-    duration: str,
-) -> dict:
-    """
-    Develop instructional strategy. (Dick & Carey Step 6)
 
-    Design instructional strategies for achieving learning objectives.
-    Consists of pre-instructional activities, content presentation, learner participation, and assessment.
+# Per-provider cap on in-flight requests, so a burst of concurrent runs queues here instead of
+# drawing 429s that end in the fallback; set with UPSTAGE_MAX_CONCURRENCY / OPENROUTER_MAX_CONCURRENCY
+_PROVIDER_CONCURRENCY_DEFAULTS = {"upstage": "8", "openrouter": "4"}
+_provider_asemaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = weakref.WeakKeyDictionary()
 
-    Args:
-        performance_objectives: Performance objectives
-        learner_analysis: Learner analysis results
-        learning_environment: Learning environment
-        duration: Learning duration
 
-    Returns:
-        Instructional strategy result (pre_instructional, content_presentation, learner_participation, assessment, delivery_method, grouping_strategy)
-    """
+def _provider_name() -> str:
+    return "openrouter" if os.getenv("MODEL_PROVIDER", "upstage") == "openrouter" else "upstage"
+
+
+def _provider_limit(provider: str) -> int:
+    return int(os.getenv(f"{provider.upper()}_MAX_CONCURRENCY", _PROVIDER_CONCURRENCY_DEFAULTS[provider]))
+
+
+@functools.cache
+def _provider_semaphore(provider: str) -> threading.BoundedSemaphore:
+    """Concurrency cap for sync calls to one provider"""
+    return threading.BoundedSemaphore(_provider_limit(provider))
+
+
+def _provider_asemaphore(provider: str) -> asyncio.Semaphore:
+    """Concurrency cap for async calls to one provider (one per event loop, as asyncio primitives are loop-bound)"""
+    semaphores = _provider_asemaphores.setdefault(asyncio.get_running_loop(), {})
+    semaphore = semaphores.get(provider)
+    if semaphore is None:
+        semaphore = semaphores[provider] = asyncio.Semaphore(_provider_limit(provider))
+    return semaphore
+
+
+def _generate(api_key: Optional[str], model: Optional[str], prompt) -> str:
+    """Run a prompt on one key, asking for provider JSON mode first when DICK_CAREY_JSON_MODE=1"""
+    if _json_mode_enabled():
+        try:
+            return _complete(get_llm(api_key, model=model, json_mode=True), prompt)
+        except openai.BadRequestError:
+            # Model without JSON mode support: fall back to the fenced-JSON prompt path
+            pass
+    return _complete(get_llm(api_key, model=model), prompt)
+
+
+async def _agenerate(api_key: Optional[str], model: Optional[str], prompt) -> str:
+    """Async variant of _generate"""
+    if _json_mode_enabled():
+        try:
+            return await _acomplete(get_llm(api_key, model=model, json_mode=True), prompt)
+        except openai.BadRequestError:
+            pass
+    return await _acomplete(get_llm(api_key, model=model), prompt)
+
+
+# In-flight requests: concurrent calls with the same prompt wait for the first one's response
+# text instead of sending a duplicate request (async callers are grouped per event loop)
+_inflight: dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+_ainflight: dict[tuple, asyncio.Future] = {}
+
+
+def _prompt_key(prompt) -> tuple:
+    """Hashable form of a message list for the in-flight table"""
+    return tuple((m.type, m.content) for m in prompt)
+
+
+def _invoke(prompt: list, model: Optional[str] = None) -> str:
+    """Run a prompt on a leased key and return the response text; concurrent duplicates share one call"""
+    key = (model, _prompt_key(prompt))
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+    if not leader:
+        return future.result()
+
     try:
-        llm = get_llm()
+        with _provider_semaphore(_provider_name()), _lease_key() as api_key:
+            content = _generate(api_key, model, prompt)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(content)
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+    return content
 
-        prompt = f"""You are an expert in the Dick & Carey model. Develop an effective Instructional Strategy.
 
-## Input Information
-- Performance Objectives: {json.dumps(performance_objectives, ensure_ascii=False)}
-- Learner Analysis: {json.dumps(learner_analysis, ensure_ascii=False)}
-- Learning Environment: {learning_environment}
-- Duration: {duration}
+class _LeaderCancelled(Exception):
+    """Set on an in-flight future whose leading call was cancelled, so a waiting caller takes over"""
+
+
+async def _ainvoke(prompt: list, model: Optional[str] = None) -> str:
+    """Async variant of _invoke"""
+    key = (asyncio.get_running_loop(), model, _prompt_key(prompt))
+    while True:
+        future = _ainflight.get(key)
+        if future is None:
+            break
+        try:
+            return await asyncio.shield(future)
+        except _LeaderCancelled:
+            continue  # the first waiter to wake finds the slot free and sends the request itself
+
+    future = _ainflight[key] = asyncio.get_running_loop().create_future()
+    try:
+        async with _provider_asemaphore(_provider_name()):
+            with _lease_key() as api_key:
+                content = await _agenerate(api_key, model, prompt)
+    except asyncio.CancelledError:
+        # Cancelling the shared future would cancel every waiter too; hand the call over instead
+        future.set_exception(_LeaderCancelled())
+        future.exception()
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved: without waiters nobody else reads it
+        raise
+    else:
+        future.set_result(content)
+    finally:
+        del _ainflight[key]
+    return content
+
+
+# Model routing: with DICK_CAREY_MODEL_FAST / DICK_CAREY_MODEL_STRONG set, prompts go to the
+# fast model first and only a reply that does not parse as JSON is retried once on the strong one
+def _generate_json(prompt: list) -> dict:
+    """Run a prompt and parse its JSON reply, escalating to the strong model on a parse failure"""
+    content = _invoke(prompt, os.getenv("DICK_CAREY_MODEL_FAST"))
+    try:
+        return parse_json_response(content)
+    except ValueError:
+        strong = os.getenv("DICK_CAREY_MODEL_STRONG")
+        if not strong:
+            raise
+    return parse_json_response(_invoke(prompt, strong))
+
+
+async def _agenerate_json(prompt: list) -> dict:
+    """Async variant of _generate_json"""
+    content = await _ainvoke(prompt, os.getenv("DICK_CAREY_MODEL_FAST"))
+    try:
+        return parse_json_response(content)
+    except ValueError:
+        strong = os.getenv("DICK_CAREY_MODEL_STRONG")
+        if not strong:
+            raise
+    return parse_json_response(await _ainvoke(prompt, strong))
+
+
+# Disk cache of successful LLM results keyed by tool name and inputs, so re-running a
+# scenario skips the LLM; enabled by pointing DICK_CAREY_CACHE_DIR at a directory
+def _disk_cache_key(tool_name: str, args: dict) -> Optional[str]:
+    """Key for a tool call, or None when disabled or the inputs are not JSON-serializable"""
+    if not os.getenv("DICK_CAREY_CACHE_DIR"):
+        return None
+    provider = _provider_name()
+    # Every model _generate_json may route to, since either can have produced the cached result
+    models = [os.getenv("DICK_CAREY_MODEL_FAST") or _default_model(provider), os.getenv("DICK_CAREY_MODEL_STRONG")]
+    try:
+        payload = orjson.dumps(
+            {"tool": tool_name, "provider": provider, "models": models, "args": args},
+            option=orjson.OPT_SORT_KEYS,
+        )
+    except TypeError:  # e.g. non-str dict keys; the call still runs, just uncached
+        return None
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _disk_cache_get(key: Optional[str]) -> Optional[dict]:
+    if key is None:
+        return None
+    try:
+        return orjson.loads((Path(os.environ["DICK_CAREY_CACHE_DIR"]) / f"{key}.json").read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _disk_cache_put(key: Optional[str], value: dict) -> dict:
+    """Store a result (atomically, via rename) and return it; empty results are not cached"""
+    if key is not None and value:
+        try:
+            cache_dir = Path(os.environ["DICK_CAREY_CACHE_DIR"])
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(value))
+            os.replace(tmp, cache_dir / f"{key}.json")
+        except OSError:
+            pass
+    return value
+
+
+# Upper bound for a dict input spliced into a prompt; larger inputs (e.g. a learner analysis
+# embedding full transcripts) have their string values cut to an even share of the budget
+_INPUT_MAX_CHARS = 4096
+_MIN_FIELD_CHARS = 40
+
+
+def _count_strings(value) -> int:
+    if isinstance(value, str):
+        return 1
+    if isinstance(value, dict):
+        return sum(_count_strings(v) for v in value.values())
+    if isinstance(value, list):
+        return sum(_count_strings(v) for v in value)
+    return 0
+
+
+def _truncate_strings(value, limit: int):
+    if isinstance(value, str):
+        return value if len(value) <= limit else value[:limit] + "…"
+    if isinstance(value, dict):
+        return {k: _truncate_strings(v, limit) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_truncate_strings(v, limit) for v in value]
+    return value
+
+
+def _dumps_bounded(value, max_chars: int = _INPUT_MAX_CHARS) -> str:
+    """Serialize a prompt input, truncating its string values if the JSON exceeds max_chars"""
+    text = _dumps(value)
+    if len(text) <= max_chars:
+        return text
+    limit = max(max_chars // max(_count_strings(value), 1), _MIN_FIELD_CHARS)
+    return _dumps(_truncate_strings(value, limit))
+
+
+# ========== Step 6: Instructional Strategy Development ==========
+_INSTRUCTIONAL_STRATEGY_SYSTEM_PROMPT = """You are an expert in the Dick & Carey model. Develop an effective Instructional Strategy based on the information provided by the user.
 
 ## Dick & Carey's Instructional Strategy Components
 1. Pre-instructional Activities
@@ -133,7 +360,7 @@ def develop_instructional_strategy(
 2. content_presentation: Content presentation (sequence, examples, non_examples, practice_guidance)
 3. learner_participation: Learner participation (practice_activities minimum 3, feedback_strategy)
 4. assessment: Assessment strategy (assessment_strategy, retention_transfer)
-5. delivery_method: Delivery method
+5. delivery_method: Delivery method (use the given Learning Environment)
 6. grouping_strategy: Grouping strategy
 7. content_selection (D-13): Content selection (core_content, supplementary_content, selection_rationale)
 8. non_instructional_strategy (D-15): Non-instructional strategy development (strategies, rationale, implementation)
@@ -141,13 +368,13 @@ def develop_instructional_strategy(
 
 ## Output Format (JSON)
 ```json
-{{
-  "pre_instructional": {{
+{
+  "pre_instructional": {
     "motivation": "Present application cases from actual work situations to help recognize the necessity and usefulness of learning. Motivate through successful case examples.",
     "objectives_info": "Clearly present performance objectives before learning begins, and guide specific outcomes to achieve after learning.",
     "prerequisite_review": "Confirm prior learning through brief pre-quiz. Provide supplementary materials for deficient areas."
-  }},
-  "content_presentation": {{
+  },
+  "content_presentation": {
     "sequence": [
       "1. Introduction and definition of core concepts",
       "2. Explanation of principles and theoretical background",
@@ -165,8 +392,8 @@ def develop_instructional_strategy(
       "Common mistake patterns"
     ],
     "practice_guidance": "Provide immediate practice opportunities after concept explanation. Gradually increase difficulty through practice."
-  }},
-  "learner_participation": {{
+  },
+  "learner_participation": {
     "practice_activities": [
       "Concept confirmation quiz: Check understanding of core concepts",
       "Case analysis activity: Analyze and discuss presented cases",
@@ -174,39 +401,134 @@ def develop_instructional_strategy(
       "Collaborative project: Team problem-solving activities"
     ],
     "feedback_strategy": "Provide immediate and specific feedback. Guide improvement direction beyond just right/wrong. Utilize peer feedback."
-  }},
-  "assessment": {{
+  },
+  "assessment": {
     "assessment_strategy": "Combine formative and summative assessment. Regularly check understanding during learning, conduct comprehensive evaluation after learning.",
     "retention_transfer": "Assign tasks to apply learning content to actual work. Provide regular review opportunities. Run application case sharing sessions."
-  }},
-  "delivery_method": "{learning_environment}",
+  },
+  "delivery_method": "[Learning Environment]",
   "grouping_strategy": "Appropriately mix individual learning, small group collaborative learning (3-5 people), and whole class discussion",
-  "content_selection": {{
+  "content_selection": {
     "core_content": ["Core concepts and principles", "Basic procedures and methods", "Key application cases"],
     "supplementary_content": ["Advanced theory", "Advanced techniques", "Reference materials"],
     "selection_rationale": "Prioritize core content essential for achieving learning objectives, and organize supplementary content considering learner level and time constraints."
-  }},
-  "non_instructional_strategy": {{
+  },
+  "non_instructional_strategy": {
     "strategies": ["Provide work manuals and guides", "Establish mentoring/coaching system", "Improve performance management and feedback system", "Improve work environment"],
     "rationale": "Non-instructional support strategies to complement environmental and organizational factors that cannot be solved by training alone",
     "implementation": "Build support systems that can be immediately applied in the workplace alongside training"
-  }},
-  "media_selection": {{
+  },
+  "media_selection": {
     "selected_media": ["Presentation", "Video", "Practice environment", "Print materials"],
     "selection_criteria": "Selected considering learning objective type, learning environment, learner characteristics, and cost efficiency",
     "utilization_plan": "Motivate with video in introduction, combine presentation and practice in main content, distribute handouts for wrap-up"
-  }}
-}}
+  }
+}
 ```
 
 Output JSON only."""
 
-        response = llm.invoke(prompt)
-        return parse_json_response(response.content)
+_INSTRUCTIONAL_STRATEGY_USER_TEMPLATE = """## Input Information
+- Performance Objectives: {performance_objectives_json}
+- Learner Analysis: {learner_analysis_json}
+- Learning Environment: {learning_environment}
+- Duration: {duration}"""
+
+
+def _instructional_strategy_user_message(
+    performance_objectives: dict,
+    learner_analysis: dict,
+    learning_environment: str,
+    duration: str,
+) -> str:
+    """Render the per-call inputs of the instructional strategy prompt"""
+    return _INSTRUCTIONAL_STRATEGY_USER_TEMPLATE.format_map({
+        "performance_objectives_json": _dumps_bounded(performance_objectives),
+        "learner_analysis_json": _dumps_bounded(learner_analysis),
+        "learning_environment": learning_environment,
+        "duration": duration,
+    })
+
+
+def _instructional_strategy_messages(
+    performance_objectives: dict,
+    learner_analysis: dict,
+    learning_environment: str,
+    duration: str,
+) -> list:
+    """Build the instructional strategy messages (shared by the sync and async tool paths)"""
+    return [
+        SystemMessage(content=_INSTRUCTIONAL_STRATEGY_SYSTEM_PROMPT),
+        HumanMessage(content=_instructional_strategy_user_message(
+            performance_objectives, learner_analysis, learning_environment, duration
+        )),
+    ]
+
+
+@tool
+def develop_instructional_strategy(
+    performance_objectives: dict,
+    learner_analysis: dict,
+    learning_environment: str,
+    duration: str,
+) -> dict:
+    """
+    Develop instructional strategy. (Dick & Carey Step 6)
+
+    Design instructional strategies for achieving learning objectives.
+    Consists of pre-instructional activities, content presentation, learner participation, and assessment.
+
+    Args:
+        performance_objectives: Performance objectives
+        learner_analysis: Learner analysis results
+        learning_environment: Learning environment
+        duration: Learning duration
+
+    Returns:
+        Instructional strategy result (pre_instructional, content_presentation, learner_participation, assessment, delivery_method, grouping_strategy)
+    """
+    cache_key = _disk_cache_key("develop_instructional_strategy", {
+        "performance_objectives": performance_objectives,
+        "learner_analysis": learner_analysis,
+        "learning_environment": learning_environment,
+        "duration": duration,
+    })
+    cached = _disk_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        prompt = _instructional_strategy_messages(performance_objectives, learner_analysis, learning_environment, duration)
+        return _disk_cache_put(cache_key, _generate_json(prompt))
+    except Exception:
+        return _fallback_develop_instructional_strategy(performance_objectives, learner_analysis, learning_environment, duration)
+
+
+async def _adevelop_instructional_strategy(
+    performance_objectives: dict,
+    learner_analysis: dict,
+    learning_environment: str,
+    duration: str,
+) -> dict:
+    """Async variant of develop_instructional_strategy"""
+    cache_key = _disk_cache_key("develop_instructional_strategy", {
+        "performance_objectives": performance_objectives,
+        "learner_analysis": learner_analysis,
+        "learning_environment": learning_environment,
+        "duration": duration,
+    })
+    cached = _disk_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        prompt = _instructional_strategy_messages(performance_objectives, learner_analysis, learning_environment, duration)
+        return _disk_cache_put(cache_key, await _agenerate_json(prompt))
     except Exception:
         return _fallback_develop_instructional_strategy(performance_objectives, learner_analysis, learning_environment, duration)
 
 
+develop_instructional_strategy.coroutine = _adevelop_instructional_strategy
+
+
 def _fallback_develop_instructional_strategy(
     performance_objectives: dict,
     learner_analysis: dict,
@@ -274,40 +596,7 @@ def _fallback_develop_instructional_strategy(
 
 
 # ========== Step 7: Instructional Materials Development ==========
-@tool
-def develop_instructional_materials(
-    instructional_strategy: dict,
-    performance_objectives: dict,
-    learning_environment: str,
-    duration: str,
-    topic_title: str,
-) -> dict:
-    """
-    Develop instructional materials. (Dick & Carey Step 7)
-
-    Develop instructor guide, learner materials, and media materials according to instructional strategy.
-
-    Args:
-        instructional_strategy: Instructional strategy
-        performance_objectives: Performance objectives
-        learning_environment: Learning environment
-        duration: Learning duration
-        topic_title: Topic title
-
-    Returns:
-        Instructional materials result (instructor_guide, learner_materials, media_list, slide_contents)
-    """
-    try:
-        llm = get_llm()
-
-        prompt = f"""You are an expert in the Dick & Carey model. Develop effective Instructional Materials.
-
-## Input Information
-- Topic: {topic_title}
-- Instructional Strategy: {json.dumps(instructional_strategy, ensure_ascii=False)}
-- Performance Objectives: {json.dumps(performance_objectives, ensure_ascii=False)}
-- Learning Environment: {learning_environment}
-- Duration: {duration}
+_INSTRUCTIONAL_MATERIALS_SYSTEM_PROMPT = """You are an expert in the Dick & Carey model. Develop effective Instructional Materials based on the information provided by the user.
 
 ## Dick & Carey's Instructional Materials Development Principles
 1. Instructional materials are tools that implement instructional strategy
@@ -330,40 +619,40 @@ def develop_instructional_materials(
 - operator_manual: Markdown format, include sections (training preparation/day-of operation/post-processing/emergency response)
 
 ```json
-{{
-  "instructor_guide": {{
+{
+  "instructor_guide": {
     "type": "Instructor Guide",
     "title": "[Topic] Lesson Facilitation Guide",
     "description": "Detailed facilitation guide for instructors",
     "content_outline": ["Lesson overview", "Introduction facilitation", "Main content facilitation", "Activity facilitation", "Wrap-up"],
     "pages": 15,
     "duration": "[Duration]"
-  }},
+  },
   "learner_materials": [
-    {{"type": "Learner Workbook", "title": "[Topic] Learning Workbook", "description": "Learning content summary and practice problems", "content_outline": ["Concept summary", "Practice problems", "Practice assignments"], "pages": 20}},
-    {{"type": "Handout", "title": "[Topic] Key Summary", "description": "Key concept summary", "content_outline": ["Core concepts", "Key procedures"], "pages": 2}},
-    {{"type": "Practice Guide", "title": "[Topic] Practice Guide", "description": "Step-by-step practice guide", "content_outline": ["Practice objectives", "Step-by-step procedures"], "pages": 8}}
+    {"type": "Learner Workbook", "title": "[Topic] Learning Workbook", "description": "Learning content summary and practice problems", "content_outline": ["Concept summary", "Practice problems", "Practice assignments"], "pages": 20},
+    {"type": "Handout", "title": "[Topic] Key Summary", "description": "Key concept summary", "content_outline": ["Core concepts", "Key procedures"], "pages": 2},
+    {"type": "Practice Guide", "title": "[Topic] Practice Guide", "description": "Step-by-step practice guide", "content_outline": ["Practice objectives", "Step-by-step procedures"], "pages": 8}
   ],
   "media_list": [
-    {{"type": "Presentation", "title": "[Topic] PPT", "description": "Lesson PPT", "duration": "[Duration]"}},
-    {{"type": "Video", "title": "[Topic] Concept Video", "description": "Core concept explanation video", "duration": "10 min"}}
+    {"type": "Presentation", "title": "[Topic] PPT", "description": "Lesson PPT", "duration": "[Duration]"},
+    {"type": "Video", "title": "[Topic] Concept Video", "description": "Core concept explanation video", "duration": "10 min"}
   ],
   "slide_contents": [
-    {{"slide_number": 1, "title": "Learning Guide", "bullet_points": ["Learning topic", "Learning objectives", "Learning sequence"], "speaker_notes": "Guide overall flow", "visual_suggestion": "Display title and objectives"}},
-    {{"slide_number": 5, "title": "Core Concepts", "bullet_points": ["Concept definition", "Key features", "Examples"], "speaker_notes": "Explain core concepts", "visual_suggestion": "Concept diagram"}},
-    {{"slide_number": 10, "title": "Next Steps", "bullet_points": ["Assignment guidance", "Next learning preview"], "speaker_notes": "Wrap-up and assignment guidance", "visual_suggestion": "Checklist"}}
+    {"slide_number": 1, "title": "Learning Guide", "bullet_points": ["Learning topic", "Learning objectives", "Learning sequence"], "speaker_notes": "Guide overall flow", "visual_suggestion": "Display title and objectives"},
+    {"slide_number": 5, "title": "Core Concepts", "bullet_points": ["Concept definition", "Key features", "Examples"], "speaker_notes": "Explain core concepts", "visual_suggestion": "Concept diagram"},
+    {"slide_number": 10, "title": "Next Steps", "bullet_points": ["Assignment guidance", "Next learning preview"], "speaker_notes": "Wrap-up and assignment guidance", "visual_suggestion": "Checklist"}
   ],
   "instructor_manual": "# [Topic] Instructor Manual\\n\\n## 1. Preparation\\n...\\n\\n## 2. Lesson Facilitation Guide\\n...\\n\\n## 3. Assessment and Feedback\\n...\\n\\n## 4. Problem Situation Response\\n...",
   "operator_manual": "# [Topic] Operator Manual\\n\\n## 1. Training Preparation\\n...\\n\\n## 2. Day-of Operation\\n...\\n\\n## 3. Post-processing\\n...\\n\\n## 4. Emergency Response\\n...",
-  "expert_review": {{
+  "expert_review": {
     "reviewer": "Instructional design expert",
     "review_date": "Within 1 week after development completion",
     "review_areas": ["Content accuracy", "Objective-content alignment", "Strategy appropriateness"],
     "findings": ["Key review findings"],
     "recommendations": ["Improvement recommendations"],
     "approval_status": "Approval status"
-  }}
-}}
+  }
+}
 ```
 
 **Required Elements**:
@@ -372,12 +661,115 @@ def develop_instructional_materials(
 
 Output JSON only."""
 
-        response = llm.invoke(prompt)
-        return parse_json_response(response.content)
+_INSTRUCTIONAL_MATERIALS_USER_TEMPLATE = """## Input Information
+- Topic: {topic_title}
+- Instructional Strategy: {instructional_strategy_json}
+- Performance Objectives: {performance_objectives_json}
+- Learning Environment: {learning_environment}
+- Duration: {duration}"""
+
+
+def _instructional_materials_user_message(
+    instructional_strategy,
+    performance_objectives: dict,
+    learning_environment: str,
+    duration: str,
+    topic_title: str,
+) -> str:
+    """Render the per-call inputs of the instructional materials prompt"""
+    return _INSTRUCTIONAL_MATERIALS_USER_TEMPLATE.format_map({
+        "topic_title": topic_title,
+        "instructional_strategy_json": _dumps(instructional_strategy),
+        "performance_objectives_json": _dumps_bounded(performance_objectives),
+        "learning_environment": learning_environment,
+        "duration": duration,
+    })
+
+
+def _instructional_materials_messages(
+    instructional_strategy: dict,
+    performance_objectives: dict,
+    learning_environment: str,
+    duration: str,
+    topic_title: str,
+) -> list:
+    """Build the instructional materials messages (shared by the sync and async tool paths)"""
+    return [
+        SystemMessage(content=_INSTRUCTIONAL_MATERIALS_SYSTEM_PROMPT),
+        HumanMessage(content=_instructional_materials_user_message(
+            instructional_strategy, performance_objectives, learning_environment, duration, topic_title
+        )),
+    ]
+
+
+@tool
+def develop_instructional_materials(
+    instructional_strategy: dict,
+    performance_objectives: dict,
+    learning_environment: str,
+    duration: str,
+    topic_title: str,
+) -> dict:
+    """
+    Develop instructional materials. (Dick & Carey Step 7)
+
+    Develop instructor guide, learner materials, and media materials according to instructional strategy.
+
+    Args:
+        instructional_strategy: Instructional strategy
+        performance_objectives: Performance objectives
+        learning_environment: Learning environment
+        duration: Learning duration
+        topic_title: Topic title
+
+    Returns:
+        Instructional materials result (instructor_guide, learner_materials, media_list, slide_contents)
+    """
+    cache_key = _disk_cache_key("develop_instructional_materials", {
+        "instructional_strategy": instructional_strategy,
+        "performance_objectives": performance_objectives,
+        "learning_environment": learning_environment,
+        "duration": duration,
+        "topic_title": topic_title,
+    })
+    cached = _disk_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        prompt = _instructional_materials_messages(instructional_strategy, performance_objectives, learning_environment, duration, topic_title)
+        return _disk_cache_put(cache_key, _generate_json(prompt))
+    except Exception:
+        return _fallback_develop_instructional_materials(instructional_strategy, performance_objectives, learning_environment, duration, topic_title)
+
+
+async def _adevelop_instructional_materials(
+    instructional_strategy: dict,
+    performance_objectives: dict,
+    learning_environment: str,
+    duration: str,
+    topic_title: str,
+) -> dict:
+    """Async variant of develop_instructional_materials"""
+    cache_key = _disk_cache_key("develop_instructional_materials", {
+        "instructional_strategy": instructional_strategy,
+        "performance_objectives": performance_objectives,
+        "learning_environment": learning_environment,
+        "duration": duration,
+        "topic_title": topic_title,
+    })
+    cached = _disk_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        prompt = _instructional_materials_messages(instructional_strategy, performance_objectives, learning_environment, duration, topic_title)
+        return _disk_cache_put(cache_key, await _agenerate_json(prompt))
     except Exception:
         return _fallback_develop_instructional_materials(instructional_strategy, performance_objectives, learning_environment, duration, topic_title)
 
 
+develop_instructional_materials.coroutine = _adevelop_instructional_materials
+
+
 def _fallback_develop_instructional_materials(
     instructional_strategy: dict,
     performance_objectives: dict,
@@ -585,3 +977,120 @@ def _fallback_develop_instructional_materials(
             "approval_status": "Conditional approval - applicable after minor revisions",
         },
     }
+
+
+# ========== Steps 6-7: Combined Strategy and Materials Development ==========
+_STRATEGY_AND_MATERIALS_SYSTEM_PROMPT = """You are an expert in the Dick & Carey model. Complete the two steps below in a single response. The instructional materials in Part 2 must follow the instructional strategy you write in Part 1.
+
+# Part 1: instructional_strategy
+""" + _INSTRUCTIONAL_STRATEGY_SYSTEM_PROMPT + """
+
+# Part 2: instructional_materials
+""" + _INSTRUCTIONAL_MATERIALS_SYSTEM_PROMPT + """
+
+## Combined Output Format (JSON)
+Return ONE JSON object with exactly two keys, each holding the JSON described in its part:
+```json
+{"instructional_strategy": {...}, "instructional_materials": {...}}
+```
+
+Output JSON only."""
+
+_FUSED_KEYS = ("instructional_strategy", "instructional_materials")
+
+
+def _strategy_and_materials_messages(
+    performance_objectives: dict,
+    learner_analysis: dict,
+    learning_environment: str,
+    duration: str,
+    topic_title: str,
+) -> list:
+    """Build the fused Step 6-7 messages from the two single-step parts"""
+    strategy_input = _instructional_strategy_user_message(
+        performance_objectives, learner_analysis, learning_environment, duration
+    )
+    materials_input = _instructional_materials_user_message(
+        "The instructional strategy you write in Part 1",
+        performance_objectives, learning_environment, duration, topic_title,
+    )
+    return [
+        SystemMessage(content=_STRATEGY_AND_MATERIALS_SYSTEM_PROMPT),
+        HumanMessage(content=f"# Part 1\n{strategy_input}\n\n# Part 2\n{materials_input}"),
+    ]
+
+
+def _split_fused_result(result: dict) -> dict:
+    """Keep only the parts of a fused response that are non-empty objects"""
+    return {k: result[k] for k in _FUSED_KEYS if isinstance(result.get(k), dict) and result[k]}
+
+
+@tool
+def develop_strategy_and_materials(
+    performance_objectives: dict,
+    learner_analysis: dict,
+    learning_environment: str,
+    duration: str,
+    topic_title: str,
+) -> dict:
+    """
+    Develop the instructional strategy and instructional materials in one LLM call. (Dick & Carey Steps 6 & 7)
+
+    Args:
+        performance_objectives: Performance objectives
+        learner_analysis: Learner analysis results
+        learning_environment: Learning environment
+        duration: Learning duration
+        topic_title: Topic title
+
+    Returns:
+        Dict with "instructional_strategy" and "instructional_materials" results; parts the model
+        did not return are omitted so callers can fall back to the individual tools
+    """
+    cache_key = _disk_cache_key("develop_strategy_and_materials", {
+        "performance_objectives": performance_objectives,
+        "learner_analysis": learner_analysis,
+        "learning_environment": learning_environment,
+        "duration": duration,
+        "topic_title": topic_title,
+    })
+    cached = _disk_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        prompt = _strategy_and_materials_messages(
+            performance_objectives, learner_analysis, learning_environment, duration, topic_title
+        )
+        return _disk_cache_put(cache_key, _split_fused_result(_generate_json(prompt)))
+    except Exception:
+        return {}
+
+
+async def _adevelop_strategy_and_materials(
+    performance_objectives: dict,
+    learner_analysis: dict,
+    learning_environment: str,
+    duration: str,
+    topic_title: str,
+) -> dict:
+    """Async variant of develop_strategy_and_materials"""
+    cache_key = _disk_cache_key("develop_strategy_and_materials", {
+        "performance_objectives": performance_objectives,
+        "learner_analysis": learner_analysis,
+        "learning_environment": learning_environment,
+        "duration": duration,
+        "topic_title": topic_title,
+    })
+    cached = _disk_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        prompt = _strategy_and_materials_messages(
+            performance_objectives, learner_analysis, learning_environment, duration, topic_title
+        )
+        return _disk_cache_put(cache_key, _split_fused_result(await _agenerate_json(prompt)))
+    except Exception:
+        return {}
+
+
+develop_strategy_and_materials.coroutine = _adevelop_strategy_and_materials
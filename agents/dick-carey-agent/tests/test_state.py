@@ -12,6 +12,48 @@ from dick_carey_agent.state import (
     map_to_addie_output,
 )
 
+# 결과 필수 키 (모듈 로드 시 1회 생성)
+ADDIE_PHASE_KEYS = frozenset({"analysis", "design", "development", "implementation", "evaluation"})
+
+# Dick & Carey 단계 값
+VALID_PHASES = (
+    "goal",
+    "instructional_analysis",
+    "learner_context",
+    "performance_objectives",
+    "assessment_instruments",
+    "instructional_strategy",
+    "instructional_materials",
+    "formative_evaluation",
+    "revision",
+    "summative_evaluation",
+    "complete",
+)
+
+
+@pytest.fixture(scope="module")
+def base_scenario():
+    """모듈 공용 기본 시나리오"""
+    return ScenarioInput(scenario_id="TEST")
+
+
+@pytest.fixture(scope="module")
+def empty_dc_state():
+    """모듈 공용 빈 상태 (읽기 전용, 수정이 필요하면 복사하여 사용)"""
+    return DickCareyState(
+        scenario={},
+        goal={},
+        instructional_analysis={},
+        learner_context={},
+        performance_objectives={},
+        assessment_instruments={},
+        instructional_strategy={},
+        instructional_materials={},
+        formative_evaluation={},
+        revision_log=[],
+        summative_evaluation={},
+    )
+
 
 class TestCreateInitialState:
     """create_initial_state 함수 테스트"""
@@ -59,6 +101,18 @@ class TestCreateInitialState:
         assert state["revision_log"] == []
         assert state["summative_evaluation"] == {}
 
+    def test_empty_results_are_independent(self, base_scenario):
+        """초기 결과 필드가 상태 간 공유되지 않고 직렬화 가능한지 테스트"""
+        import copy
+        import json
+
+        state = create_initial_state(base_scenario)
+        state["goal"]["goal_statement"] = "변경"
+
+        assert create_initial_state(base_scenario)["goal"] == {}
+        json.dumps(state, ensure_ascii=False, default=str)
+        assert copy.deepcopy(state)["goal"] == {"goal_statement": "변경"}
+
     def test_metadata_initialization(self):
         """메타데이터 초기화 테스트"""
         scenario = ScenarioInput(scenario_id="TEST-003")
@@ -73,29 +127,12 @@ class TestCreateInitialState:
 class TestMapToAddieOutput:
     """map_to_addie_output 함수 테스트"""
 
-    def test_empty_state_mapping(self):
+    def test_empty_state_mapping(self, empty_dc_state):
         """빈 상태 매핑 테스트"""
-        state = DickCareyState(
-            scenario={},
-            goal={},
-            instructional_analysis={},
-            learner_context={},
-            performance_objectives={},
-            assessment_instruments={},
-            instructional_strategy={},
-            instructional_materials={},
-            formative_evaluation={},
-            revision_log=[],
-            summative_evaluation={},
-        )
-
-        addie = map_to_addie_output(state)
+        addie = map_to_addie_output(empty_dc_state)
 
-        assert "analysis" in addie
-        assert "design" in addie
-        assert "development" in addie
-        assert "implementation" in addie
-        assert "evaluation" in addie
+        missing = ADDIE_PHASE_KEYS - addie.keys()
+        assert not missing, missing
 
     def test_mapping_structure(self):
         """매핑 구조 테스트"""
@@ -150,26 +187,16 @@ class TestMapToAddieOutput:
 class TestDickCareyPhases:
     """Dick & Carey 단계 테스트"""
 
-    def test_phase_values(self):
+    def test_phase_values(self, base_scenario):
         """단계 값 테스트"""
+        from typing import get_args
         from dick_carey_agent.state import DickCareyPhase
 
-        valid_phases = [
-            "goal",
-            "instructional_analysis",
-            "learner_context",
-            "performance_objectives",
-            "assessment_instruments",
-            "instructional_strategy",
-            "instructional_materials",
-            "formative_evaluation",
-            "revision",
-            "summative_evaluation",
-            "complete",
-        ]
+        # 테스트 단계 목록이 DickCareyPhase 정의와 일치하는지 확인
+        assert VALID_PHASES == get_args(DickCareyPhase)
 
         # 모든 단계가 유효한지 확인
-        for phase in valid_phases:
-            state = create_initial_state(ScenarioInput(scenario_id="TEST"))
+        state = create_initial_state(base_scenario)
+        for phase in VALID_PHASES:
             state["current_phase"] = phase
             assert state["current_phase"] == phase
@@ -25,6 +25,112 @@ from dick_carey_agent.tools.evaluation import (
     _fallback_conduct_summative_evaluation,
 )
 
+# 결과 필수 키 (모듈 로드 시 1회 생성)
+GOAL_KEYS = frozenset({"goal_statement", "target_domain", "performance_gap"})
+INSTRUCTIONAL_ANALYSIS_KEYS = frozenset({"task_type", "sub_skills", "skill_hierarchy", "entry_skills"})
+LEARNER_ANALYSIS_KEYS = frozenset({"target_audience", "entry_behaviors", "characteristics", "learning_preferences", "motivation"})
+CONTEXT_ANALYSIS_KEYS = frozenset({"performance_context", "learning_context", "constraints", "resources"})
+OBJECTIVE_KEYS = frozenset({"objective_name", "audience", "behavior", "condition", "degree"})
+ASSESSMENT_KEYS = frozenset({"entry_test", "practice_tests", "post_test", "alignment_matrix"})
+STRATEGY_KEYS = frozenset({"pre_instructional", "content_presentation", "learner_participation", "assessment", "delivery_method", "grouping_strategy"})
+MATERIALS_KEYS = frozenset({"instructor_guide", "learner_materials", "media_list", "slide_contents"})
+FORMATIVE_KEYS = frozenset({"quality_score", "one_to_one_findings", "small_group_findings", "field_trial_findings", "strengths", "weaknesses", "revision_recommendations"})
+REVISION_KEYS = frozenset({"iteration", "revision_items", "summary"})
+SUMMATIVE_KEYS = frozenset({"effectiveness_score", "efficiency_analysis", "learner_satisfaction", "goal_achievement", "recommendations", "decision"})
+PERFORMANCE_OBJECTIVES_KEYS = frozenset({"terminal_objective", "enabling_objectives"})
+REVISION_ITEM_KEYS = frozenset({"issue", "target_phase", "action", "status"})
+
+# 폴백 도구별 (함수, 입력, 필수 키)
+FALLBACK_CASES = [
+    pytest.param(
+        _fallback_set_instructional_goal,
+        {"learning_goals": ["목표 1", "목표 2"], "target_audience": "신입사원",
+         "current_state": "기초 수준", "desired_state": "전문가 수준"},
+        GOAL_KEYS,
+        id="set_instructional_goal",
+    ),
+    pytest.param(
+        _fallback_analyze_instruction,
+        {"instructional_goal": "테스트 목표", "domain": "IT", "learning_goals": ["목표 1", "목표 2"]},
+        INSTRUCTIONAL_ANALYSIS_KEYS,
+        id="analyze_instruction",
+    ),
+    pytest.param(
+        _fallback_analyze_entry_behaviors,
+        {"target_audience": "신입사원", "prior_knowledge": "기초 지식", "entry_skills": ["기초 용어", "컴퓨터 활용"]},
+        LEARNER_ANALYSIS_KEYS,
+        id="analyze_entry_behaviors",
+    ),
+    pytest.param(
+        _fallback_analyze_context,
+        {"learning_environment": "온라인", "duration": "2시간", "performance_context": "실무 현장",
+         "class_size": 30, "resources": None},
+        CONTEXT_ANALYSIS_KEYS,
+        id="analyze_context",
+    ),
+    pytest.param(
+        _fallback_write_performance_objectives,
+        {"instructional_goal": "테스트 목표", "sub_skills": [{"skill_name": "핵심 개념 이해"}],
+         "target_audience": "신입사원"},
+        PERFORMANCE_OBJECTIVES_KEYS,
+        id="write_performance_objectives",
+    ),
+    pytest.param(
+        _fallback_develop_assessment_instruments,
+        {"performance_objectives": {}, "learning_environment": "온라인", "duration": "2시간"},
+        ASSESSMENT_KEYS,
+        id="develop_assessment_instruments",
+    ),
+    pytest.param(
+        _fallback_develop_instructional_strategy,
+        {"performance_objectives": {}, "learner_analysis": {}, "learning_environment": "온라인", "duration": "2시간"},
+        STRATEGY_KEYS,
+        id="develop_instructional_strategy",
+    ),
+    pytest.param(
+        _fallback_develop_instructional_materials,
+        {"instructional_strategy": {}, "performance_objectives": {}, "learning_environment": "온라인",
+         "duration": "2시간", "topic_title": "테스트 주제"},
+        MATERIALS_KEYS,
+        id="develop_instructional_materials",
+    ),
+    pytest.param(
+        _fallback_conduct_formative_evaluation,
+        {"instructional_materials": {}, "performance_objectives": {}, "assessment_instruments": {}, "iteration": 1},
+        FORMATIVE_KEYS,
+        id="conduct_formative_evaluation",
+    ),
+    pytest.param(
+        _fallback_revise_instruction,
+        {"formative_evaluation": {"revision_recommendations": ["수정 1", "수정 2", "수정 3"]},
+         "current_state": {}, "iteration": 1},
+        REVISION_KEYS,
+        id="revise_instruction",
+    ),
+    pytest.param(
+        _fallback_conduct_summative_evaluation,
+        {"final_state": {}, "performance_objectives": {}, "total_iterations": 2},
+        SUMMATIVE_KEYS,
+        id="conduct_summative_evaluation",
+    ),
+]
+
+
+@pytest.fixture(scope="session")
+def formative_results():
+    """반복 차수별 형성평가 폴백 결과 (세션 공용, 읽기 전용)"""
+    return {i: _fallback_conduct_formative_evaluation({}, {}, {}, iteration=i) for i in (1, 2, 3)}
+
+
+class TestFallbackContract:
+    """폴백 도구 공통 출력 키 테스트"""
+
+    @pytest.mark.parametrize("fn,kwargs,required", FALLBACK_CASES)
+    def test_fallback_contract(self, fn, kwargs, required):
+        """폴백 결과에 필수 키가 모두 있는지 테스트"""
+        missing = required - fn(**kwargs).keys()
+        assert not missing, missing
+
 
 class TestGoalAnalysisTools:
     """1-3단계 도구 폴백 테스트"""
@@ -38,11 +144,18 @@ class TestGoalAnalysisTools:
             desired_state="전문가 수준",
         )
 
-        assert "goal_statement" in result
-        assert "target_domain" in result
-        assert "performance_gap" in result
         assert "신입사원" in result["goal_statement"]
 
+    def test_set_instructional_goal_fallback_returns_copy(self):
+        """교수목적 폴백 결과 수정이 프롬프트 예시와 이후 결과에 영향을 주지 않는지 테스트"""
+        from dick_carey_agent.tools import goal_analysis
+
+        result = _fallback_set_instructional_goal(["목표"], "신입사원")
+        result["needs_analysis"]["root_causes"].append("변경됨")
+
+        assert "변경됨" not in goal_analysis._NEEDS_ANALYSIS_EXAMPLE["root_causes"]
+        assert "변경됨" not in _fallback_set_instructional_goal(["목표"], "신입사원")["needs_analysis"]["root_causes"]
+
     def test_analyze_instruction_fallback(self):
         """교수분석 폴백 테스트"""
         result = _fallback_analyze_instruction(
@@ -51,12 +164,20 @@ class TestGoalAnalysisTools:
             learning_goals=["목표 1", "목표 2"],
         )
 
-        assert "task_type" in result
-        assert "sub_skills" in result
-        assert "skill_hierarchy" in result
-        assert "entry_skills" in result
         assert len(result["sub_skills"]) >= 5
 
+    def test_analyze_instruction_fallback_input_dependent_skills(self):
+        """교수분석 폴백: 입력에 따른 하위기능 설명과 호출별 독립 결과 테스트"""
+        first = _fallback_analyze_instruction("목표 A", learning_goals=["목표 A"])
+        second = _fallback_analyze_instruction("목표 B", learning_goals=["목표 B"])
+
+        assert "목표 A" in first["sub_skills"][0]["description"]
+        assert first["sub_skills"][1]["prerequisites"] == [first["sub_skills"][0]["description"]]
+        assert second["sub_skills"][1]["prerequisites"] == [second["sub_skills"][0]["description"]]
+        assert first["sub_skills"][-1] == second["sub_skills"][-1]
+        assert first["sub_skills"][-1] is not second["sub_skills"][-1]
+        assert list(first["skill_hierarchy"]) == [f"level_{i}" for i in range(1, 6)]
+
     def test_analyze_entry_behaviors_fallback(self):
         """학습자 분석 폴백 테스트"""
         result = _fallback_analyze_entry_behaviors(
@@ -65,11 +186,6 @@ class TestGoalAnalysisTools:
             entry_skills=["기초 용어", "컴퓨터 활용"],
         )
 
-        assert "target_audience" in result
-        assert "entry_behaviors" in result
-        assert "characteristics" in result
-        assert "learning_preferences" in result
-        assert "motivation" in result
         assert len(result["characteristics"]) >= 5
 
     def test_analyze_context_fallback_online(self):
@@ -82,10 +198,6 @@ class TestGoalAnalysisTools:
             resources=None,
         )
 
-        assert "performance_context" in result
-        assert "learning_context" in result
-        assert "constraints" in result
-        assert "resources" in result
         assert len(result["constraints"]) >= 3
 
     def test_analyze_context_fallback_offline(self):
@@ -120,14 +232,9 @@ class TestObjectiveAssessmentTools:
             target_audience="신입사원",
         )
 
-        assert "terminal_objective" in result
-        assert "enabling_objectives" in result
         assert len(result["enabling_objectives"]) >= 5
-        assert "objective_name" in result["terminal_objective"]
-        assert "audience" in result["terminal_objective"]
-        assert "behavior" in result["terminal_objective"]
-        assert "condition" in result["terminal_objective"]
-        assert "degree" in result["terminal_objective"]
+        missing = OBJECTIVE_KEYS - result["terminal_objective"].keys()
+        assert not missing, missing
 
     def test_develop_assessment_instruments_fallback(self):
         """평가도구 개발 폴백 테스트"""
@@ -146,10 +253,6 @@ class TestObjectiveAssessmentTools:
             duration="2시간",
         )
 
-        assert "entry_test" in result
-        assert "practice_tests" in result
-        assert "post_test" in result
-        assert "alignment_matrix" in result
         assert len(result["entry_test"]) >= 3
         assert len(result["practice_tests"]) >= 3
         assert len(result["post_test"]) >= 5
@@ -167,14 +270,21 @@ class TestStrategyMaterialsTools:
             duration="2시간",
         )
 
-        assert "pre_instructional" in result
-        assert "content_presentation" in result
-        assert "learner_participation" in result
-        assert "assessment" in result
-        assert "delivery_method" in result
-        assert "grouping_strategy" in result
         assert len(result["learner_participation"]["practice_activities"]) >= 3
 
+    def test_strategy_materials_fallback_returns_copy(self):
+        """교수전략/교수자료 폴백 결과 수정이 이후 호출에 영향을 주지 않는지 테스트"""
+        strategy = _fallback_develop_instructional_strategy({}, {}, "온라인", "2시간")
+        strategy["pre_instructional"]["motivation"] = "변경됨"
+        materials = _fallback_develop_instructional_materials({}, {}, "온라인", "2시간", "주제")
+        materials["slide_contents"][0]["title"] = "변경됨"
+        materials["expert_review"]["findings"].append("변경됨")
+
+        again = _fallback_develop_instructional_materials({}, {}, "온라인", "2시간", "주제")
+        assert _fallback_develop_instructional_strategy({}, {}, "온라인", "2시간")["pre_instructional"]["motivation"] != "변경됨"
+        assert again["slide_contents"][0]["title"] == "Slide 1"
+        assert "변경됨" not in again["expert_review"]["findings"]
+
     def test_develop_instructional_materials_fallback(self):
         """교수자료 개발 폴백 테스트"""
         result = _fallback_develop_instructional_materials(
@@ -185,10 +295,6 @@ class TestStrategyMaterialsTools:
             topic_title="테스트 주제",
         )
 
-        assert "instructor_guide" in result
-        assert "learner_materials" in result
-        assert "media_list" in result
-        assert "slide_contents" in result
         assert len(result["learner_materials"]) >= 3
         assert len(result["slide_contents"]) >= 10
 
@@ -205,25 +311,23 @@ class TestEvaluationTools:
             iteration=1,
         )
 
-        assert "quality_score" in result
-        assert "one_to_one_findings" in result
-        assert "small_group_findings" in result
-        assert "field_trial_findings" in result
-        assert "strengths" in result
-        assert "weaknesses" in result
-        assert "revision_recommendations" in result
         assert result["quality_score"] == 6.5  # 1차 기본 점수
 
-    def test_conduct_formative_evaluation_fallback_improvement(self):
+    def test_conduct_formative_evaluation_fallback_improvement(self, formative_results):
         """형성평가 폴백 테스트 (반복에 따른 점수 향상)"""
-        result_1 = _fallback_conduct_formative_evaluation({}, {}, {}, iteration=1)
-        result_2 = _fallback_conduct_formative_evaluation({}, {}, {}, iteration=2)
-        result_3 = _fallback_conduct_formative_evaluation({}, {}, {}, iteration=3)
+        result_1, result_2, result_3 = formative_results[1], formative_results[2], formative_results[3]
 
         # 반복에 따라 점수 향상
         assert result_2["quality_score"] > result_1["quality_score"]
         assert result_3["quality_score"] > result_2["quality_score"]
 
+    def test_conduct_formative_evaluation_fallback_returns_copy(self):
+        """형성평가 폴백 재사용 시 결과 독립성 테스트"""
+        first = _fallback_conduct_formative_evaluation({}, {}, {}, iteration=1)
+        first["quality_score"] = 0
+
+        assert _fallback_conduct_formative_evaluation({}, {}, {}, iteration=1)["quality_score"] == 6.5
+
     def test_revise_instruction_fallback(self):
         """교수프로그램 수정 폴백 테스트"""
         formative = {
@@ -240,9 +344,6 @@ class TestEvaluationTools:
             iteration=1,
         )
 
-        assert "iteration" in result
-        assert "revision_items" in result
-        assert "summary" in result
         assert result["iteration"] == 1
         assert len(result["revision_items"]) >= 3
 
@@ -254,26 +355,20 @@ class TestEvaluationTools:
             total_iterations=2,
         )
 
-        assert "effectiveness_score" in result
-        assert "efficiency_analysis" in result
-        assert "learner_satisfaction" in result
-        assert "goal_achievement" in result
-        assert "recommendations" in result
-        assert "decision" in result
         assert result["effectiveness_score"] >= 7.0  # 기준 충족
 
 
 class TestFeedbackLoop:
     """피드백 루프 관련 테스트"""
 
-    def test_quality_threshold_check(self):
+    def test_quality_threshold_check(self, formative_results):
         """품질 기준 체크 테스트"""
         # 낮은 점수 - 수정 필요
-        result_low = _fallback_conduct_formative_evaluation({}, {}, {}, iteration=1)
+        result_low = formative_results[1]
         assert result_low["quality_score"] < 7.0
 
         # 3차 반복 - 기준 근접 또는 충족
-        result_high = _fallback_conduct_formative_evaluation({}, {}, {}, iteration=3)
+        result_high = formative_results[3]
         assert result_high["quality_score"] >= 7.0 or result_high["quality_score"] > result_low["quality_score"]
 
     def test_revision_items_have_required_fields(self):
@@ -285,7 +380,965 @@ class TestFeedbackLoop:
         )
 
         for item in result["revision_items"]:
-            assert "issue" in item
-            assert "target_phase" in item
-            assert "action" in item
-            assert "status" in item
+            missing = REVISION_ITEM_KEYS - item.keys()
+            assert not missing, missing
+
+
+class TestLLMCache:
+    """LLM 응답 캐시 테스트"""
+
+    def test_repeated_prompt_served_from_cache(self, monkeypatch):
+        """동일 프롬프트 재호출 시 LLM 미호출, 제공자별 캐시 키 분리 테스트"""
+        import functools
+        from dick_carey_agent.tools import _llm_cache, goal_analysis
+
+        calls = []
+
+        class FakeChatOpenAI:
+            def __init__(self, **kwargs):
+                self.model = kwargs["model"]
+                self.temperature = kwargs["temperature"]
+
+            def invoke(self, messages):
+                calls.append((self.model, self.temperature))
+                return type("Response", (), {"content": '{"goal_statement": "캐시 목표"}'})()
+
+        monkeypatch.setenv("DICK_CAREY_LLM_CACHE", "1")
+        monkeypatch.setenv("MODEL_PROVIDER", "upstage")
+        monkeypatch.setenv("DICK_CAREY_MODEL", "solar-mini")
+        monkeypatch.setenv("MODEL_NAME", "other-model")
+        monkeypatch.setattr(goal_analysis, "ChatOpenAI", FakeChatOpenAI)
+        monkeypatch.setattr(goal_analysis, "_llm_openrouter", {})
+        monkeypatch.setattr(
+            goal_analysis, "_get_upstage_llm",
+            functools.lru_cache(maxsize=16)(goal_analysis._get_upstage_llm.__wrapped__),
+        )
+        monkeypatch.setattr(_llm_cache, "get_cache", lambda: cache)
+        cache = _llm_cache.MemoryCache()
+
+        first = goal_analysis._invoke_llm_json("set_instructional_goal", "system", "prompt")
+        first["goal_statement"] = "변경됨"
+        second = goal_analysis._invoke_llm_json("set_instructional_goal", "system", "prompt")
+
+        assert calls == [("solar-mini", 0.0)]
+        assert second["goal_statement"] == "캐시 목표"
+
+        monkeypatch.setenv("MODEL_PROVIDER", "openrouter")
+        goal_analysis._invoke_llm_json("set_instructional_goal", "system", "prompt")
+
+        assert calls == [("solar-mini", 0.0), ("other-model", 0.0)]
+
+    def test_objective_tool_served_from_cache(self, monkeypatch):
+        """수행목표 도구 동일 입력 재호출 시 LLM 미호출 테스트"""
+        from collections import OrderedDict
+        from dick_carey_agent.tools import _llm_cache, objective_assessment
+
+        calls = []
+
+        class FakeChatOpenAI:
+            def __init__(self, **kwargs):
+                self.temperature = kwargs["temperature"]
+
+            def invoke(self, prompt):
+                calls.append(self.temperature)
+                return type("Response", (), {"content": '{"terminal_objective": {}, "enabling_objectives": []}'})()
+
+        monkeypatch.setenv("DICK_CAREY_LLM_CACHE", "1")
+        monkeypatch.setattr(objective_assessment, "_provider", "upstage")
+        monkeypatch.setattr(objective_assessment, "ChatOpenAI", FakeChatOpenAI)
+        monkeypatch.setattr(objective_assessment, "_upstage_clients", {})
+        monkeypatch.setattr(objective_assessment, "_objectives_memo", OrderedDict())
+        monkeypatch.setattr(_llm_cache, "get_cache", lambda: cache)
+        cache = _llm_cache.MemoryCache()
+        args = {
+            "instructional_goal": "테스트 목표",
+            "sub_skills": [{"description": "하위 기능"}],
+            "target_audience": "신입사원",
+        }
+
+        first = objective_assessment.write_performance_objectives.invoke(args)
+        second = objective_assessment.write_performance_objectives.invoke(args)
+
+        assert calls == [0.0]
+        assert first == second
+
+    def test_strategy_tool_served_from_cache(self, monkeypatch):
+        """교수전략 도구 동일 입력 재호출 시 LLM 미호출 테스트"""
+        from dick_carey_agent.tools import _llm_cache, strategy_materials
+
+        calls = []
+
+        class FakeChatOpenAI:
+            def __init__(self, **kwargs):
+                self.temperature = kwargs["temperature"]
+
+            def invoke(self, prompt):
+                calls.append(self.temperature)
+                return type("Response", (), {"content": '{"delivery_method": "온라인"}'})()
+
+        monkeypatch.setenv("DICK_CAREY_LLM_CACHE", "1")
+        monkeypatch.setenv("MODEL_PROVIDER", "upstage")
+        monkeypatch.setattr("langchain_openai.ChatOpenAI", FakeChatOpenAI)
+        monkeypatch.setattr(strategy_materials, "_upstage_clients", {})
+        monkeypatch.setattr(_llm_cache, "get_cache", lambda: cache)
+        cache = _llm_cache.MemoryCache()
+        args = {
+            "performance_objectives": {"enabling_objectives": []},
+            "learner_analysis": {},
+            "learning_environment": "온라인",
+            "duration": "2시간",
+        }
+
+        first = strategy_materials.develop_instructional_strategy.invoke(args)
+        second = strategy_materials.develop_instructional_strategy.invoke(args)
+
+        assert calls == [0.0]
+        assert first == second == {"delivery_method": "온라인"}
+
+    def test_memory_cache_expires(self, monkeypatch):
+        """TTL 경과 항목 만료 테스트"""
+        from dick_carey_agent.tools import _llm_cache
+
+        now = [100.0]
+        monkeypatch.setattr(_llm_cache.time, "monotonic", lambda: now[0])
+        cache = _llm_cache.MemoryCache()
+        cache.set("key", "value", ttl=10)
+
+        assert cache.get("key") == "value"
+        now[0] = 111.0
+        assert cache.get("key") is None
+
+
+class TestPromptTemplates:
+    """프롬프트 템플릿 테스트"""
+
+    def test_dumps_cached_tracks_mutation(self):
+        """동일 리스트 객체 변경 시 직렬화 갱신 테스트"""
+        from dick_carey_agent.tools.goal_analysis import _dumps_cached
+
+        goals = ["목표 1"]
+        assert _dumps_cached(goals) == '["목표 1"]'
+        goals.append("목표 2")
+        assert _dumps_cached(goals) == '["목표 1","목표 2"]'
+
+    def test_dumps_cached_evicts_least_recently_used(self, monkeypatch):
+        """캐시 상한 초과 시 가장 오래 미사용 항목 제거 테스트"""
+        from collections import OrderedDict
+        from dick_carey_agent.tools import _json, goal_analysis
+
+        monkeypatch.setattr(_json, "_dumps_cache", OrderedDict())
+        monkeypatch.setattr(_json, "_DUMPS_CACHE_MAX_ENTRIES", 2)
+        first, second, third = ["a"], ["b"], ["c"]
+
+        goal_analysis._dumps_cached(first)
+        goal_analysis._dumps_cached(second)
+        goal_analysis._dumps_cached(first)
+        goal_analysis._dumps_cached(third)
+
+        assert list(_json._dumps_cache) == [id(first), id(third)]
+
+    def test_dumps_cached_tracks_nested_mutation(self, monkeypatch):
+        """중첩 값 변경 시 이전 직렬화 결과를 재사용하지 않는지 테스트"""
+        from collections import OrderedDict
+        from dick_carey_agent.tools import _json
+
+        monkeypatch.setattr(_json, "_dumps_cache", OrderedDict())
+        objectives = {"enabling_objectives": [{"behavior": "개념 설명"}]}
+        skills = [{"s": 1}]
+
+        assert _json._dumps_cached(objectives) == '{"enabling_objectives":[{"behavior":"개념 설명"}]}'
+        objectives["enabling_objectives"][0]["behavior"] = "사례 분석"
+        skills[0]["s"] = 2
+
+        assert _json._dumps_cached(objectives) == '{"enabling_objectives":[{"behavior":"사례 분석"}]}'
+        assert _json._dumps_cached(skills) == '[{"s":2}]'
+        assert not _json._dumps_cache
+
+    def test_dumps_cached_reuses_flat_dict(self, monkeypatch):
+        """평탄한 딕셔너리 재사용 및 변경 감지 테스트"""
+        from collections import OrderedDict
+        from dick_carey_agent.tools import _json
+
+        monkeypatch.setattr(_json, "_dumps_cache", OrderedDict())
+        context = {"environment": "온라인"}
+
+        first = _json._dumps_cached(context)
+        assert _json._dumps_cached(context) is first
+        context["duration"] = "2시간"
+        assert _json._dumps_cached(context).endswith('"duration":"2시간"}')
+
+    def test_strategy_system_prompt_is_static(self):
+        """교수전략 시스템 메시지가 입력과 무관하게 동일한지 테스트"""
+        from dick_carey_agent.tools.strategy_materials import _instructional_strategy_messages
+
+        online = _instructional_strategy_messages({}, {}, "온라인", "2시간")
+        offline = _instructional_strategy_messages({"a": 1}, {}, "오프라인", "4시간")
+
+        assert online[0].content == offline[0].content
+        assert "Learning Environment: 오프라인" in offline[1].content
+
+
+class TestInputBounds:
+    """프롬프트 입력 크기 제한 테스트"""
+
+    def test_large_learner_analysis_truncated(self):
+        """상한 초과 입력의 문자열 값 절단 테스트"""
+        from dick_carey_agent.tools import strategy_materials
+
+        small = {"characteristics": ["신입사원"]}
+        large = {"transcript": "가" * 10000, "level": "초급"}
+
+        assert strategy_materials._dumps_bounded(small) == '{"characteristics":["신입사원"]}'
+        bounded = strategy_materials._dumps_bounded(large, max_chars=1000)
+        assert len(bounded) < 1100
+        assert strategy_materials.parse_json_response(bounded)["level"] == "초급"
+
+
+class TestDiskCache:
+    """디스크 결과 캐시 테스트"""
+
+    def test_strategy_result_reused_from_disk(self, monkeypatch, tmp_path):
+        """동일 입력 재실행 시 디스크 캐시 사용 테스트"""
+        from dick_carey_agent.tools import strategy_materials
+
+        calls = []
+
+        class FakeLLM:
+            def invoke(self, prompt):
+                calls.append(prompt)
+                return type("Response", (), {"content": '{"delivery_method": "온라인"}'})()
+
+        monkeypatch.setenv("DICK_CAREY_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(strategy_materials, "get_llm", lambda api_key=None, model=None: FakeLLM())
+        args = {
+            "performance_objectives": {},
+            "learner_analysis": {},
+            "learning_environment": "온라인",
+            "duration": "2시간",
+        }
+
+        first = strategy_materials.develop_instructional_strategy.invoke(args)
+        second = strategy_materials.develop_instructional_strategy.invoke(args)
+
+        assert len(calls) == 1
+        assert first == second == {"delivery_method": "온라인"}
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_disk_cache_key_tracks_routed_models(self, monkeypatch, tmp_path):
+        """라우팅 모델 변경 시 캐시 키 분리 및 직렬화 불가 입력 처리 테스트"""
+        from dick_carey_agent.tools import strategy_materials
+
+        monkeypatch.setenv("DICK_CAREY_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("MODEL_PROVIDER", "upstage")
+        monkeypatch.delenv("DICK_CAREY_MODEL_STRONG", raising=False)
+        monkeypatch.setenv("DICK_CAREY_MODEL_FAST", "solar-mini")
+        fast = strategy_materials._disk_cache_key("tool", {"a": 1})
+        monkeypatch.setenv("DICK_CAREY_MODEL_FAST", "solar-pro")
+        strong = strategy_materials._disk_cache_key("tool", {"a": 1})
+
+        assert fast != strong
+        assert strategy_materials._disk_cache_key("tool", {"a": {1: "x"}}) is None
+
+
+class TestKeyPool:
+    """API 키 풀 테스트"""
+
+    def test_rate_limited_key_skipped(self):
+        """쿨다운 중인 키 건너뛰기 테스트"""
+        from dick_carey_agent.tools._keypool import KeyPool
+
+        pool = KeyPool(["key1", "key2", "key3"])
+        pool.mark_rate_limited("key2", 60)
+
+        assert [pool.acquire() for _ in range(4)] == ["key1", "key3", "key1", "key3"]
+
+    def test_cooldown_shared_across_steps(self, monkeypatch):
+        """1-3단계에서 429를 받은 키가 4-5단계에서도 제외되는지 테스트"""
+        import httpx
+        import openai
+        from dick_carey_agent.tools import _keypool, goal_analysis, objective_assessment
+
+        class FakeLLM:
+            def __init__(self, api_key):
+                self.api_key = api_key
+
+            def invoke(self, messages):
+                if self.api_key == "k1":
+                    response = httpx.Response(429, request=httpx.Request("POST", "https://example.com"))
+                    raise openai.RateLimitError("rate limited", response=response, body=None)
+                return type("Response", (), {"content": "{}"})()
+
+        class FakeChatOpenAI:
+            def __init__(self, **kwargs):
+                self.api_key = kwargs["api_key"]
+
+        monkeypatch.delenv("DICK_CAREY_LLM_CACHE", raising=False)
+        monkeypatch.setenv("MODEL_PROVIDER", "upstage")
+        monkeypatch.setattr(_keypool, "_upstage_pool", _keypool.KeyPool(["k1", "k2"]))
+        monkeypatch.setattr(goal_analysis, "get_llm", lambda api_key=None, json_mode=False: FakeLLM(api_key))
+        monkeypatch.setattr(objective_assessment, "_provider", "upstage")
+        monkeypatch.setattr(objective_assessment, "ChatOpenAI", FakeChatOpenAI)
+        monkeypatch.setattr(objective_assessment, "_upstage_clients", {})
+
+        assert goal_analysis._invoke_with_key_rotation([], json_mode=False) == "{}"
+        assert [objective_assessment.get_llm().api_key for _ in range(3)] == ["k2", "k2", "k2"]
+
+    def test_objective_upstage_client_reused_per_key(self, monkeypatch):
+        """4-5단계 Upstage 클라이언트 키별 재사용 테스트"""
+        from dick_carey_agent.tools import _keypool, objective_assessment
+
+        class FakeChatOpenAI:
+            def __init__(self, **kwargs):
+                self.api_key = kwargs["api_key"]
+
+        monkeypatch.delenv("DICK_CAREY_LLM_CACHE", raising=False)
+        monkeypatch.setattr(objective_assessment, "_provider", "upstage")
+        monkeypatch.setattr(objective_assessment, "ChatOpenAI", FakeChatOpenAI)
+        monkeypatch.setattr(objective_assessment, "_upstage_clients", {})
+        monkeypatch.setattr(_keypool, "_upstage_pool", _keypool.KeyPool(["k1", "k2"]))
+
+        clients = [objective_assessment.get_llm() for _ in range(4)]
+
+        assert [c.api_key for c in clients] == ["k1", "k2", "k1", "k2"]
+        assert clients[0] is clients[2]
+        assert clients[1] is clients[3]
+
+    def test_strategy_clients_share_http_pool(self, monkeypatch):
+        """6-7단계 키별 클라이언트 재사용 및 HTTP 연결 풀 공유 테스트"""
+        from dick_carey_agent.tools import _keypool, strategy_materials
+
+        class FakeChatOpenAI:
+            def __init__(self, **kwargs):
+                self.api_key = kwargs["api_key"]
+                self.http_client = kwargs["http_client"]
+                self.http_async_client = kwargs.get("http_async_client")
+
+        monkeypatch.delenv("DICK_CAREY_LLM_CACHE", raising=False)
+        monkeypatch.setenv("MODEL_PROVIDER", "upstage")
+        monkeypatch.setattr("langchain_openai.ChatOpenAI", FakeChatOpenAI)
+        monkeypatch.setattr(strategy_materials, "_upstage_clients", {})
+        monkeypatch.setattr(_keypool, "_upstage_pool", _keypool.KeyPool(["k1", "k2"]))
+
+        clients = [strategy_materials.get_llm() for _ in range(4)]
+
+        assert clients[0] is clients[2]
+        assert clients[0] is not clients[1]
+        assert clients[0].http_client is clients[1].http_client
+        assert clients[0].http_async_client is None
+
+    def test_lease_prefers_least_loaded_key(self):
+        """진행 중 요청이 적은 키 우선 및 429 키 제외 테스트"""
+        import httpx
+        import openai
+        from dick_carey_agent.tools._keypool import KeyPool
+
+        pool = KeyPool(["k1", "k2", "k3"])
+
+        with pool.lease() as first, pool.lease() as second:
+            with pool.lease() as third:
+                assert {first, second, third} == {"k1", "k2", "k3"}
+            with pool.lease() as fourth:
+                assert fourth == third
+
+        with pytest.raises(openai.RateLimitError):
+            with pool.lease() as limited:
+                response = httpx.Response(429, request=httpx.Request("POST", "https://example.com"))
+                raise openai.RateLimitError("rate limited", response=response, body=None)
+        assert limited not in {pool.acquire() for _ in range(4)}
+
+
+class TestRateLimit:
+    """토큰 버킷 속도 제한 테스트"""
+
+    def test_bucket_waits_after_burst(self, monkeypatch):
+        """버스트 소진 후 대기 시간 계산 테스트"""
+        from dick_carey_agent.tools import _ratelimit
+
+        now = [0.0]
+        monkeypatch.setattr(_ratelimit.time, "monotonic", lambda: now[0])
+        bucket = _ratelimit.TokenBucket(rate=2.0, burst=2.0)
+
+        assert bucket._reserve(1) == 0.0
+        assert bucket._reserve(1) == 0.0
+        assert bucket._reserve(1) == 0.5
+        now[0] = 1.5
+        assert bucket._reserve(1) == 0.0
+
+    def test_limiter_disabled_without_env(self, monkeypatch):
+        """환경 변수 미설정 시 제한 없음 테스트"""
+        from dick_carey_agent.tools._ratelimit import RateLimiter
+
+        assert not RateLimiter().enabled
+        assert RateLimiter(rpm=60).enabled
+
+
+class TestGoalContextBundle:
+    """1·3단계 통합 도구 테스트"""
+
+    def test_incomplete_bundle_omits_missing_parts(self, monkeypatch):
+        """통합 응답 누락 항목 제외 테스트"""
+        from dick_carey_agent.tools import goal_analysis
+
+        monkeypatch.setattr(
+            goal_analysis, "_invoke_llm_json",
+            lambda tool_name, system_prompt, prompt: {"goal": {"goal_statement": "목표"}, "context": {}},
+        )
+
+        result = goal_analysis.analyze_goal_and_context_bundle.invoke({
+            "learning_goals": ["목표 1"],
+            "target_audience": "신입사원",
+            "learning_environment": "온라인",
+            "duration": "2시간",
+        })
+
+        assert result == {"goal": {"goal_statement": "목표"}}
+
+
+class TestParseJsonResponse:
+    """LLM 응답 JSON 파싱 테스트"""
+
+    @pytest.mark.parametrize("module_name", ["goal_analysis", "objective_assessment", "strategy_materials"])
+    def test_fenced_and_bare_json(self, module_name):
+        """코드 펜스/본문 JSON 파싱 테스트"""
+        import importlib
+
+        parse_json_response = importlib.import_module(f"dick_carey_agent.tools.{module_name}").parse_json_response
+
+        assert parse_json_response('설명\n```json\n{"a": [1]}\n```\n끝') == {"a": [1]}
+        assert parse_json_response('```\n{"b": 2}\n```') == {"b": 2}
+        assert parse_json_response('결과: {"c": "값"} 이상입니다') == {"c": "값"}
+        assert parse_json_response('{"d": "```코드```"}') == {"d": "```코드```"}
+
+
+class TestLLMRetry:
+    """LLM 호출 재시도 테스트"""
+
+    def test_transient_timeout_retried(self, monkeypatch):
+        """일시적 타임아웃 재시도 후 성공 테스트"""
+        import httpx
+        import openai
+        from tenacity import wait_none
+        from dick_carey_agent.tools import goal_analysis
+
+        calls = []
+
+        class FlakyLLM:
+            def invoke(self, messages):
+                calls.append(messages)
+                if len(calls) < 3:
+                    raise openai.APITimeoutError(request=httpx.Request("POST", "https://example.com"))
+                return type("Response", (), {"content": '{"task_type": "combination"}'})()
+
+        monkeypatch.setenv("MODEL_PROVIDER", "openrouter")
+        monkeypatch.setattr(goal_analysis, "get_llm", lambda **kwargs: FlakyLLM())
+        monkeypatch.setattr(goal_analysis._call_llm.retry, "wait", wait_none())
+
+        result = goal_analysis._invoke_llm_json("analyze_instruction", "system", "prompt")
+
+        assert len(calls) == 3
+        assert result == {"task_type": "combination"}
+
+
+class TestStreaming:
+    """스트리밍 응답 테스트"""
+
+    def test_stream_stops_at_end_of_object(self, monkeypatch):
+        """최상위 JSON 객체 종료 시 수신 중단 테스트"""
+        from dick_carey_agent.tools import _completion, _json
+
+        chunks = ['```json\n{"a": "}{\\"', '", "b": {"c": 1}', "}\n```", "이후 설명", "사용되지 않음"]
+        consumed = []
+
+        class StreamingLLM:
+            def stream(self, messages):
+                for chunk in chunks:
+                    consumed.append(chunk)
+                    yield type("Chunk", (), {"content": chunk})()
+
+        monkeypatch.setenv("DICK_CAREY_STREAM", "1")
+
+        text = _completion._complete(StreamingLLM(), [])
+
+        assert consumed == chunks[:3]
+        assert _json.parse_json_response(text) == {"a": '}{"', "b": {"c": 1}}
+
+
+    async def test_strategy_astream_stops_at_end_of_object(self, monkeypatch):
+        """6단계 비동기 스트리밍 조기 종료 및 파싱 테스트"""
+        from dick_carey_agent.tools import strategy_materials
+
+        chunks = ['{"delivery_method": ', '"온라인"}', "\n이후 설명", "사용되지 않음"]
+        consumed = []
+
+        class StreamingLLM:
+            async def astream(self, prompt):
+                for chunk in chunks:
+                    consumed.append(chunk)
+                    yield type("Chunk", (), {"content": chunk})()
+
+        monkeypatch.setenv("DICK_CAREY_STREAM", "1")
+        monkeypatch.setattr(strategy_materials, "get_llm", lambda api_key=None, model=None: StreamingLLM())
+
+        result = await strategy_materials.develop_instructional_strategy.ainvoke({
+            "performance_objectives": {},
+            "learner_analysis": {},
+            "learning_environment": "온라인",
+            "duration": "2시간",
+        })
+
+        assert consumed == chunks[:2]
+        assert result == {"delivery_method": "온라인"}
+
+    async def test_objective_astream_cached_after_early_stop(self, monkeypatch):
+        """4-5단계 비동기 스트리밍이 JSON 객체 끝에서 멈춘 뒤 완결된 응답만 캐시되는지 테스트"""
+        from dick_carey_agent.tools import _completion, _llm_cache
+
+        consumed = []
+
+        class StreamingLLM:
+            async def astream(self, prompt):
+                for chunk in ['{"post_test": ', "[1]}", "이후 설명"]:
+                    consumed.append(chunk)
+                    yield type("Chunk", (), {"content": chunk})()
+
+        cache = _llm_cache.MemoryCache()
+        monkeypatch.setenv("DICK_CAREY_STREAM", "1")
+        monkeypatch.setattr(_llm_cache, "get_cache", lambda: cache)
+        llm = _llm_cache.CachedLLM(StreamingLLM(), "test-model")
+
+        first = await _completion._acomplete(llm, "prompt")
+        second = await _completion._acomplete(llm, "prompt")
+
+        assert consumed == ['{"post_test": ', "[1]}"]
+        assert first == second == '{"post_test": [1]}'
+
+    async def test_astream_not_cached_when_consumer_stops_early(self, monkeypatch):
+        """완결되지 않은 응답에서 스트림을 중단하면 캐시하지 않는지 테스트"""
+        from dick_carey_agent.tools import _llm_cache
+
+        class StreamingLLM:
+            async def astream(self, prompt):
+                for chunk in ['{"post_test": ', "[1]}"]:
+                    yield type("Chunk", (), {"content": chunk})()
+
+        cache = _llm_cache.MemoryCache()
+        monkeypatch.setattr(_llm_cache, "get_cache", lambda: cache)
+        llm = _llm_cache.CachedLLM(StreamingLLM(), "test-model")
+
+        stream = llm.astream("prompt")
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        assert cache.get(_llm_cache.make_key("llm", "test-model", "prompt")) is None
+
+
+class TestBatchHelpers:
+    """배치 실행 헬퍼 테스트"""
+
+    async def test_context_batch_keeps_order(self, monkeypatch):
+        """배치 결과 입력 순서 유지 테스트"""
+        from dick_carey_agent.tools import goal_analysis
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("offline")
+
+        monkeypatch.setattr(goal_analysis, "_invoke_llm_json", fail)
+
+        results = await goal_analysis.analyze_context_batch([
+            {"learning_environment": "online", "duration": "1주"},
+            {"learning_environment": "in-person", "duration": "2주"},
+        ])
+
+        assert [r["learning_context"] for r in results] == [
+            "Learning will be conducted in online environment for 1주",
+            "Learning will be conducted in in-person environment for 2주",
+        ]
+
+
+class TestJsonRepair:
+    """잘못된 JSON 응답 복구 테스트"""
+
+    def test_malformed_reply_repaired_once(self, monkeypatch):
+        """JSON 파싱 실패 시 복구 요청 1회 테스트"""
+        from dick_carey_agent.tools import goal_analysis
+
+        replies = iter(['{"task_type": "combination",}', '{"task_type": "combination"}'])
+        prompts = []
+
+        def fake_invoke_llm(system_prompt, prompt):
+            prompts.append(system_prompt)
+            return next(replies)
+
+        monkeypatch.setattr(goal_analysis, "_invoke_llm", fake_invoke_llm)
+
+        result = goal_analysis._complete_json("system", "prompt")
+
+        assert result == {"task_type": "combination"}
+        assert prompts == ["system", goal_analysis._REPAIR_SYSTEM_PROMPT]
+
+
+class TestRequestCoalescing:
+    """동시 중복 요청 병합 테스트"""
+
+    def test_concurrent_duplicates_share_one_call(self, monkeypatch):
+        """동일 요청 동시 실행 시 LLM 1회 호출 테스트"""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from dick_carey_agent.tools import goal_analysis
+
+        calls = []
+        release = threading.Event()
+
+        def slow_complete_json(system_prompt, prompt):
+            calls.append(prompt)
+            release.wait(timeout=5)
+            return {"task_type": "combination"}
+
+        monkeypatch.setattr(goal_analysis, "_complete_json", slow_complete_json)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(goal_analysis._invoke_llm_json, "analyze_instruction", "system", "prompt")
+                for _ in range(3)
+            ]
+            # 후속 요청 2건이 선행 요청을 기다릴 때까지 대기
+            while sum(entry[1] for entry in list(goal_analysis._inflight.values())) < 2:
+                release.wait(0.01)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert results == [{"task_type": "combination"}] * 3
+        assert not goal_analysis._inflight
+
+    async def test_async_strategy_duplicates_share_one_call(self, monkeypatch):
+        """6단계 동일 요청 비동기 동시 실행 시 LLM 1회 호출 테스트"""
+        import asyncio
+        from dick_carey_agent.tools import strategy_materials
+
+        calls = []
+
+        class FakeLLM:
+            async def ainvoke(self, prompt):
+                calls.append(prompt)
+                await asyncio.sleep(0.01)
+                return type("Response", (), {"content": '{"delivery_method": "온라인"}'})()
+
+        monkeypatch.setattr(strategy_materials, "get_llm", lambda api_key=None, model=None: FakeLLM())
+        args = {
+            "performance_objectives": {},
+            "learner_analysis": {},
+            "learning_environment": "온라인",
+            "duration": "2시간",
+        }
+
+        results = await asyncio.gather(
+            *(strategy_materials.develop_instructional_strategy.ainvoke(args) for _ in range(3))
+        )
+
+        assert len(calls) == 1
+        assert results == [{"delivery_method": "온라인"}] * 3
+        assert not strategy_materials._ainflight
+
+    async def test_follower_takes_over_when_leader_cancelled(self, monkeypatch):
+        """선행 요청 취소 시 대기 중인 동일 요청이 직접 호출하는지 테스트"""
+        import asyncio
+        from langchain_core.messages import HumanMessage
+        from dick_carey_agent.tools import strategy_materials
+
+        calls = []
+
+        class FakeLLM:
+            async def ainvoke(self, prompt):
+                calls.append(prompt)
+                await asyncio.sleep(0.01)
+                return type("Response", (), {"content": "응답"})()
+
+        monkeypatch.setattr(strategy_materials, "get_llm", lambda api_key=None, model=None: FakeLLM())
+        prompt = [HumanMessage(content="같은 요청")]
+
+        leader = asyncio.create_task(strategy_materials._ainvoke(prompt))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(strategy_materials._ainvoke(prompt))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "응답"
+        assert leader.cancelled()
+        assert len(calls) == 2
+        assert not strategy_materials._ainflight
+
+
+class TestAsyncObjectiveAssessment:
+    """4-5단계 도구 비동기 호출 테스트"""
+
+    async def test_write_performance_objectives_ainvoke(self, monkeypatch):
+        """수행목표 진술 ainvoke 테스트"""
+        from dick_carey_agent.tools import objective_assessment
+
+        class FakeLLM:
+            async def ainvoke(self, prompt):
+                return type("Response", (), {"content": '{"terminal_objective": {}, "enabling_objectives": []}'})()
+
+        monkeypatch.setattr(objective_assessment, "get_llm", lambda: FakeLLM())
+
+        result = await objective_assessment.write_performance_objectives.ainvoke({
+            "instructional_goal": "테스트 목표",
+            "sub_skills": [{"description": "하위 기능"}],
+            "target_audience": "신입사원",
+        })
+
+        assert result == {"terminal_objective": {}, "enabling_objectives": []}
+
+    async def test_split_assessment_sections(self, monkeypatch):
+        """평가도구 3분할 동시 생성 및 실패 구역 폴백 테스트"""
+        from dick_carey_agent.tools import _json, objective_assessment
+
+        class FakeLLM:
+            async def ainvoke(self, messages):
+                system = messages[0].content
+                if "practice_tests:" in system:
+                    raise RuntimeError("offline")
+                section = "entry_test" if "entry_test:" in system else "post_test"
+                item = {"assessment_name": f"{section} 문항", "objective_id": "개념 설명"}
+                return type("Response", (), {"content": f'{{"{section}": [{_json._dumps(item)}]}}'})()
+
+        monkeypatch.setenv("DICK_CAREY_SPLIT_ASSESSMENT", "1")
+        monkeypatch.setattr(objective_assessment, "get_llm", lambda: FakeLLM())
+
+        result = await objective_assessment.develop_assessment_instruments.ainvoke({
+            "performance_objectives": {"enabling_objectives": [{"behavior": "개념 설명"}]},
+            "learning_environment": "온라인",
+            "duration": "2시간",
+        })
+
+        assert result["entry_test"][0]["assessment_name"] == "entry_test 문항"
+        assert result["practice_tests"][0]["assessment_name"] == "개념 설명 essay practice"
+        assert result["alignment_matrix"]["개념 설명"] == [
+            "entry_test 문항",
+            "개념 설명 essay practice",
+            "post_test 문항",
+        ]
+
+
+    async def test_repeated_objectives_memoized(self, monkeypatch):
+        """수행목표 동일 입력 재호출 시 파싱 결과 재사용 테스트"""
+        from collections import OrderedDict
+        from dick_carey_agent.tools import objective_assessment
+
+        calls = []
+
+        class FakeLLM:
+            async def ainvoke(self, prompt):
+                calls.append(prompt)
+                return type("Response", (), {"content": '{"terminal_objective": {"behavior": "수행"}}'})()
+
+        monkeypatch.setenv("DICK_CAREY_LLM_CACHE", "1")
+        monkeypatch.setattr(objective_assessment, "get_llm", lambda: FakeLLM())
+        monkeypatch.setattr(objective_assessment, "_objectives_memo", OrderedDict())
+        args = {"instructional_goal": "목표", "sub_skills": [{"b": 2, "a": 1}], "target_audience": "신입사원"}
+
+        first = await objective_assessment.write_performance_objectives.ainvoke(args)
+        first["terminal_objective"]["behavior"] = "변경됨"
+        second = await objective_assessment.write_performance_objectives.ainvoke(
+            dict(args, sub_skills=[{"a": 1, "b": 2}])
+        )
+
+        assert len(calls) == 1
+        assert second == {"terminal_objective": {"behavior": "수행"}}
+
+    async def test_objectives_memo_separates_models(self, monkeypatch):
+        """모델이 바뀌면 수행목표 메모를 재사용하지 않는지 테스트"""
+        from collections import OrderedDict
+        from dick_carey_agent.tools import objective_assessment
+
+        calls = []
+
+        class FakeLLM:
+            async def ainvoke(self, prompt):
+                calls.append(prompt)
+                return type("Response", (), {"content": '{"terminal_objective": {"behavior": "수행"}}'})()
+
+        monkeypatch.setenv("DICK_CAREY_LLM_CACHE", "1")
+        monkeypatch.setattr(objective_assessment, "get_llm", lambda: FakeLLM())
+        monkeypatch.setattr(objective_assessment, "_objectives_memo", OrderedDict())
+        monkeypatch.setattr(objective_assessment, "_provider", "upstage")
+        args = {"instructional_goal": "목표", "sub_skills": [], "target_audience": "신입사원"}
+
+        monkeypatch.setattr(objective_assessment, "_upstage_model", "solar-mini")
+        await objective_assessment.write_performance_objectives.ainvoke(args)
+        monkeypatch.setattr(objective_assessment, "_upstage_model", "solar-pro")
+        await objective_assessment.write_performance_objectives.ainvoke(args)
+
+        assert len(calls) == 2
+
+
+class TestAsyncStrategyMaterials:
+    """교수전략/교수자료 비동기 도구 테스트"""
+
+    async def test_develop_instructional_strategy_ainvoke(self, monkeypatch):
+        """ainvoke가 비동기 LLM 호출을 사용하는지 테스트"""
+        from dick_carey_agent.tools import strategy_materials
+
+        class FakeLLM:
+            def invoke(self, prompt):
+                raise AssertionError("sync invoke called")
+
+            async def ainvoke(self, prompt):
+                return type("Response", (), {"content": '{"delivery_method": "온라인"}'})()
+
+        monkeypatch.setattr(strategy_materials, "get_llm", lambda api_key=None, model=None: FakeLLM())
+
+        result = await strategy_materials.develop_instructional_strategy.ainvoke({
+            "performance_objectives": {},
+            "learner_analysis": {},
+            "learning_environment": "온라인",
+            "duration": "2시간",
+        })
+
+        assert result == {"delivery_method": "온라인"}
+
+    async def test_fused_strategy_and_materials_omits_missing_part(self, monkeypatch):
+        """6·7단계 통합 응답에서 누락된 교수자료 제외 테스트"""
+        from dick_carey_agent.tools import strategy_materials
+
+        class FakeLLM:
+            async def ainvoke(self, prompt):
+                assert "The instructional strategy you write in Part 1" in prompt[1].content
+                content = '{"instructional_strategy": {"delivery_method": "온라인"}, "instructional_materials": {}}'
+                return type("Response", (), {"content": content})()
+
+        monkeypatch.setattr(strategy_materials, "get_llm", lambda api_key=None, model=None: FakeLLM())
+
+        result = await strategy_materials.develop_strategy_and_materials.ainvoke({
+            "performance_objectives": {},
+            "learner_analysis": {},
+            "learning_environment": "온라인",
+            "duration": "2시간",
+            "topic_title": "테스트",
+        })
+
+        assert result == {"instructional_strategy": {"delivery_method": "온라인"}}
+
+    async def test_unparseable_fast_reply_escalates_to_strong_model(self, monkeypatch):
+        """소형 모델 응답 파싱 실패 시 대형 모델 재시도 테스트"""
+        from dick_carey_agent.tools import strategy_materials
+
+        models = []
+
+        class FakeLLM:
+            def __init__(self, model):
+                self.model = model
+
+            async def ainvoke(self, prompt):
+                models.append(self.model)
+                content = "JSON이 아닌 응답" if self.model == "solar-mini" else '{"delivery_method": "온라인"}'
+                return type("Response", (), {"content": content})()
+
+        monkeypatch.setenv("DICK_CAREY_MODEL_FAST", "solar-mini")
+        monkeypatch.setenv("DICK_CAREY_MODEL_STRONG", "solar-pro")
+        monkeypatch.setattr(strategy_materials, "get_llm", lambda api_key=None, model=None: FakeLLM(model))
+
+        result = await strategy_materials.develop_instructional_strategy.ainvoke({
+            "performance_objectives": {},
+            "learner_analysis": {},
+            "learning_environment": "온라인",
+            "duration": "2시간",
+        })
+
+        assert models == ["solar-mini", "solar-pro"]
+        assert result == {"delivery_method": "온라인"}
+
+    async def test_json_mode_falls_back_when_unsupported(self, monkeypatch):
+        """JSON 모드 미지원 모델의 기존 방식 자동 전환 테스트"""
+        import httpx
+        import openai
+        from dick_carey_agent.tools import strategy_materials
+
+        modes = []
+
+        class FakeLLM:
+            def __init__(self, json_mode):
+                self.json_mode = json_mode
+
+            async def ainvoke(self, prompt):
+                modes.append(self.json_mode)
+                if self.json_mode:
+                    request = httpx.Request("POST", "https://example.com")
+                    raise openai.BadRequestError("unsupported", response=httpx.Response(400, request=request), body=None)
+                return type("Response", (), {"content": '```json\n{"delivery_method": "온라인"}\n```'})()
+
+        monkeypatch.setenv("DICK_CAREY_JSON_MODE", "1")
+        monkeypatch.setattr(
+            strategy_materials, "get_llm",
+            lambda api_key=None, model=None, json_mode=False: FakeLLM(json_mode),
+        )
+
+        result = await strategy_materials.develop_instructional_strategy.ainvoke({
+            "performance_objectives": {},
+            "learner_analysis": {},
+            "learning_environment": "온라인",
+            "duration": "2시간",
+        })
+
+        assert modes == [True, False]
+        assert result == {"delivery_method": "온라인"}
+
+    async def test_provider_concurrency_cap(self, monkeypatch):
+        """제공자별 동시 요청 상한 테스트"""
+        import asyncio
+        from dick_carey_agent.tools import strategy_materials
+
+        active = []
+        peak = []
+
+        class FakeLLM:
+            async def ainvoke(self, prompt):
+                active.append(prompt)
+                peak.append(len(active))
+                await asyncio.sleep(0.01)
+                active.remove(prompt)
+                return type("Response", (), {"content": '{"delivery_method": "온라인"}'})()
+
+        monkeypatch.setenv("UPSTAGE_MAX_CONCURRENCY", "2")
+        monkeypatch.setattr(strategy_materials, "get_llm", lambda api_key=None, model=None: FakeLLM())
+
+        await asyncio.gather(*(
+            strategy_materials.develop_instructional_strategy.ainvoke({
+                "performance_objectives": {"id": i},
+                "learner_analysis": {},
+                "learning_environment": "온라인",
+                "duration": "2시간",
+            })
+            for i in range(5)
+        ))
+
+        assert max(peak) == 2
+
+
+class TestAssessmentAlignment:
+    """평가도구 정렬 매트릭스 테스트"""
+
+    def test_alignment_matrix_built_from_items(self, monkeypatch):
+        """LLM 응답 문항으로 정렬 매트릭스 계산 테스트"""
+        from dick_carey_agent.tools import objective_assessment
+
+        class FakeLLM:
+            def invoke(self, messages):
+                assert "alignment_matrix" not in "".join(m.content for m in messages)
+                return type("Response", (), {"content": (
+                    '{"entry_test": [{"assessment_name": "사전 문항", "objective_id": "기초"}],'
+                    ' "post_test": [{"assessment_name": "사후 문항", "objective_id": "기초"}]}'
+                )})()
+
+        monkeypatch.delenv("DICK_CAREY_SPLIT_ASSESSMENT", raising=False)
+        monkeypatch.setattr(objective_assessment, "get_llm", lambda: FakeLLM())
+
+        result = objective_assessment.develop_assessment_instruments.invoke({
+            "performance_objectives": {},
+            "learning_environment": "온라인",
+            "duration": "2시간",
+        })
+
+        assert result["alignment_matrix"] == {"기초": ["사전 문항", "사후 문항"]}
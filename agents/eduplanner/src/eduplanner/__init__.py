@@ -9,15 +9,37 @@ References:
       Intelligent Instructional Design (Zhang et al., 2025)
 """
 
-# Python 3.14 + LangChain Pydantic V1 호환성 경고 필터링
-# LangChain Core가 내부적으로 pydantic.v1을 사용하여 Python 3.14에서 경고 발생
+import importlib
 import warnings
-warnings.filterwarnings("ignore", message=".*Pydantic V1.*")
+from typing import TYPE_CHECKING
 
 __version__ = "0.1.0"
 
-from eduplanner.agents.main import EduPlannerAgent
-from eduplanner.models.schemas import ScenarioInput, ADDIEOutput, AgentResult
+if TYPE_CHECKING:
+    from eduplanner.agents.main import EduPlannerAgent
+    from eduplanner.models.schemas import ScenarioInput, ADDIEOutput, AgentResult
+
+# 공개 이름 → 정의 모듈 (PEP 562: 처음 참조할 때 import하여 패키지 import 비용 절감)
+_LAZY_IMPORTS = {
+    "EduPlannerAgent": "eduplanner.agents.main",
+    "ScenarioInput": "eduplanner.models.schemas",
+    "ADDIEOutput": "eduplanner.models.schemas",
+    "AgentResult": "eduplanner.models.schemas",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Python 3.14 + LangChain Pydantic V1 호환성 경고 필터링
+    # LangChain Core가 내부적으로 pydantic.v1을 사용하여 Python 3.14에서 import 시 경고 발생
+    # 필터는 import 구간에만 적용하여 이후 경고마다 정규식 비교가 일어나지 않도록 함
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message=".*Pydantic V1.*")
+        value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "EduPlannerAgent",
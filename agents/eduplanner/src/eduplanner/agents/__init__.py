@@ -1,9 +1,35 @@
 """EduPlanner 에이전트 모듈"""
 
-from eduplanner.agents.evaluator import EvaluatorAgent
-from eduplanner.agents.optimizer import OptimizerAgent
-from eduplanner.agents.analyst import AnalystAgent, AnalysisResult
-from eduplanner.agents.main import EduPlannerAgent
+import importlib
+import warnings
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from eduplanner.agents.evaluator import EvaluatorAgent
+    from eduplanner.agents.optimizer import OptimizerAgent
+    from eduplanner.agents.analyst import AnalystAgent, AnalysisResult
+    from eduplanner.agents.main import EduPlannerAgent
+
+# 공개 이름 → 정의 모듈 (PEP 562: 처음 참조할 때 import)
+_LAZY_IMPORTS = {
+    "EvaluatorAgent": "eduplanner.agents.evaluator",
+    "OptimizerAgent": "eduplanner.agents.optimizer",
+    "AnalystAgent": "eduplanner.agents.analyst",
+    "AnalysisResult": "eduplanner.agents.analyst",
+    "EduPlannerAgent": "eduplanner.agents.main",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # LangChain Core import 시 발생하는 Pydantic V1 호환성 경고를 import 구간에서만 무시
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message=".*Pydantic V1.*")
+        value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "EvaluatorAgent",
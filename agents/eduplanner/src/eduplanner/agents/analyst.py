@@ -7,10 +7,16 @@ Analyst Agent: 교수설계 분석 에이전트
 - 일관성 검사
 """
 
+import asyncio
+import bisect
+import re
 from typing import Optional
+
+import orjson
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from eduplanner.agents.base import BaseAgent, AgentConfig
+from eduplanner.agents.cache import cache_fingerprint, get_response_cache
 from eduplanner.models.schemas import (
     ADDIEOutput,
     Analysis,
@@ -18,11 +24,17 @@ from eduplanner.models.schemas import (
     Development,
     Implementation,
     Evaluation,
+    Material,
     ScenarioInput,
 )
 from eduplanner.models.skill_tree import LearnerProfile
 
 
+# 응답 파싱용 JSON 펜스 표시와 품질 수준 정규식 (모듈 로드 시 한 번만 컴파일)
+_JSON_FENCE = "```json"
+_QUALITY_RE = re.compile(r"(상|중|하)")
+
+
 ANALYST_SYSTEM_PROMPT = """당신은 12년 경력의 교수설계 분석 전문가입니다.
 
 ## 역할
@@ -62,6 +74,29 @@ ANALYST_SYSTEM_PROMPT = """당신은 12년 경력의 교수설계 분석 전문
 ```
 """
 
+# run_many 크기별 구간: 직렬화된 ADDIE 산출물 크기 상한(bytes)과 구간별 동시 실행 수
+# (큰 산출물이 작은 산출물의 배치를 붙잡지 않도록 구간마다 따로 실행)
+_SIZE_BIN_LIMITS = (4 * 1024, 16 * 1024)
+_SIZE_BIN_CONCURRENCY = (32, 16, 8)
+
+
+def _predict_size_bin(addie_output: ADDIEOutput) -> int:
+    """ADDIE 산출물 크기 구간 (0: 소, 1: 중, 2: 대)"""
+    return bisect.bisect_right(_SIZE_BIN_LIMITS, len(addie_output.model_dump_json()))
+
+
+def _format_fields(fields: tuple, line: str = "  - {}: {}") -> str:
+    """값이 있는 항목만 한 줄씩 출력하고, 빈 항목은 '미정의' 한 줄로 묶어 표시"""
+    lines = [line.format(label, value) for label, value in fields if value]
+    missing = [label for label, value in fields if not value]
+    if missing:
+        lines.append(line.format("미정의", ", ".join(missing)))
+    return "\n".join(lines)
+
+
+# 시스템 메시지는 내용이 고정이므로 모듈 로드 시 한 번만 생성하여 재사용 (공유 객체이므로 수정 금지)
+_SYSTEM_MSG = SystemMessage(content=ANALYST_SYSTEM_PROMPT)
+
 
 class AnalysisResult:
     """분석 결과"""
@@ -108,9 +143,10 @@ class AnalystAgent(BaseAgent):
     def __init__(self, config: Optional[AgentConfig] = None):
         if config is None:
             # Analyst는 균형잡힌 분석을 위해 temperature 0.7 사용
+            # 출력은 품질 + 피드백 3줄 JSON이므로 max_tokens는 여유분을 둔 512로 제한
             config = AgentConfig(
                 temperature=0.7,
-                max_tokens=4096,
+                max_tokens=512,
             )
         super().__init__(config)
 
@@ -139,213 +175,309 @@ class AnalystAgent(BaseAgent):
         Returns:
             AnalysisResult: 분석 결과
         """
-        # 프롬프트 구성
-        analysis_prompt = self._build_analysis_prompt(
-            addie_output, scenario_input, learner_profile
-        )
+        messages = self._build_messages(addie_output, scenario_input, learner_profile)
 
-        messages = [
-            SystemMessage(content=ANALYST_SYSTEM_PROMPT),
-            HumanMessage(content=analysis_prompt),
-        ]
+        # 캐시 조회 (유사한 산출물을 이미 분석했다면 LLM 호출 생략)
+        cached = self._cache_lookup(messages)
+        if cached is not None:
+            return cached
 
         # LLM 호출
-        response = self.llm.invoke(messages)
+        response_text = self._complete(messages)
 
         # 응답 파싱
-        result = self._parse_response(response.content)
+        result, parsed = self._parse_response(response_text)
+        if parsed:
+            # 텍스트 폴백 결과는 캐시하지 않음 (다음 호출에서 다시 시도)
+            self._cache_store(messages, result)
 
         return result
 
-    def _build_analysis_prompt(
+    async def arun(
         self,
         addie_output: ADDIEOutput,
         scenario_input: Optional[ScenarioInput] = None,
         learner_profile: Optional[LearnerProfile] = None,
-    ) -> str:
-        """분석 프롬프트 생성"""
-        prompt_parts = []
+    ) -> AnalysisResult:
+        """
+        교수설계 산출물을 비동기로 분석합니다. (run과 동일한 프롬프트, ainvoke 사용)
 
-        # 원본 시나리오
-        if scenario_input:
-            prompt_parts.append("## 원본 시나리오\n")
-            prompt_parts.append(f"**제목:** {scenario_input.title}")
-            prompt_parts.append(f"**대상:** {scenario_input.context.target_audience}")
-            prompt_parts.append(f"**시간:** {scenario_input.context.duration}")
-            prompt_parts.append(f"**환경:** {scenario_input.context.learning_environment}")
-            prompt_parts.append(f"**목표:** {', '.join(scenario_input.learning_goals)}\n")
+        Args:
+            addie_output: ADDIE 산출물
+            scenario_input: 원본 시나리오 입력
+            learner_profile: 학습자 프로필
 
-        # 학습자 프로필
-        if learner_profile:
-            prompt_parts.append(learner_profile.skill_tree.to_prompt_context())
+        Returns:
+            AnalysisResult: 분석 결과
+        """
+        messages = self._build_messages(addie_output, scenario_input, learner_profile)
 
-        # ADDIE 산출물
-        prompt_parts.append("## 분석 대상 교수설계 산출물\n")
-        prompt_parts.append(self._format_addie_output_detailed(addie_output))
+        cached = self._cache_lookup(messages)
+        if cached is not None:
+            return cached
 
-        prompt_parts.append("\n위 교수설계 산출물을 체계적으로 분석해주세요.")
+        # LLM 호출 (이벤트 루프를 막지 않음)
+        response_text = await self._acomplete(messages)
 
-        return "\n".join(prompt_parts)
+        result, parsed = self._parse_response(response_text)
+        if parsed:
+            self._cache_store(messages, result)
+        return result
 
-    def _format_addie_output_detailed(self, addie_output: ADDIEOutput) -> str:
-        """ADDIE 산출물 상세 포맷팅"""
-        sections = []
+    async def run_many(
+        self,
+        items: list[tuple[ADDIEOutput, Optional[ScenarioInput], Optional[LearnerProfile]]],
+    ) -> list[AnalysisResult]:
+        """
+        여러 교수설계 산출물을 동시에 분석합니다.
 
-        # Analysis Phase
-        self._format_analysis_phase(sections, addie_output.analysis)
+        Args:
+            items: (ADDIE 산출물, 시나리오 입력, 학습자 프로필) 튜플 목록
 
-        # Design Phase
-        self._format_design_phase(sections, addie_output.design)
+        Returns:
+            list[AnalysisResult]: 입력 순서와 같은 순서의 분석 결과
+        """
+        # 산출물 크기별로 나누어 구간마다 동시 실행 수를 제한
+        bins: list[list[int]] = [[] for _ in _SIZE_BIN_CONCURRENCY]
+        for index, item in enumerate(items):
+            bins[_predict_size_bin(item[0])].append(index)
+
+        results: list[Optional[AnalysisResult]] = [None] * len(items)
+
+        async def run_bin(indices: list[int], concurrency: int) -> None:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def run_one(index: int) -> None:
+                async with semaphore:
+                    results[index] = await self.arun(*items[index])
+
+            await asyncio.gather(*(run_one(index) for index in indices))
+
+        await asyncio.gather(*(
+            run_bin(indices, concurrency)
+            for indices, concurrency in zip(bins, _SIZE_BIN_CONCURRENCY)
+            if indices
+        ))
+        return results
+
+    def _cache_fingerprint(self) -> str:
+        """제공자/모델/temperature 캐시 지문"""
+        return cache_fingerprint(self.config.provider, self.config.model, self.config.temperature)
+
+    def _cache_lookup(self, messages: list) -> Optional[AnalysisResult]:
+        """캐시된 분석 결과 조회 (캐시 비활성 또는 미스 시 None)"""
+        cache = get_response_cache()
+        if cache is None:
+            return None
+        payload = cache.check(messages[-1].content, self._cache_fingerprint())
+        if payload is None:
+            return None
+        return AnalysisResult(**orjson.loads(payload))
+
+    def _cache_store(self, messages: list, result: AnalysisResult) -> None:
+        """분석 결과를 캐시에 저장"""
+        cache = get_response_cache()
+        if cache is not None:
+            cache.store(
+                messages[-1].content,
+                orjson.dumps(result.to_dict()).decode(),
+                self._cache_fingerprint(),
+            )
 
-        # Development Phase
-        self._format_development_phase(sections, addie_output.development)
+    def _build_messages(
+        self,
+        addie_output: ADDIEOutput,
+        scenario_input: Optional[ScenarioInput] = None,
+        learner_profile: Optional[LearnerProfile] = None,
+    ) -> list:
+        """시스템/사용자 메시지 구성"""
+        analysis_prompt = self._build_analysis_prompt(
+            addie_output, scenario_input, learner_profile
+        )
+        return [
+            _SYSTEM_MSG,
+            HumanMessage(content=analysis_prompt),
+        ]
 
-        # Implementation Phase
-        self._format_implementation_phase(sections, addie_output.implementation)
+    def _build_analysis_prompt(
+        self,
+        addie_output: ADDIEOutput,
+        scenario_input: Optional[ScenarioInput] = None,
+        learner_profile: Optional[LearnerProfile] = None,
+    ) -> str:
+        """분석 프롬프트 생성"""
+        # 원본 시나리오
+        scenario_part = ""
+        if scenario_input:
+            ctx = scenario_input.context
+            scenario_part = (
+                "## 원본 시나리오\n\n"
+                f"**제목:** {scenario_input.title}\n"
+                f"**대상:** {ctx.target_audience}\n"
+                f"**시간:** {ctx.duration}\n"
+                f"**환경:** {ctx.learning_environment}\n"
+                f"**목표:** {', '.join(scenario_input.learning_goals)}\n\n"
+            )
 
-        # Evaluation Phase
-        self._format_evaluation_phase(sections, addie_output.evaluation)
+        # 학습자 프로필
+        profile_part = f"{learner_profile.skill_tree.to_prompt_context()}\n" if learner_profile else ""
 
-        return "\n".join(sections)
+        # ADDIE 산출물
+        return (
+            f"{scenario_part}{profile_part}"
+            "## 분석 대상 교수설계 산출물\n\n"
+            f"{self._format_addie_output_detailed(addie_output)}\n"
+            "\n위 교수설계 산출물을 체계적으로 분석해주세요."
+        )
 
-    def _format_analysis_phase(self, sections: list, analysis: Analysis) -> None:
+    def _format_addie_output_detailed(self, addie_output: ADDIEOutput) -> str:
+        """ADDIE 산출물 상세 포맷팅 (단계별 블록 5개를 한 번에 결합)"""
+        return "\n".join((
+            self._format_analysis_phase(addie_output.analysis),
+            self._format_design_phase(addie_output.design),
+            self._format_development_phase(addie_output.development),
+            self._format_implementation_phase(addie_output.implementation),
+            self._format_evaluation_phase(addie_output.evaluation),
+        ))
+
+    def _format_analysis_phase(self, analysis: Analysis) -> str:
         """분석 단계 포맷팅"""
-        sections.append("### 1. 분석 (Analysis)")
-
-        # 학습자 분석
         la = analysis.learner_analysis
-        sections.append("**학습자 분석:**")
-        sections.append(f"  - 대상: {la.target_audience}")
-        sections.append(f"  - 특성: {', '.join(la.characteristics) or '미정의'}")
-        sections.append(f"  - 사전지식: {la.prior_knowledge or '미정의'}")
-        sections.append(f"  - 학습 선호: {', '.join(la.learning_preferences) or '미정의'}")
-        sections.append(f"  - 동기: {la.motivation or '미정의'}")
-        sections.append(f"  - 예상 어려움: {', '.join(la.challenges) or '미정의'}")
-
-        # 환경 분석
         ca = analysis.context_analysis
-        sections.append("\n**환경 분석:**")
-        sections.append(f"  - 환경: {ca.environment}")
-        sections.append(f"  - 시간: {ca.duration}")
-        sections.append(f"  - 제약: {', '.join(ca.constraints) or '미정의'}")
-        sections.append(f"  - 자원: {', '.join(ca.resources) or '미정의'}")
-        sections.append(f"  - 기술요구: {', '.join(ca.technical_requirements) or '미정의'}")
-
-        # 과제 분석
         ta = analysis.task_analysis
-        sections.append("\n**과제 분석:**")
-        sections.append(f"  - 주제: {', '.join(ta.main_topics) or '미정의'}")
-        sections.append(f"  - 세부: {', '.join(ta.subtopics) or '미정의'}")
-        sections.append(f"  - 선수학습: {', '.join(ta.prerequisites) or '미정의'}")
+        learner = _format_fields((
+            ("대상", la.target_audience),
+            ("특성", ", ".join(la.characteristics)),
+            ("사전지식", la.prior_knowledge),
+            ("학습 선호", ", ".join(la.learning_preferences)),
+            ("동기", la.motivation),
+            ("예상 어려움", ", ".join(la.challenges)),
+        ))
+        context = _format_fields((
+            ("환경", ca.environment),
+            ("시간", ca.duration),
+            ("제약", ", ".join(ca.constraints)),
+            ("자원", ", ".join(ca.resources)),
+            ("기술요구", ", ".join(ca.technical_requirements)),
+        ))
+        task = _format_fields((
+            ("주제", ", ".join(ta.main_topics)),
+            ("세부", ", ".join(ta.subtopics)),
+            ("선수학습", ", ".join(ta.prerequisites)),
+        ))
+        return (
+            "### 1. 분석 (Analysis)\n"
+            f"**학습자 분석:**\n{learner}\n"
+            f"\n**환경 분석:**\n{context}\n"
+            f"\n**과제 분석:**\n{task}"
+        )
 
-    def _format_design_phase(self, sections: list, design: Design) -> None:
+    def _format_design_phase(self, design: Design) -> str:
         """설계 단계 포맷팅"""
-        sections.append("\n### 2. 설계 (Design)")
-
-        # 학습 목표
-        sections.append("**학습 목표:**")
-        if design.learning_objectives:
-            for obj in design.learning_objectives:
-                sections.append(
-                    f"  - [{obj.id}] [{obj.level}] {obj.statement} "
-                    f"(동사: {obj.bloom_verb}, 측정가능: {obj.measurable})"
-                )
-        else:
-            sections.append("  - (목표 없음)")
-
-        # 평가 계획
+        objectives = "\n".join(
+            f"  - [{obj.id}] [{obj.level}] {obj.statement} "
+            f"(동사: {obj.bloom_verb}, 측정가능: {obj.measurable})"
+            for obj in design.learning_objectives
+        ) or "  - (목표 없음)"
         ap = design.assessment_plan
-        sections.append("\n**평가 계획:**")
-        sections.append(f"  - 진단평가: {', '.join(ap.diagnostic) or '미정의'}")
-        sections.append(f"  - 형성평가: {', '.join(ap.formative) or '미정의'}")
-        sections.append(f"  - 총괄평가: {', '.join(ap.summative) or '미정의'}")
-
-        # 교수 전략
+        assessment = _format_fields((
+            ("진단평가", ", ".join(ap.diagnostic)),
+            ("형성평가", ", ".join(ap.formative)),
+            ("총괄평가", ", ".join(ap.summative)),
+        ))
         ist = design.instructional_strategy
-        sections.append("\n**교수 전략:**")
-        sections.append(f"  - 모델: {ist.model}")
-        sections.append(f"  - 방법: {', '.join(ist.methods) or '미정의'}")
-        if ist.sequence:
-            sections.append("  - 교수사태:")
-            for event in ist.sequence:
-                sections.append(f"    * {event.event}: {event.activity}")
-
-    def _format_development_phase(self, sections: list, dev: Development) -> None:
+        strategy = _format_fields((
+            ("모델", ist.model),
+            ("방법", ", ".join(ist.methods)),
+        ))
+        events = "".join(f"\n    * {event.event}: {event.activity}" for event in ist.sequence)
+        sequence = f"\n  - 교수사태:{events}" if events else ""
+        return (
+            "\n### 2. 설계 (Design)\n"
+            f"**학습 목표:**\n{objectives}\n"
+            f"\n**평가 계획:**\n{assessment}\n"
+            f"\n**교수 전략:**\n{strategy}{sequence}"
+        )
+
+    def _format_development_phase(self, dev: Development) -> str:
         """개발 단계 포맷팅"""
-        sections.append("\n### 3. 개발 (Development)")
-
-        # 레슨 플랜
-        sections.append(f"**레슨 플랜:** 총 {dev.lesson_plan.total_duration}")
-        if dev.lesson_plan.modules:
-            for mod in dev.lesson_plan.modules:
-                sections.append(f"  - {mod.title} ({mod.duration})")
-                for obj in mod.objectives:
-                    sections.append(f"    목표: {obj}")
-                for act in mod.activities:
-                    sections.append(f"    활동: {act.time} - {act.activity}")
-        else:
-            sections.append("  - (모듈 없음)")
-
-        # 학습 자료
-        sections.append("\n**학습 자료:**")
-        if dev.materials:
-            for mat in dev.materials:
-                details = []
-                if mat.slides:
-                    details.append(f"슬라이드 {mat.slides}장")
-                if mat.duration:
-                    details.append(mat.duration)
-                if mat.pages:
-                    details.append(f"{mat.pages}페이지")
-                detail_str = f" ({', '.join(details)})" if details else ""
-                sections.append(f"  - [{mat.type}] {mat.title}{detail_str}")
-        else:
-            sections.append("  - (자료 없음)")
+        modules = "\n".join(
+            f"  - {mod.title} ({mod.duration})"
+            + "".join(f"\n    목표: {obj}" for obj in mod.objectives)
+            + "".join(f"\n    활동: {act.time} - {act.activity}" for act in mod.activities)
+            for mod in dev.lesson_plan.modules
+        ) or "  - (모듈 없음)"
+        materials = "\n".join(self._format_material(mat) for mat in dev.materials) or "  - (자료 없음)"
+        return (
+            "\n### 3. 개발 (Development)\n"
+            # 레슨 플랜
+            f"**레슨 플랜:** 총 {dev.lesson_plan.total_duration}\n{modules}\n"
+            # 학습 자료
+            f"\n**학습 자료:**\n{materials}"
+        )
+
+    @staticmethod
+    def _format_material(mat: Material) -> str:
+        """학습 자료 한 줄 포맷팅"""
+        details = [
+            detail
+            for detail in (
+                f"슬라이드 {mat.slides}장" if mat.slides else None,
+                mat.duration,
+                f"{mat.pages}페이지" if mat.pages else None,
+            )
+            if detail
+        ]
+        detail_str = f" ({', '.join(details)})" if details else ""
+        return f"  - [{mat.type}] {mat.title}{detail_str}"
 
-    def _format_implementation_phase(self, sections: list, impl: Implementation) -> None:
+    def _format_implementation_phase(self, impl: Implementation) -> str:
         """실행 단계 포맷팅"""
-        sections.append("\n### 4. 실행 (Implementation)")
-        sections.append(f"**전달 방식:** {impl.delivery_method}")
-        sections.append(f"**진행자 가이드:** {impl.facilitator_guide or '미정의'}")
-        sections.append(f"**학습자 가이드:** {impl.learner_guide or '미정의'}")
-        sections.append(f"**기술 요구사항:** {', '.join(impl.technical_requirements) or '미정의'}")
-        sections.append(f"**지원 계획:** {impl.support_plan or '미정의'}")
-
-    def _format_evaluation_phase(self, sections: list, eval_section: Evaluation) -> None:
+        fields = _format_fields((
+            ("전달 방식", impl.delivery_method),
+            ("진행자 가이드", impl.facilitator_guide),
+            ("학습자 가이드", impl.learner_guide),
+            ("기술 요구사항", ", ".join(impl.technical_requirements)),
+            ("지원 계획", impl.support_plan),
+        ), line="**{}:** {}")
+        return f"\n### 4. 실행 (Implementation)\n{fields}"
+
+    def _format_evaluation_phase(self, eval_section: Evaluation) -> str:
         """평가 단계 포맷팅"""
-        sections.append("\n### 5. 평가 (Evaluation)")
-
-        # 퀴즈 문항
-        sections.append(f"**퀴즈 문항:** {len(eval_section.quiz_items)}개")
-        for item in eval_section.quiz_items[:3]:  # 최대 3개만 표시
-            sections.append(f"  - [{item.type}] {item.question[:50]}...")
-
+        # 퀴즈 문항 (최대 3개만 표시)
+        quiz_lines = "".join(
+            f"\n  - [{item.type}] {item.question[:50]}..." for item in eval_section.quiz_items[:3]
+        )
         # 루브릭
         if eval_section.rubric:
-            sections.append(f"\n**루브릭 기준:** {', '.join(eval_section.rubric.criteria)}")
+            rubric = f"**루브릭 기준:** {', '.join(eval_section.rubric.criteria)}"
         else:
-            sections.append("\n**루브릭:** 미정의")
-
-        # 피드백 계획
-        sections.append(f"**피드백 계획:** {eval_section.feedback_plan or '미정의'}")
-
-    def _parse_response(self, response_text: str) -> AnalysisResult:
-        """LLM 응답을 AnalysisResult로 파싱 (JSON 형식)"""
-        import json
-        import re
+            rubric = "**루브릭:** 미정의"
+        return (
+            "\n### 5. 평가 (Evaluation)\n"
+            f"**퀴즈 문항:** {len(eval_section.quiz_items)}개{quiz_lines}\n"
+            f"\n{rubric}\n"
+            # 피드백 계획
+            f"**피드백 계획:** {eval_section.feedback_plan or '미정의'}"
+        )
 
+    def _parse_response(self, response_text: str) -> tuple[AnalysisResult, bool]:
+        """LLM 응답을 AnalysisResult로 파싱 (JSON 형식, 두 번째 값은 JSON 파싱 성공 여부)"""
         result = AnalysisResult()
 
-        # JSON 블록 추출
-        json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(1)
+        # JSON 블록 추출 (정규식 대신 펜스 위치만 탐색)
+        start = response_text.find(_JSON_FENCE)
+        if start != -1:
+            body_start = start + len(_JSON_FENCE)
+            end = response_text.find("```", body_start)
+            # 스트리밍 조기 종료 시 닫는 펜스가 없거나 일부만 수신될 수 있음
+            json_str = response_text[body_start:end if end != -1 else None].strip(" \t\r\n`")
         else:
             # ```json 없이 JSON만 있는 경우
             json_str = response_text.strip()
 
         try:
-            data = json.loads(json_str)
+            data = orjson.loads(json_str)
 
             # 품질 수준
             if "quality" in data:
@@ -361,64 +493,12 @@ class AnalystAgent(BaseAgent):
                         "priority": "High",
                     })
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # JSON 파싱 실패 시 기존 텍스트 파싱 시도
-            quality_match = re.search(r"(상|중|하)", response_text)
+            quality_match = _QUALITY_RE.search(response_text)
             if quality_match:
                 result.quality_level = quality_match.group(1)
             result.summary = response_text[:500]  # 처음 500자만
+            return result, False
 
-        return result
-
-    def _extract_errors(self, text: str) -> list[dict]:
-        """오류 목록 추출"""
-        import re
-        errors = []
-        pattern = r"[\d\.\-•]+\s*\[?([^\]]+)\]?\s*-\s*\[?([^\]]+)\]?\s*-\s*\[?(Critical|Major|Minor)\]?"
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            errors.append({
-                "description": match[0].strip(),
-                "location": match[1].strip(),
-                "severity": match[2].strip().capitalize(),
-            })
-        return errors
-
-    def _extract_missing(self, text: str) -> list[dict]:
-        """누락 요소 추출"""
-        import re
-        missing = []
-        pattern = r"[\d\.\-•]+\s*\[?([^\]-]+)\]?\s*-\s*\[?([^\]]+)\]?"
-        matches = re.findall(pattern, text)
-        for match in matches:
-            missing.append({
-                "element": match[0].strip(),
-                "reason": match[1].strip(),
-            })
-        return missing
-
-    def _extract_inconsistencies(self, text: str) -> list[dict]:
-        """불일치 사항 추출"""
-        import re
-        inconsistencies = []
-        pattern = r"[\d\.\-•]+\s*\[?([^\]-]+)\]?\s*-\s*\[?([^\]]+)\]?"
-        matches = re.findall(pattern, text)
-        for match in matches:
-            inconsistencies.append({
-                "description": match[0].strip(),
-                "related_elements": match[1].strip(),
-            })
-        return inconsistencies
-
-    def _extract_recommendations(self, text: str) -> list[dict]:
-        """권고사항 추출"""
-        import re
-        recommendations = []
-        pattern = r"[\d\.\-•]+\s*\[?([^\]-]+)\]?\s*-\s*\[?(High|Medium|Low)\]?"
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            recommendations.append({
-                "recommendation": match[0].strip(),
-                "priority": match[1].strip().capitalize(),
-            })
-        return recommendations
+        return result, True
@@ -2,25 +2,126 @@
 
 from abc import ABC, abstractmethod
 from typing import Any, Optional
+import asyncio
+import functools
 import os
 
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
+import httpx
 from pydantic import BaseModel
 
 
 # API 설정
 UPSTAGE_BASE_URL = "https://api.upstage.ai/v1/solar"
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+VLLM_DEFAULT_BASE_URL = "http://localhost:8000/v1"
 UPSTAGE_DEFAULT_MODEL = "solar-mini"
 
 
+@functools.cache
+def _shared_http_client() -> httpx.Client:
+    """OpenAI 호환 클라이언트가 공유하는 HTTP 연결 풀"""
+    return httpx.Client(limits=httpx.Limits(max_connections=100, max_keepalive_connections=20))
+
+
+@functools.lru_cache(maxsize=32)
+def _build_llm(provider: str, model: str, temperature: float, max_tokens: int):
+    """설정별 LLM 인스턴스 생성 (같은 설정이면 캐시된 인스턴스 반환)"""
+    # 제공자 SDK는 사용하는 쪽만 가져오도록 분기 안에서 import
+    if provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
+        return ChatAnthropic(
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            api_key=os.getenv("ANTHROPIC_API_KEY"),
+        )
+
+    # 나머지 제공자는 모두 OpenAI 호환 API
+    from langchain_openai import ChatOpenAI
+
+    if provider == "openrouter":
+        # OpenRouter API (OpenAI 호환)
+        return ChatOpenAI(
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            api_key=os.getenv("OPENROUTER_API_KEY"),
+            base_url=OPENROUTER_BASE_URL,
+            http_client=_shared_http_client(),
+        )
+    elif provider == "vllm":
+        # 자체 호스팅 vLLM 서버 (OpenAI 호환, 동시 요청은 서버의 연속 배칭으로 처리)
+        return ChatOpenAI(
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            api_key=os.getenv("VLLM_API_KEY", "EMPTY"),
+            base_url=os.getenv("VLLM_BASE_URL", VLLM_DEFAULT_BASE_URL),
+            http_client=_shared_http_client(),
+        )
+    elif provider == "upstage":
+        # Upstage API (OpenAI 호환)
+        return ChatOpenAI(
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            api_key=os.getenv("UPSTAGE_API_KEY"),
+            base_url=UPSTAGE_BASE_URL,
+            http_client=_shared_http_client(),
+        )
+    else:
+        # OpenAI
+        return ChatOpenAI(
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=_shared_http_client(),
+        )
+
+
+def _stream_enabled() -> bool:
+    return os.getenv("EDUPLANNER_STREAM", "0") == "1"
+
+
+class _JsonEndScanner:
+    """스트리밍 텍스트의 중괄호 깊이를 추적하여 첫 최상위 JSON 객체가 닫히는 지점 탐지"""
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escape = False
+
+    def feed(self, text: str) -> bool:
+        """청크를 소비하고, 첫 최상위 객체가 완성되면 True 반환"""
+        for ch in text:
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = self.started
+            elif ch == "{":
+                self.depth += 1
+                self.started = True
+            elif ch == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
+
+
 class AgentConfig(BaseModel):
     """에이전트 설정"""
     model: str = UPSTAGE_DEFAULT_MODEL
     temperature: float = 0.7
     max_tokens: int = 4096
-    provider: str = "upstage"  # "upstage", "openai", "anthropic", or "openrouter"
+    provider: str = "upstage"  # "upstage", "openai", "anthropic", "openrouter", or "vllm"
 
 
 class BaseAgent(ABC):
@@ -38,46 +139,52 @@ class BaseAgent(ABC):
         return self._llm
 
     def _create_llm(self):
-        """LLM 인스턴스 생성"""
-        if self.config.provider == "anthropic":
-            return ChatAnthropic(
-                model=self.config.model,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                api_key=os.getenv("ANTHROPIC_API_KEY"),
-            )
-        elif self.config.provider == "openrouter":
-            # OpenRouter API (OpenAI 호환)
-            return ChatOpenAI(
-                model=self.config.model,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                api_key=os.getenv("OPENROUTER_API_KEY"),
-                base_url=OPENROUTER_BASE_URL,
-            )
-        elif self.config.provider == "upstage":
-            # Upstage API (OpenAI 호환)
-            return ChatOpenAI(
-                model=self.config.model,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                api_key=os.getenv("UPSTAGE_API_KEY"),
-                base_url=UPSTAGE_BASE_URL,
-            )
-        else:
-            # OpenAI
-            return ChatOpenAI(
-                model=self.config.model,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                api_key=os.getenv("OPENAI_API_KEY"),
-            )
+        """LLM 인스턴스 생성 (동일 설정의 에이전트는 같은 클라이언트를 공유)"""
+        return _build_llm(
+            self.config.provider,
+            self.config.model,
+            self.config.temperature,
+            self.config.max_tokens,
+        )
+
+    def _complete(self, messages: list) -> str:
+        """LLM 응답 텍스트 반환 (EDUPLANNER_STREAM=1이면 스트리밍하다 JSON 객체가 닫히는 즉시 종료)"""
+        if not _stream_enabled():
+            return self.llm.invoke(messages).content
+        scanner = _JsonEndScanner()
+        parts = []
+        for chunk in self.llm.stream(messages):
+            parts.append(chunk.content)
+            if scanner.feed(chunk.content):
+                break
+        return "".join(parts)
+
+    async def _acomplete(self, messages: list) -> str:
+        """_complete의 비동기 버전"""
+        if not _stream_enabled():
+            return (await self.llm.ainvoke(messages)).content
+        scanner = _JsonEndScanner()
+        parts = []
+        stream = self.llm.astream(messages)
+        try:
+            async for chunk in stream:
+                parts.append(chunk.content)
+                if scanner.feed(chunk.content):
+                    break
+        finally:
+            # 가비지 컬렉션을 기다리지 않고 HTTP 스트림을 즉시 반환
+            await stream.aclose()
+        return "".join(parts)
 
     @abstractmethod
     def run(self, *args, **kwargs) -> Any:
         """에이전트 실행"""
         pass
 
+    async def arun(self, *args, **kwargs) -> Any:
+        """에이전트 비동기 실행 (기본: 동기 run을 워커 스레드에서 실행)"""
+        return await asyncio.to_thread(self.run, *args, **kwargs)
+
     @property
     @abstractmethod
     def name(self) -> str:
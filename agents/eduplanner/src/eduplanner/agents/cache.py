@@ -0,0 +1,203 @@
+"""
+에이전트 응답 캐시
+
+동일하거나 거의 같은 프롬프트에 대한 LLM 응답을 재사용합니다.
+- 1단계: 프롬프트+지문 SHA-256 정확 일치 조회 (임베딩 계산 없음)
+- 2단계(redis 백엔드만): RedisVL SemanticCache 임베딩 유사도 조회
+- 제공자/모델/temperature 지문별로 분리 저장 (설정이 다르면 충돌하지 않음)
+- 백엔드는 환경 변수로 선택 (memory: 프로세스 내 정확 일치만, redis: RedisVL SemanticCache)
+
+프롬프트 대부분이 공통 템플릿이라 문자 n-gram 같은 가벼운 벡터로는 입력이 다른
+요청도 임계값 안에 들어오므로, memory 백엔드는 시맨틱 계층을 두지 않습니다.
+
+평가 응답은 별도의 SQLite 정확 일치 캐시에 저장하여 재실행 시 재사용합니다.
+
+환경 변수:
+- EDUPLANNER_SEMANTIC_CACHE: 백엔드 (미설정 시 비활성, "memory" 또는 "redis")
+- EDUPLANNER_SEMANTIC_CACHE_THRESHOLD: redis 백엔드 코사인 거리 임계값 (기본값 0.1)
+- EDUPLANNER_CACHE_REDIS_URL: redis 백엔드 주소 (기본값 redis://localhost:6379)
+- EDUPLANNER_EVAL_CACHE: 평가 응답 캐시 정책 (disabled, enabled, read-only, replay)
+- EDUPLANNER_EVAL_CACHE_PATH: 평가 응답 캐시 파일 (기본값 ~/.cache/eduplanner/evaluator/responses.sqlite3)
+"""
+
+import functools
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+
+
+DEFAULT_DISTANCE_THRESHOLD = 0.1
+DEFAULT_REDIS_URL = "redis://localhost:6379"
+DEFAULT_EVAL_CACHE_PATH = Path.home() / ".cache" / "eduplanner" / "evaluator" / "responses.sqlite3"
+
+# 평가 응답 캐시 정책: (조회 여부, 저장 여부, 미스 시 오류 여부)
+EVAL_CACHE_POLICIES = {
+    "disabled": (False, False, False),
+    "enabled": (True, True, False),
+    "read-only": (True, False, False),
+    "replay": (True, False, True),  # CI용: 캐시에 없으면 LLM을 호출하지 않고 실패
+}
+
+_EXACT_MAX_ENTRIES = 1024
+
+
+def cache_fingerprint(provider: str, model: str, temperature: float) -> str:
+    """캐시 분리용 설정 지문"""
+    return f"{provider}:{model}:{temperature}"
+
+
+class RedisResponseCache:
+    """RedisVL SemanticCache 기반 응답 캐시 (지문별 인덱스 분리)"""
+
+    def __init__(self, redis_url: str, distance_threshold: float = DEFAULT_DISTANCE_THRESHOLD):
+        try:
+            from redisvl.extensions.llmcache import SemanticCache
+        except ImportError as e:
+            raise ImportError(
+                "EDUPLANNER_SEMANTIC_CACHE=redis 사용 시 redisvl 패키지가 필요합니다: pip install redisvl"
+            ) from e
+        self._semantic_cache_cls = SemanticCache
+        self.redis_url = redis_url
+        self.distance_threshold = distance_threshold
+        self._caches: dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _cache_for(self, fingerprint: str):
+        with self._lock:
+            cache = self._caches.get(fingerprint)
+            if cache is None:
+                digest = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:16]
+                cache = self._semantic_cache_cls(
+                    name=f"eduplanner-{digest}",
+                    redis_url=self.redis_url,
+                    distance_threshold=self.distance_threshold,
+                )
+                self._caches[fingerprint] = cache
+            return cache
+
+    def check(self, prompt: str, fingerprint: str) -> Optional[str]:
+        hits = self._cache_for(fingerprint).check(prompt=prompt, num_results=1)
+        return hits[0]["response"] if hits else None
+
+    def store(self, prompt: str, response: str, fingerprint: str) -> None:
+        self._cache_for(fingerprint).store(prompt=prompt, response=response)
+
+
+class TieredResponseCache:
+    """정확 일치(SHA-256) 계층을 시맨틱 백엔드 앞에 두는 2단계 캐시 (semantic=None이면 정확 일치만)"""
+
+    def __init__(self, semantic=None, max_entries: int = _EXACT_MAX_ENTRIES):
+        self.semantic = semantic
+        self.max_entries = max_entries
+        self._exact: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _exact_key(prompt: str, fingerprint: str) -> str:
+        return hashlib.sha256(f"{fingerprint}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, response: str) -> None:
+        with self._lock:
+            self._exact[key] = response
+            self._exact.move_to_end(key)
+            while len(self._exact) > self.max_entries:
+                self._exact.popitem(last=False)
+
+    def check(self, prompt: str, fingerprint: str) -> Optional[str]:
+        """정확 일치를 먼저 조회하고, 미스일 때만 시맨틱 조회"""
+        key = self._exact_key(prompt, fingerprint)
+        with self._lock:
+            response = self._exact.get(key)
+            if response is not None:
+                self._exact.move_to_end(key)
+                return response
+        if self.semantic is None:
+            return None
+        response = self.semantic.check(prompt, fingerprint)
+        if response is not None:
+            # 같은 프롬프트가 다시 오면 임베딩 없이 응답
+            self._remember(key, response)
+        return response
+
+    def store(self, prompt: str, response: str, fingerprint: str) -> None:
+        """두 계층 모두에 저장"""
+        self._remember(self._exact_key(prompt, fingerprint), response)
+        if self.semantic is not None:
+            self.semantic.store(prompt, response, fingerprint)
+
+
+@functools.cache
+def get_response_cache() -> Optional[TieredResponseCache]:
+    """환경 변수 설정에 따른 공유 캐시 인스턴스 (비활성 시 None)"""
+    backend = os.getenv("EDUPLANNER_SEMANTIC_CACHE", "").strip().lower()
+    if not backend:
+        return None
+    if backend == "memory":
+        return TieredResponseCache()
+    if backend != "redis":
+        raise ValueError(f"지원하지 않는 캐시 백엔드: {backend} (memory 또는 redis)")
+    threshold = float(os.getenv("EDUPLANNER_SEMANTIC_CACHE_THRESHOLD", DEFAULT_DISTANCE_THRESHOLD))
+    semantic = RedisResponseCache(
+        os.getenv("EDUPLANNER_CACHE_REDIS_URL", DEFAULT_REDIS_URL),
+        distance_threshold=threshold,
+    )
+    return TieredResponseCache(semantic)
+
+
+class SQLiteResponseCache:
+    """SQLite 기반 정확 일치 응답 캐시 (프로세스 간 공유, 재실행 시 재사용)"""
+
+    def __init__(self, path: Path, policy: str = "enabled"):
+        if policy not in EVAL_CACHE_POLICIES:
+            raise ValueError(
+                f"지원하지 않는 캐시 정책: {policy} ({', '.join(EVAL_CACHE_POLICIES)})"
+            )
+        self.path = Path(path)
+        self.policy = policy
+        self.readable, self.writable, self.strict = EVAL_CACHE_POLICIES[policy]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # 호출마다 연결을 열어 스레드/프로세스 간 공유 문제를 피함 (LLM 호출 대비 비용 무시 가능)
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def key(*parts) -> str:
+        """프롬프트와 모델 설정으로 캐시 키 생성"""
+        return hashlib.sha256("\0".join(map(str, parts)).encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> Optional[str]:
+        """저장된 응답 반환 (미스 시 None, replay 정책이면 오류)"""
+        if not self.readable:
+            return None
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            return row[0]
+        if self.strict:
+            raise LookupError(f"replay 캐시에 없는 평가 요청입니다 (key={key[:12]}..., {self.path})")
+        return None
+
+    def store(self, key: str, response: str) -> None:
+        """응답 저장 (쓰기 정책일 때만)"""
+        if not self.writable:
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.execute("INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)", (key, response))
+
+
+@functools.cache
+def get_evaluation_cache() -> Optional[SQLiteResponseCache]:
+    """EDUPLANNER_EVAL_CACHE 정책에 따른 평가 응답 캐시 (비활성 시 None)"""
+    policy = os.getenv("EDUPLANNER_EVAL_CACHE", "disabled").strip().lower() or "disabled"
+    if policy == "disabled":
+        return None
+    path = os.getenv("EDUPLANNER_EVAL_CACHE_PATH") or DEFAULT_EVAL_CACHE_PATH
+    return SQLiteResponseCache(Path(path).expanduser(), policy)
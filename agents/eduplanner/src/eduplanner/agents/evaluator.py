@@ -15,6 +15,7 @@ from typing import Optional
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from eduplanner.agents.base import BaseAgent, AgentConfig
+from eduplanner.agents.cache import get_evaluation_cache
 from eduplanner.models.schemas import ADDIEOutput, EvaluationFeedback
 from eduplanner.models.skill_tree import LearnerProfile
 
@@ -146,11 +147,30 @@ class EvaluatorAgent(BaseAgent):
             HumanMessage(content=evaluation_prompt),
         ]
 
-        # LLM 호출
-        response = self.llm.invoke(messages)
+        # 캐시 조회 후 미스일 때만 LLM 호출
+        cache = get_evaluation_cache()
+        cache_key = None
+        response_text = None
+        if cache is not None:
+            cache_key = cache.key(
+                EVALUATOR_SYSTEM_PROMPT,
+                evaluation_prompt,
+                self.config.provider,
+                self.config.model,
+                self.config.temperature,
+                self.config.max_tokens,
+            )
+            response_text = cache.lookup(cache_key)
+        cached = response_text is not None
+        if not cached:
+            response_text = self.llm.invoke(messages).content
 
         # 응답 파싱
-        feedback = self._parse_response(response.content)
+        feedback, json_parsed = self._parse_response(response_text)
+
+        # JSON으로 파싱된 응답만 저장 (정규식 폴백 응답은 재실행 시 다시 호출)
+        if cache is not None and not cached and json_parsed:
+            cache.store(cache_key, response_text)
 
         return feedback
 
@@ -267,8 +287,8 @@ class EvaluatorAgent(BaseAgent):
 
         return "\n".join(sections)
 
-    def _parse_response(self, response_text: str) -> EvaluationFeedback:
-        """LLM 응답을 EvaluationFeedback으로 파싱 (ADDIE Rubric 13항목)"""
+    def _parse_response(self, response_text: str) -> tuple[EvaluationFeedback, bool]:
+        """LLM 응답을 EvaluationFeedback으로 파싱 (ADDIE Rubric 13항목, 두 번째 값은 JSON 파싱 성공 여부)"""
         import json
         import re
 
@@ -346,7 +366,7 @@ class EvaluatorAgent(BaseAgent):
         raw_sum = sum(addie_scores.values())  # 최대 130점
         normalized_score = (raw_sum / 130.0) * 100.0
 
-        return EvaluationFeedback(
+        feedback = EvaluationFeedback(
             score=round(normalized_score, 1),
             strengths=strengths if strengths else ["평가 강점 정보 없음"],
             weaknesses=weaknesses if weaknesses else ["평가 약점 정보 없음"],
@@ -354,6 +374,7 @@ class EvaluatorAgent(BaseAgent):
             addie_scores=addie_scores,
             weighted_score=round(weighted_score, 1),
         )
+        return feedback, json_parsed
 
     def _calculate_weighted_score(self, addie_scores: dict) -> float:
         """ADDIE 단계별 가중치를 적용한 점수 계산"""
@@ -37,6 +37,7 @@ except ImportError:
     pass  # python-dotenv가 없으면 무시
 
 import typer
+from pydantic import ValidationError
 
 from eduplanner.agents import EduPlannerAgent
 from eduplanner.models.schemas import ScenarioInput
@@ -51,14 +52,16 @@ app = typer.Typer(
 def load_scenario(input_path: Path) -> ScenarioInput:
     """시나리오 JSON 파일 로드"""
     try:
-        with open(input_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return ScenarioInput(**data)
+        # JSON 파싱과 검증을 pydantic-core에서 한 번에 처리 (중간 dict 생성 생략)
+        return ScenarioInput.model_validate_json(input_path.read_bytes())
     except FileNotFoundError:
         typer.echo(f"오류: 입력 파일을 찾을 수 없습니다: {input_path}", err=True)
         raise typer.Exit(code=1)
-    except json.JSONDecodeError as e:
-        typer.echo(f"오류: JSON 파싱 실패: {e}", err=True)
+    except ValidationError as e:
+        if any(err["type"] == "json_invalid" for err in e.errors()):
+            typer.echo(f"오류: JSON 파싱 실패: {e}", err=True)
+        else:
+            typer.echo(f"오류: 시나리오 로드 실패: {e}", err=True)
         raise typer.Exit(code=1)
     except Exception as e:
         typer.echo(f"오류: 시나리오 로드 실패: {e}", err=True)
@@ -11,6 +11,7 @@ EduPlanner 논문의 Skill-Tree 구조를 교수설계 맥락으로 변환하여
 - 사전 지식 수준, 학습 선호도, 동기 수준, 자기주도성, 기술 활용 능력
 """
 
+import functools
 from typing import Optional
 from pydantic import BaseModel, Field
 
@@ -63,25 +64,51 @@ class SkillTree(BaseModel):
         return sum(levels) / len(levels)
 
     def to_prompt_context(self) -> str:
-        """프롬프트에 포함할 학습자 프로필 문자열 생성"""
-        return f"""## 학습자 역량 프로필 (Skill-Tree)
-
-1. **사전 지식 수준**: {self.prior_knowledge.level}/5
-   - {self.prior_knowledge.description}
-
-2. **학습 선호도**: {self.learning_preference.level}/5
-   - {self.learning_preference.description}
-
-3. **학습 동기**: {self.motivation.level}/5
-   - {self.motivation.description}
-
-4. **자기주도성**: {self.self_directedness.level}/5
-   - {self.self_directedness.description}
-
-5. **기술 활용 능력**: {self.tech_literacy.level}/5
-   - {self.tech_literacy.description}
-
-**종합 수준**: {self.average_level():.1f}/5
+        """프롬프트에 포함할 학습자 프로필 문자열 생성 (역량 값이 같으면 캐시된 문자열 재사용)"""
+        return _render_prompt_context(tuple(
+            (node.level, node.description)
+            for node in (
+                self.prior_knowledge,
+                self.learning_preference,
+                self.motivation,
+                self.self_directedness,
+                self.tech_literacy,
+            )
+        ))
+
+
+@functools.lru_cache(maxsize=128)
+def _render_prompt_context(nodes: tuple[tuple[int, str], ...]) -> str:
+    """(수준, 설명) 5개로 학습자 프로필 문자열 생성
+
+    SkillTree는 수정 가능한 모델이므로 객체 식별자가 아닌 출력에 쓰이는 값으로 캐시합니다.
+    """
+    (
+        (prior_level, prior_desc),
+        (preference_level, preference_desc),
+        (motivation_level, motivation_desc),
+        (self_directed_level, self_directed_desc),
+        (tech_level, tech_desc),
+    ) = nodes
+    average = sum(level for level, _ in nodes) / len(nodes)
+    return f"""## 학습자 역량 프로필 (Skill-Tree)
+
+1. **사전 지식 수준**: {prior_level}/5
+   - {prior_desc}
+
+2. **학습 선호도**: {preference_level}/5
+   - {preference_desc}
+
+3. **학습 동기**: {motivation_level}/5
+   - {motivation_desc}
+
+4. **자기주도성**: {self_directed_level}/5
+   - {self_directed_desc}
+
+5. **기술 활용 능력**: {tech_level}/5
+   - {tech_desc}
+
+**종합 수준**: {average:.1f}/5
 """
 
 
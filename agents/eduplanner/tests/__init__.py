@@ -0,0 +1,3 @@
+"""
+EduPlanner Tests
+"""
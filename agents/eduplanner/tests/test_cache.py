@@ -0,0 +1,254 @@
+"""
+응답 캐시 테스트
+
+평가 응답 SQLite 캐시 정책과 정확 일치 응답 캐시 테스트
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from eduplanner.agents import cache as response_cache
+from eduplanner.agents.cache import SQLiteResponseCache, TieredResponseCache
+
+JSON_REPLY = '{"addie_scores": {"A1": 8.5}, "strengths": ["목표 명확"]}'
+TEXT_REPLY = "전반적으로 무난한 설계입니다."
+
+
+class FakeLLM:
+    """호출 횟수를 기록하고 지정한 응답을 차례로 반환하는 LLM"""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return SimpleNamespace(content=self.replies[min(self.calls, len(self.replies)) - 1])
+
+
+@pytest.fixture
+def eval_cache_env(monkeypatch, tmp_path):
+    """평가 캐시 환경 변수 설정 (정책을 바꾼 뒤 캐시 인스턴스를 다시 만들도록 초기화)"""
+
+    def configure(policy: str):
+        monkeypatch.setenv("EDUPLANNER_EVAL_CACHE", policy)
+        monkeypatch.setenv("EDUPLANNER_EVAL_CACHE_PATH", str(tmp_path / "responses.sqlite3"))
+        response_cache.get_evaluation_cache.cache_clear()
+
+    yield configure
+    response_cache.get_evaluation_cache.cache_clear()
+
+
+def make_addie_output(target_audience: str = "신입사원"):
+    """평가 입력용 최소 ADDIE 산출물"""
+    from eduplanner.models.schemas import (
+        ADDIEOutput,
+        Analysis,
+        AssessmentPlan,
+        ContextAnalysis,
+        Design,
+        Development,
+        Evaluation,
+        Implementation,
+        InstructionalStrategy,
+        LearnerAnalysis,
+        LessonPlan,
+        TaskAnalysis,
+    )
+
+    return ADDIEOutput(
+        analysis=Analysis(
+            learner_analysis=LearnerAnalysis(target_audience=target_audience),
+            context_analysis=ContextAnalysis(environment="온라인", duration="2시간"),
+            task_analysis=TaskAnalysis(),
+        ),
+        design=Design(
+            learning_objectives=[],
+            assessment_plan=AssessmentPlan(),
+            instructional_strategy=InstructionalStrategy(),
+        ),
+        development=Development(lesson_plan=LessonPlan(total_duration="2시간")),
+        implementation=Implementation(delivery_method="온라인"),
+        evaluation=Evaluation(),
+    )
+
+
+class TestSQLiteResponseCache:
+    """SQLiteResponseCache 정책 테스트"""
+
+    def test_enabled_reads_and_writes(self, tmp_path):
+        """enabled 정책 저장 후 조회 테스트"""
+        cache = SQLiteResponseCache(tmp_path / "c.sqlite3", "enabled")
+
+        assert cache.lookup("k") is None
+        cache.store("k", "응답")
+
+        assert cache.lookup("k") == "응답"
+        assert SQLiteResponseCache(tmp_path / "c.sqlite3", "enabled").lookup("k") == "응답"
+
+    def test_disabled_ignores_file(self, tmp_path):
+        """disabled 정책의 조회/저장 무시 테스트"""
+        SQLiteResponseCache(tmp_path / "c.sqlite3", "enabled").store("k", "응답")
+        cache = SQLiteResponseCache(tmp_path / "c.sqlite3", "disabled")
+        cache.store("other", "응답")
+
+        assert cache.lookup("k") is None
+        assert SQLiteResponseCache(tmp_path / "c.sqlite3", "enabled").lookup("other") is None
+
+    def test_read_only_never_writes(self, tmp_path):
+        """read-only 정책은 기존 항목만 조회하고 저장하지 않는지 테스트"""
+        SQLiteResponseCache(tmp_path / "c.sqlite3", "enabled").store("k", "응답")
+        cache = SQLiteResponseCache(tmp_path / "c.sqlite3", "read-only")
+        cache.store("new", "응답")
+
+        assert cache.lookup("k") == "응답"
+        assert cache.lookup("new") is None
+
+    def test_replay_miss_raises(self, tmp_path):
+        """replay 정책 미스 시 LookupError 테스트"""
+        SQLiteResponseCache(tmp_path / "c.sqlite3", "enabled").store("k", "응답")
+        cache = SQLiteResponseCache(tmp_path / "c.sqlite3", "replay")
+        cache.store("new", "응답")
+
+        assert cache.lookup("k") == "응답"
+        with pytest.raises(LookupError):
+            cache.lookup("new")
+
+    def test_unknown_policy_rejected(self, tmp_path):
+        """지원하지 않는 정책 거부 테스트"""
+        with pytest.raises(ValueError):
+            SQLiteResponseCache(tmp_path / "c.sqlite3", "write-only")
+
+    def test_key_separates_model_settings(self):
+        """제공자/모델/temperature/max_tokens별 키 분리 테스트"""
+        base = ("system", "prompt", "upstage", "solar-mini", 0.7, 4096)
+        variants = [
+            ("system", "prompt", "openrouter", "solar-mini", 0.7, 4096),
+            ("system", "prompt", "upstage", "solar-pro", 0.7, 4096),
+            ("system", "prompt", "upstage", "solar-mini", 0.0, 4096),
+            ("system", "prompt", "upstage", "solar-mini", 0.7, 2048),
+        ]
+
+        keys = {SQLiteResponseCache.key(*base)} | {SQLiteResponseCache.key(*v) for v in variants}
+
+        assert len(keys) == 5
+        assert SQLiteResponseCache.key(*base) == SQLiteResponseCache.key(*base)
+
+
+class TestEvaluatorCache:
+    """평가 에이전트 응답 캐시 테스트"""
+
+    def test_repeated_evaluation_served_from_cache(self, eval_cache_env):
+        """동일 입력 재평가 시 LLM 미호출 테스트"""
+        from eduplanner.agents.evaluator import EvaluatorAgent
+
+        eval_cache_env("enabled")
+        agent = EvaluatorAgent()
+        agent._llm = FakeLLM(JSON_REPLY)
+
+        first = agent.run(make_addie_output())
+        second = agent.run(make_addie_output())
+
+        assert agent._llm.calls == 1
+        assert first.score == second.score
+
+    def test_only_json_replies_stored(self, eval_cache_env):
+        """정규식 폴백으로 파싱된 응답은 저장하지 않는지 테스트"""
+        from eduplanner.agents.evaluator import EvaluatorAgent
+
+        eval_cache_env("enabled")
+        agent = EvaluatorAgent()
+        agent._llm = FakeLLM(TEXT_REPLY, JSON_REPLY)
+
+        agent.run(make_addie_output())
+        agent.run(make_addie_output())
+        agent.run(make_addie_output())
+
+        assert agent._llm.calls == 2
+
+    def test_model_settings_not_shared(self, eval_cache_env):
+        """설정이 다른 평가 에이전트 간 캐시 미공유 테스트"""
+        from eduplanner.agents.base import AgentConfig
+        from eduplanner.agents.evaluator import EvaluatorAgent
+
+        eval_cache_env("enabled")
+        first = EvaluatorAgent()
+        first._llm = FakeLLM(JSON_REPLY)
+        second = EvaluatorAgent(AgentConfig(temperature=0.0, max_tokens=4096))
+        second._llm = FakeLLM(JSON_REPLY)
+
+        first.run(make_addie_output())
+        second.run(make_addie_output())
+
+        assert (first._llm.calls, second._llm.calls) == (1, 1)
+
+    def test_replay_miss_skips_llm(self, eval_cache_env):
+        """replay 정책에서 저장된 요청만 재생하고 미스 시 LLM을 호출하지 않는지 테스트"""
+        from eduplanner.agents.evaluator import EvaluatorAgent
+
+        eval_cache_env("enabled")
+        recorder = EvaluatorAgent()
+        recorder._llm = FakeLLM(JSON_REPLY)
+        recorder.run(make_addie_output())
+
+        eval_cache_env("replay")
+        agent = EvaluatorAgent()
+        agent._llm = FakeLLM(JSON_REPLY)
+        agent.run(make_addie_output())
+        with pytest.raises(LookupError):
+            agent.run(make_addie_output(target_audience="관리자"))
+
+        assert agent._llm.calls == 0
+
+    def test_disabled_by_default(self, monkeypatch):
+        """환경 변수 미설정 시 평가 캐시 비활성 테스트"""
+        monkeypatch.delenv("EDUPLANNER_EVAL_CACHE", raising=False)
+        response_cache.get_evaluation_cache.cache_clear()
+        try:
+            assert response_cache.get_evaluation_cache() is None
+        finally:
+            response_cache.get_evaluation_cache.cache_clear()
+
+
+class TestTieredResponseCache:
+    """TieredResponseCache 정확 일치 계층 테스트"""
+
+    def test_exact_match_only(self):
+        """시맨틱 백엔드 없이 정확히 같은 프롬프트만 적중하는지 테스트"""
+        cache = TieredResponseCache()
+        cache.store("프롬프트", "응답", "upstage:solar-mini:0.7")
+
+        assert cache.check("프롬프트", "upstage:solar-mini:0.7") == "응답"
+        assert cache.check("프롬프트 ", "upstage:solar-mini:0.7") is None
+
+    def test_fingerprint_separates_settings(self):
+        """설정 지문이 다르면 같은 프롬프트도 미적중하는지 테스트"""
+        cache = TieredResponseCache()
+        cache.store("프롬프트", "응답", response_cache.cache_fingerprint("upstage", "solar-mini", 0.7))
+
+        assert cache.check("프롬프트", response_cache.cache_fingerprint("openrouter", "solar-mini", 0.7)) is None
+        assert cache.check("프롬프트", response_cache.cache_fingerprint("upstage", "solar-pro", 0.7)) is None
+        assert cache.check("프롬프트", response_cache.cache_fingerprint("upstage", "solar-mini", 0.0)) is None
+
+    def test_least_recently_used_evicted(self):
+        """최대 항목 수 초과 시 가장 오래 사용하지 않은 항목 제거 테스트"""
+        cache = TieredResponseCache(max_entries=2)
+        cache.store("a", "1", "fp")
+        cache.store("b", "2", "fp")
+        cache.check("a", "fp")
+        cache.store("c", "3", "fp")
+
+        assert cache.check("b", "fp") is None
+        assert cache.check("a", "fp") == "1"
+        assert cache.check("c", "fp") == "3"
+
+    def test_memory_backend_has_no_semantic_layer(self, monkeypatch):
+        """memory 백엔드가 정확 일치 계층만 사용하는지 테스트"""
+        monkeypatch.setenv("EDUPLANNER_SEMANTIC_CACHE", "memory")
+        response_cache.get_response_cache.cache_clear()
+        try:
+            cache = response_cache.get_response_cache()
+            assert isinstance(cache, TieredResponseCache)
+            assert cache.semantic is None
+        finally:
+            response_cache.get_response_cache.cache_clear()
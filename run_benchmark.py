@@ -511,7 +511,7 @@ def _get_agent_runner(agent_id: str):
             provider, model, api_key = _get_model_config()
             config = AgentConfig(model=model, provider=provider)
             agent = EduPlannerAgent(config=config, max_iterations=3, target_score=90.0)
-            scenario_input = ScenarioInput(**scenario)
+            scenario_input = ScenarioInput.model_validate(scenario)
             result = agent.run(scenario_input)
             return {
                 "addie_output": result.addie_output.to_standard_dict(),